@@ -0,0 +1,42 @@
+import numpy as np
+
+from problems.GKLS import GKLS
+from problems.grishagin import Grishagin
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+
+
+def is_solved(problem, solution) -> bool:
+    # оптимум найден, если лучшая точка в окрестности 0.01 от размера области вокруг известного оптимума
+    x = np.array(solution.best_trials[0].point.float_variables)
+    optimum = np.array(problem.known_optimum[0].point.float_variables)
+    size = np.array(problem.upper_bound_of_float_variables) - np.array(problem.lower_bound_of_float_variables)
+    return bool(np.all(np.abs(x - optimum) <= 0.01 * size))
+
+
+if __name__ == "__main__":
+    """
+    Сравнение постоянного параметра надежности и адаптивного (от 5 до 2.5)
+      на 100 функциях Гришагина и 100 функциях GKLS размерности 2
+    """
+    problem_sets = {
+        'Grishagin': lambda function_number: Grishagin(function_number),
+        'GKLS': lambda function_number: GKLS(dimension=2, functionNumber=function_number)
+    }
+    configurations = {
+        'r=2.5': dict(r=2.5),
+        'r=3.5': dict(r=3.5),
+        'r=5': dict(r=5.0),
+        'adaptive r 5 -> 2.5': dict(r=2.5, adaptive_r=True, adaptive_r_max=5.0)
+    }
+    for set_name, create_problem in problem_sets.items():
+        for name, configuration in configurations.items():
+            solved = 0
+            trials = 0
+            for function_number in range(1, 101):
+                problem = create_problem(function_number)
+                params = SolverParameters(eps=0.01, iters_limit=20000, **configuration)
+                solution = Solver(problem=problem, parameters=params).solve()
+                solved += is_solved(problem, solution)
+                trials += solution.number_of_global_trials
+            print(f"{set_name}, {name}: solved {solved}, trials {trials}")
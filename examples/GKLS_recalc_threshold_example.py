@@ -0,0 +1,28 @@
+from problems.GKLS import GKLS
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+
+if __name__ == "__main__":
+    """
+    Сравнение числа полных пересчетов характеристик при отложенном пересчете
+      на 20 функциях GKLS размерности 2
+    """
+
+    for threshold in [0, 0.05, 0.1, 0.25]:
+        trials = 0
+        recalcs = 0
+        for function_number in range(1, 21):
+            # создание объекта задачи
+            problem = GKLS(dimension=2, functionNumber=function_number)
+
+            # Формируем параметры решателя
+            params = SolverParameters(r=4.5, eps=0.01, iters_limit=5000, recalc_threshold=threshold)
+
+            # Создаем решатель и решаем задачу
+            solver = Solver(problem=problem, parameters=params)
+            solution = solver.solve()
+
+            trials += solution.number_of_global_trials
+            recalcs += solver.method.full_recalc_count
+
+        print(f"recalc_threshold={threshold}: trials {trials}, full recalculations {recalcs}")
@@ -0,0 +1,38 @@
+from sklearn.datasets import load_breast_cancer
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from examples.Machine_learning.SVC._2D.Problems import SVC_2d, SVC_2d_multi_fidelity
+from sklearn.utils import shuffle
+import numpy as np
+import time
+
+
+def load_breast_cancer_data():
+    dataset = load_breast_cancer()
+    x_raw, y_raw = dataset['data'], dataset['target']
+    inputs, outputs = shuffle(x_raw, y_raw ^ 1, random_state=42)
+    return inputs, outputs
+
+
+if __name__ == "__main__":
+    """
+    Сравнение поиска гиперпараметров SVC с полным вычислением критерия в каждой точке
+      и с предварительным вычислением на четверти выборки
+    """
+    x, y = load_breast_cancer_data()
+    regularization_value_bound = {'low': 1, 'up': 6}
+    kernel_coefficient_bound = {'low': -7, 'up': -3}
+    problems = {
+        'full': SVC_2d.SVC_2D(x, y, regularization_value_bound, kernel_coefficient_bound),
+        'multi-fidelity': SVC_2d_multi_fidelity.SVC_2D_MultiFidelity(x, y, regularization_value_bound,
+                                                                    kernel_coefficient_bound, fractions=[0.25])
+    }
+    for name, problem in problems.items():
+        method_params = SolverParameters(r=np.double(3.0), iters_limit=200, fidelity_margin=0.25)
+        solver = Solver(problem, parameters=method_params)
+        start = time.time()
+        solution = solver.solve()
+        print(f"{name}: time {time.time() - start:.1f} s, trials {solution.number_of_global_trials}, "
+              f"best {solution.best_trials[0].function_values[0].value:.4f}")
+        if name == 'multi-fidelity':
+            print(f"  trials stopped at each fidelity: {solver.method.fidelity_trials_count}")
@@ -0,0 +1,33 @@
+from sklearn.datasets import load_breast_cancer
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from examples.Machine_learning.SVC._2D.Problems import SVC_2d_pruning
+from sklearn.utils import shuffle
+import numpy as np
+import time
+
+
+def load_breast_cancer_data():
+    dataset = load_breast_cancer()
+    x_raw, y_raw = dataset['data'], dataset['target']
+    inputs, outputs = shuffle(x_raw, y_raw ^ 1, random_state=42)
+    return inputs, outputs
+
+
+if __name__ == "__main__":
+    """
+    Сравнение поиска гиперпараметров SVC с полной кросс-валидацией в каждой точке
+      и с остановкой бесперспективных точек по промежуточным значениям
+    """
+    x, y = load_breast_cancer_data()
+    regularization_value_bound = {'low': 1, 'up': 6}
+    kernel_coefficient_bound = {'low': -7, 'up': -3}
+    for pruner in ['none', 'median', 'bound']:
+        problem = SVC_2d_pruning.SVC_2D_Pruning(x, y, regularization_value_bound, kernel_coefficient_bound)
+        method_params = SolverParameters(r=np.double(3.0), iters_limit=200, pruner=pruner)
+        solver = Solver(problem, parameters=method_params)
+        start = time.time()
+        solution = solver.solve()
+        print(f"{pruner}: time {time.time() - start:.1f} s, trials {solution.number_of_global_trials}, "
+              f"folds {problem.number_of_folds_calculated}, "
+              f"best {solution.best_trials[0].function_values[0].value:.4f}")
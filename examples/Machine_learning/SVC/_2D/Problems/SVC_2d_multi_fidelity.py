@@ -0,0 +1,43 @@
+import numpy as np
+from iOpt.trial import Point
+from iOpt.trial import FunctionValue
+from sklearn.svm import SVC
+from sklearn.model_selection import cross_val_score
+from typing import Dict
+
+from examples.Machine_learning.SVC._2D.Problems.SVC_2d import SVC_2D
+
+
+class SVC_2D_MultiFidelity(SVC_2D):
+    """
+    Класс SVC_2D_MultiFidelity - задача SVC_2D, критерий которой можно вычислить с пониженной точностью:
+      кросс-валидацией на части обучающей выборки
+    """
+
+    def __init__(self, x_dataset: np.ndarray, y_dataset: np.ndarray,
+                 regularization_bound: Dict[str, float],
+                 kernel_coefficient_bound: Dict[str, float],
+                 fractions: list[float] = [0.25]):
+        """
+        Конструктор класса SVC_2D_MultiFidelity
+
+        :param fractions: доли обучающей выборки для уровней пониженной точности (по возрастанию)
+        """
+        super(SVC_2D_MultiFidelity, self).__init__(x_dataset, y_dataset, regularization_bound,
+                                                   kernel_coefficient_bound)
+        self.fractions = fractions
+        self.number_of_fidelities = len(fractions) + 1
+
+    def calculate_fidelity(self, point: Point, function_value: FunctionValue, fidelity: int) -> FunctionValue:
+        """
+        Метод расчёта значения целевой функции на части выборки
+
+        :param point: Точка испытания
+        :param function_value: объект хранения значения целевой функции в точке
+        :param fidelity: номер уровня точности
+        """
+        size = int(self.fractions[fidelity] * self.x.shape[0])
+        cs, gammas = point.float_variables[0], point.float_variables[1]
+        clf = SVC(C=10 ** cs, gamma=10 ** gammas)
+        function_value.value = -cross_val_score(clf, self.x[:size], self.y[:size], cv=3, scoring='f1').mean()
+        return function_value
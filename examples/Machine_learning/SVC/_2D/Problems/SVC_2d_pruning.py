@@ -0,0 +1,49 @@
+import numpy as np
+from iOpt.method.pruner import TrialPruned
+from iOpt.trial import Point
+from iOpt.trial import FunctionValue
+from sklearn.svm import SVC
+from sklearn.metrics import f1_score
+from sklearn.model_selection import StratifiedKFold
+from typing import Dict
+
+from examples.Machine_learning.SVC._2D.Problems.SVC_2d import SVC_2D
+
+
+class SVC_2D_Pruning(SVC_2D):
+    """
+    Класс SVC_2D_Pruning - задача SVC_2D, которая сообщает решателю среднее значение по вычисленным блокам
+      кросс-валидации и прекращает вычисление бесперспективной точки
+    """
+
+    def __init__(self, x_dataset: np.ndarray, y_dataset: np.ndarray,
+                 regularization_bound: Dict[str, float],
+                 kernel_coefficient_bound: Dict[str, float],
+                 n_splits: int = 5):
+        """
+        Конструктор класса SVC_2D_Pruning
+
+        :param n_splits: число блоков кросс-валидации
+        """
+        super(SVC_2D_Pruning, self).__init__(x_dataset, y_dataset, regularization_bound, kernel_coefficient_bound)
+        self.cv = StratifiedKFold(n_splits=n_splits)
+        self.number_of_folds_calculated = 0
+
+    def calculate(self, point: Point, function_value: FunctionValue) -> FunctionValue:
+        """
+        Метод расчёта значения целевой функции в точке по блокам кросс-валидации
+
+        :param point: Точка испытания
+        :param function_value: объект хранения значения целевой функции в точке
+        """
+        cs, gammas = point.float_variables[0], point.float_variables[1]
+        scores = []
+        for step, (train, test) in enumerate(self.cv.split(self.x, self.y)):
+            clf = SVC(C=10 ** cs, gamma=10 ** gammas).fit(self.x[train], self.y[train])
+            scores.append(f1_score(self.y[test], clf.predict(self.x[test])))
+            self.number_of_folds_calculated += 1
+            self.report(step, -np.mean(scores))
+            if self.should_prune():
+                raise TrialPruned()
+        function_value.value = -np.mean(scores)
+        return function_value
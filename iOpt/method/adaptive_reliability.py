@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+
+class AdaptiveReliability:
+    """
+    The AdaptiveReliability class changes the reliability parameter r during the search. The search starts
+      with r_max for exploration. Every period iterations r is multiplied by decay if the estimate of the optimum
+      has not improved and the estimates of the Holder constants are stable over the period. If an estimate
+      has grown by more than m_tolerance, the constants were underestimated and r is divided by decay.
+      r stays within [r_min, r_max]
+    """
+
+    def __init__(self,
+                 r_min: float,
+                 r_max: float,
+                 period: int,
+                 decay: float = 0.8,
+                 m_tolerance: float = 0.05
+                 ):
+        r"""
+        Constructor of the AdaptiveReliability class
+
+        :param r_min: the lowest value of r.
+        :param r_max: the initial and the highest value of r.
+        :param period: number of iterations between the changes of r.
+        :param decay: factor of the decrease of r.
+        :param m_tolerance: relative growth of an estimate of the Holder constant considered stable.
+        """
+        self.r_min = r_min
+        self.r_max = r_max
+        self.period = period
+        self.decay = decay
+        self.m_tolerance = m_tolerance
+        self.r = r_max
+        # состояние на начало текущего периода
+        self.period_start: int | None = None
+        self.best: tuple[int, float] | None = None
+        self.M: list[float] = []
+        self.history: list[tuple[int, float]] = []
+
+    def update(self, iterations_count: int, best: tuple[int, float] | None, M: list[float]) -> bool:
+        r"""
+        Account the state of the search after an iteration and change r at the end of a period
+
+        :param iterations_count: number of iterations performed.
+        :param best: index and value of the estimate of the optimum, None if there is none.
+        :param M: estimates of the Holder constants.
+        :return: True if r has changed.
+        """
+        if self.period_start is None:
+            self.start_period(iterations_count, best, M)
+            return False
+        if iterations_count - self.period_start < self.period:
+            return False
+
+        improved = best is not None and (self.best is None or best[0] > self.best[0] or best[1] < self.best[1])
+        stable = all(m <= (1 + self.m_tolerance) * m_old for m, m_old in zip(M, self.M))
+        r = self.r
+        if not stable:
+            self.r = min(self.r / self.decay, self.r_max)
+        elif not improved:
+            self.r = max(self.r * self.decay, self.r_min)
+        self.start_period(iterations_count, best, M)
+        if self.r == r:
+            return False
+        self.history.append((iterations_count, self.r))
+        return True
+
+    def start_period(self, iterations_count: int, best: tuple[int, float] | None, M: list[float]) -> None:
+        r"""
+        Save the state of the search at the start of a period
+
+        :param iterations_count: number of iterations performed.
+        :param best: index and value of the estimate of the optimum.
+        :param M: estimates of the Holder constants.
+        """
+        self.period_start = iterations_count
+        self.best = best
+        self.M = list(M)
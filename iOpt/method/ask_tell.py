@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import queue
+import secrets
+import socket
+import threading
+from multiprocessing.managers import BaseManager, EventProxy
+from time import monotonic
+
+from iOpt.method.icriterion_evaluate_method import ICriterionEvaluateMethod
+from iOpt.method.search_data import SearchDataItem
+from iOpt.problem import Problem
+from iOpt.solution import Solution
+from iOpt.solver_parametrs import SolverParameters
+
+
+class FirstIterationPointsRecorded(Exception):
+    """
+    The points of the first iteration are recorded, the iteration is interrupted before the trials
+    """
+    pass
+
+
+class FirstIterationCalculator:
+    """
+    Calculator of the first iteration in the ask/tell mode. Without the told points it records
+      the points of the first iteration and interrupts it; with the told points it copies their values,
+      so the same first iteration is repeated with the external results
+    """
+
+    def __init__(self, evaluate_method: ICriterionEvaluateMethod,
+                 told_points: dict[float, SearchDataItem] | None = None):
+        """
+        Constructor of the FirstIterationCalculator class
+
+        :param evaluate_method: method copying the results of the trials.
+        :param told_points: calculated points by their coordinate x, None - record the points.
+        """
+        self.evaluate_method = evaluate_method
+        self.told_points = told_points
+        self.points: list[SearchDataItem] = []
+
+    def calculate_functionals_for_items(self, points: list[SearchDataItem]) -> list[SearchDataItem]:
+        if self.told_points is None:
+            self.points = points
+            raise FirstIterationPointsRecorded()
+        for point in points:
+            self.evaluate_method.copy_functionals(point, self.told_points[point.get_x()])
+        return points
+
+
+class AskTellManager(BaseManager):
+    """
+    Manager of the ask/tell server; the workers connect to it with the address and the key of the server
+    """
+    pass
+
+
+AskTellManager.register('get_task_queue')
+AskTellManager.register('get_result_queue')
+AskTellManager.register('get_stop_event', proxytype=EventProxy)
+
+
+class AskTellServer:
+    """
+    The AskTellServer class gives the points of the solver to remote workers over TCP.
+      The server runs in a thread of the solver process; the workers (see run_ask_tell_worker) take
+      the points from the task queue, calculate them and put them into the result queue.
+      The messages are pickled, so anyone who knows the key can run code in the solver process:
+      the key should be kept secret and the server should not be reachable from untrusted networks.
+      The local workers should be started with the 'spawn' method: the forked ones inherit the listening socket
+      and wait for it to accept their last requests after the server is stopped
+    """
+
+    def __init__(self,
+                 solver,
+                 address: tuple[str, int] = ('127.0.0.1', 0),
+                 authkey: bytes | None = None,
+                 poll_interval: float = 0.1
+                 ):
+        """
+        Constructor of the AskTellServer class
+
+        :param solver: the solver (or its process) whose points are calculated by the workers.
+        :param address: host and port of the server, port 0 - any free port.
+        :param authkey: key the workers authenticate with, None - a random key, see the authkey attribute.
+        :param poll_interval: pause in seconds between checks of the stop condition while waiting for results.
+        """
+        self.solver = solver
+        self.authkey = secrets.token_bytes(32) if authkey is None else authkey
+        self.poll_interval = poll_interval
+        self.task_queue: queue.Queue = queue.Queue()
+        self.result_queue: queue.Queue = queue.Queue()
+        self.stop_event = threading.Event()
+        self.in_flight = 0
+
+        manager_class = type('AskTellServerManager', (AskTellManager,), {})
+        manager_class.register('get_task_queue', callable=lambda: self.task_queue)
+        manager_class.register('get_result_queue', callable=lambda: self.result_queue)
+        manager_class.register('get_stop_event', callable=lambda: self.stop_event, proxytype=EventProxy)
+        self.manager = manager_class(address=address, authkey=self.authkey)
+        self.server = self.manager.get_server()
+        # обслуживание соединений идет, пока не установлено событие сервера, оно создается в serve_forever,
+        # который не используется: он не закрывает слушающий сокет и завершается через sys.exit
+        self.server.stop_event = threading.Event()
+        self.address = self.server.address
+        self.closing = False
+        self.thread = threading.Thread(target=self.accept_workers, daemon=True)
+
+    def start(self) -> None:
+        """
+        Start accepting the workers
+        """
+        self.thread.start()
+
+    def accept_workers(self) -> None:
+        """
+        Accept the connections of the workers until the server is stopped, each connection is served in a thread
+        """
+        listener = self.server.listener
+        while True:
+            try:
+                connection = listener.accept()
+            except OSError:
+                if self.closing:
+                    break
+                continue
+            if self.closing:
+                connection.close()
+                break
+            threading.Thread(target=self.serve_worker, args=(connection,), daemon=True).start()
+
+    def serve_worker(self, connection) -> None:
+        """
+        Serve the requests of a connected worker until it disconnects
+
+        :param connection: connection of the worker.
+        """
+        try:
+            self.server.handle_request(connection)
+        except SystemExit:
+            # сервер менеджера завершает обслуживание отключившегося клиента через sys.exit
+            pass
+
+    def stop(self) -> None:
+        """
+        Notify the workers that the search is finished, stop accepting new connections and close the listener.
+          The connected workers are served until they disconnect
+        """
+        self.stop_event.set()
+        if self.thread.is_alive():
+            self.closing = True
+            # пустое соединение пробуждает ожидающий accept
+            host, port = self.address[:2]
+            host = {'': '127.0.0.1', '0.0.0.0': '127.0.0.1', '::': '::1'}.get(host, host)
+            try:
+                with socket.create_connection((host, port), timeout=self.poll_interval + 1):
+                    pass
+            except OSError:
+                pass
+            self.thread.join(self.poll_interval + 1)
+        self.server.listener.close()
+
+    def solve(self) -> Solution:
+        """
+        Solve the problem with the remote workers, number_of_parallel_points points are kept in the task queue.
+          The search is stopped according to the stop condition of the solver
+
+        :return: the solution of the optimization problem.
+        """
+        process = getattr(self.solver, 'process', self.solver)
+        if not self.thread.is_alive():
+            self.start()
+        process.start_deadline()
+        start_time = monotonic()
+
+        while not process.method.check_stop_condition():
+            number = process.parameters.number_of_parallel_points - self.in_flight
+            for point in process.ask(number) if number > 0 else []:
+                self.task_queue.put(point)
+                self.in_flight += 1
+            try:
+                points = [self.result_queue.get(timeout=self.poll_interval)]
+            except queue.Empty:
+                continue
+            while not self.result_queue.empty():
+                points.append(self.result_queue.get_nowait())
+            self.in_flight -= len(points)
+            process.tell(points)
+
+        self.stop()
+        process.cancel_asked_points()
+        result = process.get_results()
+        result.solving_time += monotonic() - start_time
+        return result
+
+
+def run_ask_tell_worker(problem: Problem,
+                        address: tuple[str, int],
+                        authkey: bytes,
+                        parameters: SolverParameters = SolverParameters(),
+                        poll_interval: float = 0.1) -> int:
+    """
+    Calculate the points given by an ask/tell server until the search is finished
+
+    :param problem: the problem to calculate, the same as in the solver.
+    :param address: host and port of the server.
+    :param authkey: key of the server, see AskTellServer.authkey.
+    :param parameters: parameters of the solver, used to create the task of the problem.
+    :param poll_interval: time in seconds to wait for a point before checking that the search goes on.
+    :return: number of the calculated points.
+    """
+    from iOpt.method.solverFactory import SolverFactory
+    evaluate_method = SolverFactory.create_evaluate_method(SolverFactory.create_task(problem, parameters))
+
+    manager = AskTellManager(address=address, authkey=authkey)
+    manager.connect()
+    task_queue = manager.get_task_queue()
+    result_queue = manager.get_result_queue()
+    stop_event = manager.get_stop_event()
+
+    count = 0
+    try:
+        while not stop_event.is_set():
+            try:
+                point = task_queue.get(timeout=poll_interval)
+            except queue.Empty:
+                continue
+            result_queue.put(evaluate_method.calculate_functionals(point))
+            count += 1
+    except (EOFError, ConnectionError):
+        # сервер остановлен
+        pass
+    return count
@@ -1,26 +1,58 @@
+import queue
+from collections import deque
+from time import monotonic, process_time
+
 import multiprocess as mp
+from multiprocess.connection import wait
 
+from iOpt.method.concurrency_controller import ConcurrencyController
 from iOpt.method.icriterion_evaluate_method import ICriterionEvaluateMethod
 from iOpt.method.search_data import SearchDataItem
 from iOpt.solver_parametrs import SolverParameters
 
 
 class Worker(mp.Process):
+    """
+    The worker takes the points from the common task queue and sends the results to its own pipe.
+      The calculating flag is set only while a point is calculated, the worker is terminated
+      only then, so it never holds the lock of the queue or a half-written result
+    """
+
     def __init__(
         self,
         evaluate_method: ICriterionEvaluateMethod,
         task_queue: mp.Queue,
-        done_queue: mp.Queue,
     ):
         super(Worker, self).__init__()
         self.evaluate_method = evaluate_method
         self.task_queue = task_queue
-        self.done_queue = done_queue
+        self.result_connection, self.result_sender = mp.Pipe(duplex=False)
+        self.calculating = mp.Value('b', 0)
 
     def run(self):
+        self.result_connection.close()
         for point in iter(self.task_queue.get, "STOP"):
+            with self.calculating.get_lock():
+                self.calculating.value = 1
+            start = process_time()
             point = self.evaluate_method.calculate_functionals(point)
-            self.done_queue.put_nowait(point)
+            point.evaluation_time = process_time() - start
+            with self.calculating.get_lock():
+                self.calculating.value = 0
+            self.result_sender.send(point)
+
+    def terminate_if_calculating(self) -> bool:
+        """
+        Terminate the worker if it calculates a point
+
+        :return: True if the worker is terminated.
+        """
+        with self.calculating.get_lock():
+            if not self.calculating.value:
+                return False
+            self.terminate()
+            self.join()
+        return True
 
 
 class AsyncCalculator:
@@ -29,54 +61,148 @@ class AsyncCalculator:
     ):
         self.evaluate_method = evaluate_method
         self.task_queue = mp.Queue()
-        self.done_queue = mp.Queue()
         self.workers = [
-            Worker(evaluate_method, self.task_queue, self.done_queue)
+            Worker(evaluate_method, self.task_queue)
             for _ in range(parameters.number_of_parallel_points)
         ]
+        # результаты, полученные из каналов исполнителей и еще не обработанные
+        self.received_points: deque[SearchDataItem] = deque()
+        self.result_connections = [w.result_connection for w in self.workers]
+        # число испытаний, отмененных при остановке
+        self.number_of_cancelled_points = 0
+        self.poll_interval = 0.01
         self.waiting_workers = parameters.number_of_parallel_points
         self.waiting_oldpoints: dict[float, SearchDataItem] = dict()
+        # момент времени (time.monotonic), после которого ожидание результатов прекращается
+        self.deadline: float | None = None
+        self.stop_policy = parameters.async_stop_policy
+        self.stop_timeout = parameters.async_stop_timeout
+        # время выдачи точек, по нему измеряется задержка вычисления
+        self.give_times: dict[float, float] = dict()
+        self.controller: ConcurrencyController | None = None
+        if parameters.async_adaptive_concurrency:
+            self.controller = ConcurrencyController(parameters.async_min_parallel_points,
+                                                    parameters.number_of_parallel_points)
+        self._last_take_time: float | None = None
+
+    def _time_left(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return max(self.deadline - monotonic(), 0)
 
     def start(self) -> None:
         for w in self.workers:
             w.start()
+            # без копии процесса-координатора канал закрывается с завершением исполнителя
+            w.result_sender.close()
+
+    def _receive_points(self, timeout: float | None = 0) -> None:
+        """
+        Receive the results sent by the workers
+
+        :param timeout: time to wait for a result in seconds, None - wait without limit.
+        """
+        for connection in wait(self.result_connections, timeout):
+            try:
+                while connection.poll():
+                    self.received_points.append(connection.recv())
+            except EOFError:
+                # исполнитель завершен
+                self.result_connections.remove(connection)
+
+    def _get_point(self, block: bool, timeout: float | None = None) -> SearchDataItem:
+        if not self.received_points:
+            self._receive_points(timeout if block else 0)
+        if not self.received_points:
+            raise queue.Empty
+        return self.received_points.popleft()
+
+    def _has_point(self) -> bool:
+        if not self.received_points:
+            self._receive_points()
+        return bool(self.received_points)
 
     def give_point(self, newpoint: SearchDataItem, oldpoint: SearchDataItem) -> None:
         self.task_queue.put_nowait(newpoint)
         self.waiting_oldpoints[newpoint.get_x()] = oldpoint
+        self.give_times[newpoint.get_x()] = monotonic()
         oldpoint.blocked = True
 
     def _take_calculated_point(
-        self, block: bool
+        self, block: bool, timeout: float | None = None
     ) -> tuple[SearchDataItem, SearchDataItem]:
-        newpoint = self.done_queue.get(block=block)
+        newpoint = self._get_point(block=block, timeout=timeout)
         self.evaluate_method.copy_functionals(newpoint, newpoint)
         oldpoint = self.waiting_oldpoints.pop(newpoint.get_x())
         oldpoint.blocked = False
+        give_time = self.give_times.pop(newpoint.get_x())
+        if self.controller is not None:
+            self.controller.trial_completed(monotonic() - give_time)
         return newpoint, oldpoint
 
     def take_list_of_calculated_points(
         self
     ) -> list[tuple[SearchDataItem, SearchDataItem]]:
         list_points = []
-        points = self._take_calculated_point(block=True)
+        if self.controller is not None and self._last_take_time is not None:
+            self.controller.add_coordinator_time(monotonic() - self._last_take_time)
+        try:
+            points = self._take_calculated_point(block=True, timeout=self._time_left())
+        except queue.Empty:
+            # срок истек, новые точки не выдаются
+            self.waiting_workers = 0
+            return list_points
         list_points.append(points)
         self.waiting_workers = 1
-        while not self.done_queue.empty():
+        while self._has_point():
             points = self._take_calculated_point(block=False)
             list_points.append(points)
             self.waiting_workers += 1
+        if self.controller is not None:
+            # число выдаваемых точек доводит число вычисляемых до цели регулятора
+            self.waiting_workers = max(self.controller.target - len(self.waiting_oldpoints), 0)
+            self._last_take_time = monotonic()
         return list_points
 
+    def _stop_time_left(self) -> float | None:
+        if self.stop_policy == "terminate":
+            return 0
+        time_left = self._time_left()
+        if self.stop_policy == "drain_timeout":
+            time_left = self.stop_timeout if time_left is None else min(time_left, self.stop_timeout)
+        return time_left
+
     def stop(self) -> list[tuple[SearchDataItem, SearchDataItem]]:
+        """
+        Stop the workers according to the stop policy: wait for the running trials,
+          wait for them at most the given time or terminate the workers at once.
+          The number of the cancelled trials is saved in number_of_cancelled_points
+
+        :return: list of pairs (new point, old point) calculated before the workers stopped.
+        """
         for _ in range(len(self.workers)):
             self.task_queue.put_nowait("STOP")
+        time_left = self._stop_time_left()
+        stop_time = None if time_left is None else monotonic() + time_left
         for w in self.workers:
-            w.join()
+            w.join(None if stop_time is None else max(stop_time - monotonic(), 0))
+        # после истечения срока незавершенные испытания прерываются, исполнитель между испытаниями
+        # работает с очередью и каналом, поэтому его завершения дожидаемся
+        alive_workers = [w for w in self.workers if w.is_alive()]
+        while alive_workers:
+            for w in alive_workers:
+                if not w.terminate_if_calculating():
+                    w.join(self.poll_interval)
+            alive_workers = [w for w in alive_workers if w.is_alive()]
         list_points = []
-        while not self.done_queue.empty():
+        while self._has_point():
             points = self._take_calculated_point(block=False)
             list_points.append(points)
+        self.number_of_cancelled_points = len(self.waiting_oldpoints)
+        for oldpoint in self.waiting_oldpoints.values():
+            oldpoint.blocked = False
+        self.waiting_oldpoints.clear()
+        self.give_times.clear()
         return list_points
 
     def calculate_functionals_for_items(
@@ -86,7 +212,7 @@ class AsyncCalculator:
             self.task_queue.put_nowait(point)
         points_res = []
         for _ in range(len(points)):
-            points_res.append(self.done_queue.get())
+            points_res.append(self._get_point(block=True))
         points_res.sort(key=lambda p: p.get_x())
         for point, point_r in zip(points, points_res):
             self.evaluate_method.copy_functionals(point, point_r)
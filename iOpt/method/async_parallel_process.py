@@ -10,7 +10,7 @@ from iOpt.method.process import Process
 from iOpt.method.search_data import SearchData
 from iOpt.solution import Solution
 from iOpt.solver_parametrs import SolverParameters
-from iOpt.method.calculator import Calculator
+from iOpt.method.calculator import Calculator, DeadlineExceeded
 
 
 class AsyncParallelProcess(Process):
@@ -48,10 +48,7 @@ class AsyncParallelProcess(Process):
             for newpoint, oldpoint in self.calculator.take_list_of_calculated_points():
                 self.method.update_optimum(newpoint)
                 self.method.renew_search_data(newpoint, oldpoint)
-
-            done_trials.extend(
-                self.search_data.get_last_items(self.calculator.waiting_workers)
-            )
+                done_trials.append(newpoint)
 
         for listener in self._listeners:
             listener.on_end_iteration(done_trials, self.get_results())
@@ -63,12 +60,17 @@ class AsyncParallelProcess(Process):
 
         :return: Текущая оценка решения задачи оптимизации
         """
+        self.resume_from_checkpoint()
+        self.start_deadline()
         self.calculator.start()
 
         start_time = datetime.now()
         try:
             while not self.method.check_stop_condition():
                 self.do_global_iteration()
+                self.checkpointer.checkpoint(self)
+        except DeadlineExceeded:
+            pass
         except Exception:
             print("Exception was thrown")
             print(traceback.format_exc())
@@ -76,6 +78,13 @@ class AsyncParallelProcess(Process):
         for newpoint, oldpoint in self.calculator.stop():
             self.method.update_optimum(newpoint)
             self.method.renew_search_data(newpoint, oldpoint)
+        # отмененные испытания были учтены при выдаче точек
+        cancelled = self.calculator.number_of_cancelled_points
+        if cancelled:
+            self.method.iterations_count -= cancelled
+            self.search_data.solution.number_of_global_trials -= cancelled
+            self.method.recalcR = True
+        self.checkpointer.checkpoint(self, force=True)
 
         if self.parameters.refine_solution:
             self.do_local_refinement(self.parameters.local_method_iteration_count)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import copy
+from time import monotonic, process_time
+
+from multiprocess.context import TimeoutError
+from multiprocess.pool import AsyncResult
 from pathos.multiprocessing import ProcessPool
 
 from iOpt.method.default_calculator import DefaultCalculator
@@ -14,6 +18,13 @@ import sys
 sys.setrecursionlimit(10000)
 
 
+class DeadlineExceeded(Exception):
+    """
+    The trials were cancelled because the time limit of the search has expired
+    """
+    pass
+
+
 class Calculator(DefaultCalculator):
     evaluate_method: ICriterionEvaluateMethod = None
 
@@ -29,6 +40,8 @@ class Calculator(DefaultCalculator):
         """
         self.evaluate_method = evaluate_method
         self.parameters = parameters
+        # момент времени (time.monotonic), после которого незавершенные испытания прерываются
+        self.deadline: float | None = None
         Calculator.worker_init(self.evaluate_method)
         self.pool = ProcessPool(parameters.number_of_parallel_points,
                                 initializer=Calculator.worker_init,
@@ -50,28 +63,62 @@ class Calculator(DefaultCalculator):
 
         :param point: trial point.
         """
+        start = process_time()
         try:
             Calculator.evaluate_method.calculate_functionals(point)
         except Exception:
             point.set_z(sys.float_info.max)
             point.set_index(-10)
+        point.evaluation_time = process_time() - start
         return point
 
+    @staticmethod
+    def copy_point(point: SearchDataItem) -> SearchDataItem:
+        r"""
+        Copy the point passed to a process of the pool
+
+        :param point: trial point.
+        """
+        return SearchDataItem(y=copy.deepcopy(point.point), x=copy.deepcopy(point.get_x()),
+                              function_values=copy.deepcopy(point.function_values),
+                              discrete_value_index=point.get_discrete_value_index())
+
+    def submit(self, point: SearchDataItem) -> AsyncResult:
+        r"""
+        Start the trial at the point in the process pool without waiting for it
+
+        :param point: trial point.
+        :return: the result of the trial, the calculated point is copied back by copy_functionals.
+        """
+        return self.pool.apipe(Calculator.worker, Calculator.copy_point(point))
+
+    def cancel(self) -> None:
+        r"""
+        Terminate the processes of the pool with the running trials, the pool is recreated on the next call
+        """
+        self.pool.terminate()
+        self.pool.clear()
+
     def calculate_functionals_for_items(self, points: list[SearchDataItem]) -> list[SearchDataItem]:
         r"""
         Сalculation method for multiple points
 
         :param points: trial points.
+        :raises DeadlineExceeded: if the deadline has passed before all the trials are completed;
+          the processes of the pool are terminated in this case.
         """
 
-        points_copy = []
-        for point in points:
-            sd = SearchDataItem(y=copy.deepcopy(point.point), x=copy.deepcopy(point.get_x()),
-                                function_values=copy.deepcopy(point.function_values),
-                                discrete_value_index=point.get_discrete_value_index())
-            points_copy.append(sd)
-
-        points_res = self.pool.map(Calculator.worker, points_copy)
+        points_copy = [Calculator.copy_point(point) for point in points]
+
+        if self.deadline is None:
+            points_res = self.pool.map(Calculator.worker, points_copy)
+        else:
+            result = self.pool.amap(Calculator.worker, points_copy)
+            try:
+                points_res = result.get(timeout=max(self.deadline - monotonic(), 0))
+            except TimeoutError:
+                self.cancel()
+                raise DeadlineExceeded('Trials are cancelled by the deadline')
 
         for point, point_r in zip(points, points_res):
             self.evaluate_method.copy_functionals(point, point_r)
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import gc
+import glob
+import json
+import os
+import struct
+import time
+import zipfile
+from contextlib import contextmanager
+from typing import Callable
+
+import numpy as np
+
+from iOpt.method.search_data import SearchDataItem
+from iOpt.trial import Point, FunctionValue, FunctionType
+
+
+def trial_to_record(data_item: SearchDataItem) -> dict:
+    """
+    Convert a trial to a record with the same keys as in the JSON progress file
+
+    :param data_item: trial.
+    :return: record of the trial.
+    """
+    return {
+        'float_variables': [float(v) for v in data_item.get_y().float_variables],
+        'discrete_variables': [] if data_item.get_y().discrete_variables is None else list(
+            data_item.get_y().discrete_variables),
+        'function_values': [{
+            'value': float(fv.value),
+            'type': 1 if fv.type == FunctionType.OBJECTIV else 2,
+            'functionID': str(fv.functionID),
+        } for fv in data_item.function_values],
+        'x': float(data_item.get_x()),
+        'index': data_item.get_index(),
+        'discrete_value_index': data_item.get_discrete_value_index(),
+        '__z': float(data_item.get_z()),
+        'creation_time': data_item.creation_time,
+        'iterationNumber': data_item.iterationNumber
+    }
+
+
+def record_to_trial(record: dict) -> SearchDataItem:
+    """
+    Create a trial from its record
+
+    :param record: record of the trial.
+    :return: trial.
+    """
+    function_values = []
+    for fv in record['function_values']:
+        function_values.append(FunctionValue(
+            (FunctionType.OBJECTIV if fv['type'] == 1 else FunctionType.CONSTRAINT),
+            str(fv['functionID'])))
+        function_values[-1].value = np.double(fv['value'])
+
+    data_item = SearchDataItem(Point(record['float_variables'], record['discrete_variables']),
+                               record['x'], function_values, record['discrete_value_index'])
+    data_item.set_z(record['__z'])
+    data_item.set_index(record['index'])
+    data_item.creation_time = record['creation_time']
+    data_item.iterationNumber = record['iterationNumber']
+    return data_item
+
+
+class CheckpointLog:
+    """
+    Append-only checkpoint log in the JSON Lines format. Each saving appends the trials performed since
+    the previous one and a small header with the counters of the solver, so the cost of a checkpoint does not
+    depend on the number of accumulated trials. Every saving is flushed to the disk with fsync.
+    The search information is recovered by replaying the log, M and Z are recalculated from the trials
+    """
+
+    def __init__(self, file_name: str):
+        """
+        Constructor of the CheckpointLog class
+
+        :param file_name: file name of the log.
+        """
+        self.file_name = file_name
+        self.number_of_written_trials = 0
+        self.valid_size: int | None = None
+
+    def write(self, process) -> None:
+        """
+        Append the new trials and the header to the log. The first writing in a session starts the log anew
+
+        :param process: process whose search information is saved.
+        """
+        search_data = process.search_data
+        method = process.method
+        solution = search_data.solution
+        all_trials = search_data._allTrials
+
+        lines = []
+        for data_item in all_trials[self.number_of_written_trials:]:
+            # граничные точки не вычисляются (индекс -2) и создаются заново при восстановлении
+            if data_item.get_index() != -2:
+                lines.append(json.dumps({'type': 'trial', **trial_to_record(data_item)}, separators=(',', ':')))
+        lines.append(json.dumps({
+            'type': 'header',
+            'iterations_count': method.iterations_count,
+            'number_of_global_trials': solution.number_of_global_trials,
+            'number_of_local_trials': solution.number_of_local_trials,
+            'solving_time': solution.solving_time,
+            'solution_accuracy': float(solution.solution_accuracy),
+        }, separators=(',', ':')))
+
+        if self.number_of_written_trials > 0 and self.valid_size is not None:
+            # неполная последняя строка прочитанного журнала отбрасывается перед дописыванием
+            os.truncate(self.file_name, self.valid_size)
+            self.valid_size = None
+        is_new = self.number_of_written_trials == 0 or not os.path.exists(self.file_name)
+        with open(self.file_name, 'w' if is_new else 'a') as f:
+            f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        if is_new:
+            fsync_directory(os.path.dirname(os.path.abspath(self.file_name)))
+        self.number_of_written_trials = len(all_trials)
+
+    def read(self) -> tuple[list[SearchDataItem], dict | None]:
+        """
+        Replay the log. An incomplete last line (e.g. after a crash during writing) is skipped
+
+        :return: trials in the order of their execution and the last header (None if there is no header).
+        """
+        trials = []
+        header = None
+        self.valid_size = 0
+        with open(self.file_name, 'rb') as f:
+            lines = f.readlines()
+        for number, line in enumerate(lines):
+            if not line.endswith(b'\n') and number == len(lines) - 1:
+                break
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                raise Exception(f"Checkpoint log {self.file_name} is corrupted at line {number + 1}")
+            if record.pop('type') == 'header':
+                header = record
+            else:
+                trials.append(record_to_trial(record))
+            self.valid_size += len(line)
+        return trials, header
+
+
+def searchdata_to_arrays(process) -> dict[str, np.ndarray]:
+    """
+    Convert the search information to columnar arrays: one row per trial in the order of execution
+
+    :param process: process whose search information is converted.
+    :return: dictionary of arrays.
+    """
+    search_data = process.search_data
+    method = process.method
+    solution = search_data.solution
+    trials = [data_item for data_item in search_data._allTrials if data_item.get_index() != -2]
+
+    number_of_float_variables = solution.problem.number_of_float_variables
+    number_of_discrete_variables = solution.problem.number_of_discrete_variables
+    number_of_functions = max([len(data_item.function_values) for data_item in trials], default=0)
+
+    float_variables = np.array([data_item.point.float_variables for data_item in trials],
+                               dtype=np.double).reshape(len(trials), number_of_float_variables)
+    discrete_variables = np.empty((len(trials), number_of_discrete_variables), dtype=object)
+    if number_of_discrete_variables > 0:
+        discrete_variables[:] = [data_item.point.discrete_variables for data_item in trials]
+    function_count = np.array([len(data_item.function_values) for data_item in trials], dtype=np.int64)
+    function_values = np.full((len(trials), number_of_functions), np.nan, dtype=np.double)
+    function_types = np.zeros((len(trials), number_of_functions), dtype=np.int8)
+    function_ids = np.zeros((len(trials), number_of_functions), dtype=np.int64)
+    if len(trials) > 0 and np.all(function_count == number_of_functions):
+        # у всех испытаний одинаковое число значений функций: матрицы строятся одним вызовом
+        all_values = [fv for data_item in trials for fv in data_item.function_values]
+        function_values[:] = np.array([fv.value for fv in all_values], dtype=np.double).reshape(
+            function_values.shape)
+        function_types[:] = np.array([fv.type.value for fv in all_values], dtype=np.int8).reshape(
+            function_types.shape)
+        function_ids[:] = np.array([fv.functionID for fv in all_values], dtype=np.int64).reshape(
+            function_ids.shape)
+    else:
+        for i, data_item in enumerate(trials):
+            for j, fv in enumerate(data_item.function_values):
+                function_values[i, j] = fv.value
+                function_types[i, j] = fv.type.value
+                function_ids[i, j] = int(fv.functionID)
+
+    return {
+        'x': np.array([data_item.get_x() for data_item in trials], dtype=np.double),
+        'float_variables': float_variables,
+        'discrete_variables': discrete_variables.astype(str),
+        'function_values': function_values,
+        'function_types': function_types,
+        'function_ids': function_ids,
+        'function_count': function_count,
+        'index': np.array([data_item.get_index() for data_item in trials], dtype=np.int64),
+        'z': np.array([data_item.get_z() for data_item in trials], dtype=np.double),
+        'delta': np.array([data_item.delta for data_item in trials], dtype=np.double),
+        'discrete_value_index': np.array([data_item.get_discrete_value_index() for data_item in trials],
+                                         dtype=np.int64),
+        'iteration': np.array([data_item.iterationNumber for data_item in trials], dtype=np.int64),
+        'creation_time': np.array([data_item.creation_time for data_item in trials], dtype=np.double),
+        'M': np.array(method.M, dtype=np.double),
+        'Z': np.array(method.Z, dtype=np.double),
+        'iterations_count': np.array(method.iterations_count),
+        'number_of_global_trials': np.array(solution.number_of_global_trials),
+        'number_of_local_trials': np.array(solution.number_of_local_trials),
+        'solving_time': np.array(solution.solving_time, dtype=np.double),
+        'solution_accuracy': np.array(solution.solution_accuracy, dtype=np.double),
+    }
+
+
+@contextmanager
+def gc_paused():
+    """
+    Pause the cyclic garbage collector while the search information is rebuilt: the collector is triggered
+      by the number of created objects and would scan the growing list of trials many times
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def arrays_to_trials(arrays: dict[str, np.ndarray]) -> list[SearchDataItem]:
+    """
+    Create trials from the columnar arrays. The trials are Python objects, so the conversion
+      is linear in Python: about 5 us per trial (1M trials take several seconds),
+      the arrays themselves can be analysed without it
+
+    :param arrays: dictionary of arrays created by searchdata_to_arrays.
+    :return: trials in the order of their execution.
+    """
+    float_variables = np.asarray(arrays['float_variables'])
+    discrete_variables = np.asarray(arrays['discrete_variables']).tolist()
+    function_values = np.asarray(arrays['function_values']).tolist()
+    function_types = np.asarray(arrays['function_types']).tolist()
+    function_ids = np.asarray(arrays['function_ids']).tolist()
+    function_count = np.asarray(arrays['function_count']).tolist()
+    x = np.asarray(arrays['x']).tolist()
+    index = np.asarray(arrays['index']).tolist()
+    z = np.asarray(arrays['z']).tolist()
+    discrete_value_index = np.asarray(arrays['discrete_value_index']).tolist()
+    iteration = np.asarray(arrays['iteration']).tolist()
+    creation_time = np.asarray(arrays['creation_time']).tolist()
+
+    function_type_by_value = {function_type.value: function_type for function_type in FunctionType}
+    trials = []
+    for i in range(len(x)):
+        # значения функций передаются после создания точки, чтобы не копировать их в конструкторе
+        data_item = SearchDataItem(Point(float_variables[i].copy(), discrete_variables[i]), x[i], [],
+                                   discrete_value_index[i])
+        data_item.function_values = [FunctionValue(function_type_by_value[function_types[i][j]],
+                                                   function_ids[i][j], function_values[i][j])
+                                     for j in range(function_count[i])]
+        data_item.set_index(index[i])
+        data_item.set_z(z[i])
+        data_item.iterationNumber = iteration[i]
+        data_item.creation_time = creation_time[i]
+        trials.append(data_item)
+    return trials
+
+
+def save_arrays(file_name: str, arrays: dict[str, np.ndarray]) -> None:
+    """
+    Save the arrays into an uncompressed npz file, so that they can be memory-mapped on load
+
+    :param file_name: file name.
+    :param arrays: dictionary of arrays.
+    """
+    with open(file_name, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def load_arrays(file_name: str, mmap: bool = True) -> dict[str, np.ndarray]:
+    """
+    Load the arrays saved by save_arrays. The trials can be analysed without creating Python objects
+
+    :param file_name: file name.
+    :param mmap: if true, the arrays are memory-mapped instead of being read into memory.
+    :return: dictionary of arrays (read-only if memory-mapped).
+    """
+    arrays = {}
+    with zipfile.ZipFile(file_name) as archive, open(file_name, 'rb') as f:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')]
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                # данные массива хранятся в архиве без сжатия: после локального заголовка zip идет файл .npy
+                f.seek(info.header_offset)
+                name_length, extra_length = struct.unpack('<HH', f.read(30)[26:30])
+                f.seek(info.header_offset + 30 + name_length + extra_length)
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                if not dtype.hasobject and np.prod(shape) > 0:
+                    arrays[name] = np.memmap(file_name, dtype=dtype, mode='r', shape=shape,
+                                             order='F' if fortran_order else 'C', offset=f.tell())
+                    continue
+            with archive.open(info) as member:
+                arrays[name] = np.lib.format.read_array(member)
+    return arrays
+
+
+def fsync_directory(directory: str) -> None:
+    """
+    Flush the entries of a directory to the disk, so that a file renamed in it survives a system crash.
+      The directories can not be opened for that on Windows, the renaming is durable there without it
+
+    :param directory: directory path.
+    """
+    if os.name == 'nt':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_atomically(file_name: str, write: Callable[[str], None]) -> None:
+    """
+    Write a file through a temporary file renamed to the file name, so that a crash during writing
+      leaves the previous version of the file intact
+
+    :param file_name: file name.
+    :param write: function writing the contents into the file with the given name.
+    """
+    temp_file_name = file_name + '.tmp'
+    try:
+        write(temp_file_name)
+        with open(temp_file_name, 'rb') as f:
+            os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(temp_file_name):
+            os.remove(temp_file_name)
+        raise
+    os.replace(temp_file_name, file_name)
+    fsync_directory(os.path.dirname(os.path.abspath(file_name)))
+
+
+class Checkpointer:
+    """
+    Periodic saving of the optimization process into a checkpoint directory.
+    A checkpoint is written to a temporary file and then renamed, so a crash during writing
+    does not damage the previous checkpoints. In the 'jsonl' format there is one checkpoint log
+    checkpoint.jsonl in the directory, every saving appends the new trials to it
+    """
+
+    def __init__(self, parameters):
+        """
+        Constructor of the Checkpointer class
+
+        :param parameters: solver parameters with the checkpoint options.
+        """
+        self.directory = parameters.checkpoint_dir
+        self.every_iterations = parameters.checkpoint_every_iterations
+        self.every_seconds = parameters.checkpoint_every_seconds
+        self.to_keep = parameters.checkpoints_to_keep
+        self.format = parameters.checkpoint_format
+        if self.format not in ('json', 'jsonl', 'npz'):
+            raise Exception(f"Unsupported checkpoint format: {self.format}")
+        self.last_iteration = None
+        self.last_time = time.monotonic()
+
+    def is_enabled(self) -> bool:
+        return self.directory is not None and (self.every_iterations > 0 or self.every_seconds > 0)
+
+    def checkpoint(self, process, force: bool = False) -> str | None:
+        """
+        Save a checkpoint if the given number of iterations or seconds has passed since the previous one
+
+        :param process: process whose search information is saved.
+        :param force: save regardless of the frequency.
+        :return: file name of the saved checkpoint or None.
+        """
+        if not self.is_enabled():
+            return None
+        iteration = process.method.iterations_count
+        if self.last_iteration is None:
+            self.last_iteration = iteration
+            if not force:
+                return None
+        elif iteration == self.last_iteration:
+            return None
+        if force \
+                or 0 < self.every_iterations <= iteration - self.last_iteration \
+                or 0 < self.every_seconds <= time.monotonic() - self.last_time:
+            return self.save(process)
+        return None
+
+    def save(self, process) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        iteration = process.method.iterations_count
+        if self.format == 'jsonl':
+            # журнал только дописывается и сбрасывается на диск, поэтому не переименовывается и не ротируется
+            file_name = os.path.join(self.directory, 'checkpoint.jsonl')
+            process.save_progress(file_name, format=self.format)
+            self.last_iteration = iteration
+            self.last_time = time.monotonic()
+            return file_name
+
+        file_name = os.path.join(self.directory, f"checkpoint_{iteration:09d}.{self.format}")
+        # save_progress пишет файл атомарно: во временный файл с последующим переименованием
+        process.save_progress(file_name, format=self.format)
+
+        self.last_iteration = iteration
+        self.last_time = time.monotonic()
+        # файлы прошлых запусков могут иметь большие номера итераций, поэтому удаляются самые старые по времени
+        old_file_names = [name for name in self.list_checkpoints() if name != file_name]
+        for old_file_name in old_file_names[:max(len(old_file_names) - self.to_keep + 1, 0)]:
+            os.remove(old_file_name)
+        return file_name
+
+    def list_checkpoints(self) -> list[str]:
+        """
+        Get the checkpoints of the directory from the oldest to the newest by the modification time,
+          the checkpoints saved at the same time are ordered by the iteration
+
+        :return: list of file names.
+        """
+        if self.directory is None:
+            return []
+        if self.format == 'jsonl':
+            file_name = os.path.join(self.directory, 'checkpoint.jsonl')
+            return [file_name] if os.path.exists(file_name) else []
+        file_names = glob.glob(os.path.join(glob.escape(self.directory), f"checkpoint_*.{self.format}"))
+        return sorted(file_names, key=lambda name: (os.stat(name).st_mtime_ns, name))
+
+    def get_last_checkpoint(self) -> str | None:
+        checkpoints = self.list_checkpoints()
+        return checkpoints[-1] if checkpoints else None
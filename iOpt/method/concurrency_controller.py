@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from time import monotonic
+
+
+class ConcurrencyController:
+    """
+    The ConcurrencyController class adjusts the number of trials kept in flight by the asynchronous scheme.
+      The trials are measured in windows: the target keeps moving in one direction (up to the bounds)
+      and turns back when the number of trials completed per second drops, or when a step up made
+      the trials slower (the latency grew) without raising the throughput. The target goes down
+      while the coordinator overhead dominates the window and does not grow while the workers are idle
+    """
+
+    def __init__(self,
+                 min_points: int,
+                 max_points: int,
+                 window: int | None = None,
+                 tolerance: float = 0.05,
+                 min_utilization: float = 0.5,
+                 max_overhead: float = 0.5
+                 ):
+        """
+        Constructor of the ConcurrencyController class
+
+        :param min_points: minimum number of trials in flight.
+        :param max_points: maximum number of trials in flight (number of workers).
+        :param window: number of completed trials in one measurement, by default twice max_points.
+        :param tolerance: relative change of the throughput treated as noise.
+        :param min_utilization: share of the time the trials in flight are calculated,
+               below it the target does not grow.
+        :param max_overhead: share of the wall time spent by the coordinator, above it the coordinator
+               is considered the bottleneck and the target goes down.
+        """
+        if min_points < 1 or min_points > max_points:
+            raise Exception("The number of trials in flight should be within [1, number_of_parallel_points]")
+        self.min_points = min_points
+        self.max_points = max_points
+        self.window = window if window is not None else 2 * max_points
+        self.tolerance = tolerance
+        self.min_utilization = min_utilization
+        self.max_overhead = max_overhead
+
+        # поиск начинается со всех исполнителей, цель меняется, когда производительность падает
+        self.target = max_points
+        self.direction = 1
+        self.throughput: float | None = None
+        # статистика последнего окна
+        self.latency: float = 0.0
+        self.utilization: float = 0.0
+        self.overhead: float = 0.0
+
+        self._window_start: float | None = None
+        self._completed = 0
+        self._busy_time = 0.0
+        self._coordinator_time = 0.0
+
+    def start(self, now: float | None = None) -> None:
+        """
+        Start the first measurement window
+
+        :param now: current time (time.monotonic).
+        """
+        self._window_start = monotonic() if now is None else now
+
+    def add_coordinator_time(self, seconds: float) -> None:
+        """
+        Account the time the coordinator spent between waiting for the results
+
+        :param seconds: duration in seconds.
+        """
+        self._coordinator_time += seconds
+
+    def trial_completed(self, latency: float, now: float | None = None) -> int:
+        """
+        Account a completed trial and update the target at the end of the window
+
+        :param latency: time in seconds from giving the point to receiving its result.
+        :param now: current time (time.monotonic).
+        :return: number of trials to keep in flight.
+        """
+        now = monotonic() if now is None else now
+        if self._window_start is None:
+            self._window_start = now - latency
+        self._completed += 1
+        self._busy_time += latency
+        if self._completed >= self.window:
+            self._update(now)
+        return self.target
+
+    def _update(self, now: float) -> None:
+        wall_time = max(now - self._window_start, 1e-9)
+        throughput = self._completed / wall_time
+        previous_latency = self.latency
+        self.latency = self._busy_time / self._completed
+        self.utilization = min(self._busy_time / (wall_time * self.target), 1.0)
+        self.overhead = min(self._coordinator_time / wall_time, 1.0)
+
+        if self.overhead > self.max_overhead:
+            # испытания ждут координатора, дополнительные испытания только удлиняют очередь
+            self.direction = -1
+        elif self.throughput is not None and throughput < self.throughput * (1 - self.tolerance):
+            self.direction = -self.direction
+        elif self.direction > 0 and self.throughput is not None \
+                and self.latency > previous_latency * (1 + self.tolerance) \
+                and throughput < self.throughput * (1 + self.tolerance):
+            # испытания стали медленнее, а производительность не выросла: исполнители мешают друг другу
+            self.direction = -1
+        elif self.direction > 0 and self.utilization < self.min_utilization:
+            self.direction = -1
+        self.target = min(max(self.target + self.direction, self.min_points), self.max_points)
+
+        self.throughput = throughput
+        self._window_start = now
+        self._completed = 0
+        self._busy_time = 0.0
+        self._coordinator_time = 0.0
@@ -1,35 +1,97 @@
+import json
 import logging
-from typing import Tuple, List
+import time
+from typing import Dict, Tuple, List
 
-from sqlalchemy import func, create_engine, update, select
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import sessionmaker
+import numpy as np
+
+from sqlalchemy import func, create_engine, insert, update, select, inspect, text
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import aliased, sessionmaker
 
 import iOpt.method.models as models
 from iOpt.method.search_data import SearchDataItem
 from iOpt.trial import FunctionValue, Point
 
+# столбцы, добавленные в таблицы после их первой версии: create_all создает недостающие таблицы,
+# но не изменяет существующие, поэтому в базу данных прежней версии они добавляются через ALTER TABLE
+ADDED_COLUMNS = {
+    models.Task.__tablename__: [
+        ("priority", "INTEGER NOT NULL DEFAULT 0"),
+        ("parameters", "VARCHAR"),
+    ],
+}
+
 
 class DBManager:
-    def __init__(self, url_db: str):
-        self.engine = create_engine(url_db)
+    def __init__(
+        self,
+        url_db: str,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_pre_ping: bool = False,
+        pool_recycle: int = -1,
+    ):
+        """
+        Constructor of the DBManager class. The calls made on every iteration
+        (taking, calculating and checking points) use SQLAlchemy Core statements on a pooled connection
+
+        :param url_db: database URL.
+        :param pool_size: number of connections kept open in the pool, None - the SQLAlchemy default.
+        :param max_overflow: number of connections allowed in addition to pool_size.
+        :param pool_pre_ping: test connections for liveness before using them.
+        :param pool_recycle: recycle connections older than the given number of seconds, -1 - never.
+        """
+        engine_options = {"pool_pre_ping": pool_pre_ping, "pool_recycle": pool_recycle}
+        if pool_size is not None:
+            engine_options["pool_size"] = pool_size
+        if max_overflow is not None:
+            engine_options["max_overflow"] = max_overflow
+        self.engine = create_engine(url_db, **engine_options)
         self.session_maker = sessionmaker(self.engine)
         self.task_id = None
         try:
             models.Base.metadata.create_all(self.engine)
         except IntegrityError:
             pass
+        self.upgrade_schema()
+
+    def upgrade_schema(self) -> None:
+        """
+        Add the columns missing in the tables of a database created by a previous version
+        """
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {column["name"] for column in inspect(self.engine).get_columns(table)}
+            for name, definition in columns:
+                if name in existing:
+                    continue
+                try:
+                    with self.engine.begin() as connection:
+                        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {definition}"))
+                except DBAPIError:
+                    # столбец мог быть добавлен другим процессом, запущенным одновременно
+                    if name not in {column["name"] for column in inspect(self.engine).get_columns(table)}:
+                        raise
+
+    def set_task(self, name: str, priority: int = 0, parameters: Dict | None = None) -> bool:
+        """
+        Create the task with the given name or load it if it exists
 
-    def set_task(self, name: str) -> bool:
-        self.task_id = self.create_task(name)
+        :param name: name of the task.
+        :param priority: priority of the task.
+        :param parameters: parameters of the solution saved with a new task, see get_task_parameters.
+        :return: True if the task is created.
+        """
+        self.task_id = self.create_task(name, priority, parameters)
         if self.task_id:
             return True
         self.task_id = self.load_task(name)
         return False
 
-    def create_task(self, name: str):
+    def create_task(self, name: str, priority: int = 0, parameters: Dict | None = None):
         with self.session_maker() as session:
-            task = models.Task(name=name, state=models.TaskState.SOLVING)
+            task = models.Task(name=name, state=models.TaskState.SOLVING, priority=priority,
+                               parameters=None if parameters is None else json.dumps(parameters, default=self.to_json))
             try:
                 session.add(task)
                 session.commit()
@@ -37,6 +99,13 @@ class DBManager:
                 session.rollback()
             return task.id
 
+    @staticmethod
+    def to_json(value):
+        # массивы и числа numpy, например в start_lambdas, сохраняются как списки и числа
+        if isinstance(value, (np.ndarray, np.generic)):
+            return value.tolist()
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
     def load_task(self, name: str):
         with self.session_maker() as session:
             task_id = session.scalars(
@@ -44,6 +113,26 @@ class DBManager:
             ).one()
             return task_id
 
+    def get_task_parameters(self, name: str) -> Dict | None:
+        """
+        Get the parameters of the solution saved with the task
+
+        :param name: name of the task.
+        :return: the parameters, None if they were not saved.
+        """
+        with self.engine.connect() as connection:
+            parameters = connection.scalar(select(models.Task.parameters).where(models.Task.name == name))
+            return None if parameters is None else json.loads(parameters)
+
+    def set_task_solving(self) -> None:
+        with self.session_maker() as session:
+            session.execute(
+                update(models.Task)
+                .where(models.Task.id == self.task_id)
+                .values(state=models.TaskState.SOLVING)
+            )
+            session.commit()
+
     def set_task_solved(self) -> None:
         with self.session_maker() as session:
             session.execute(
@@ -63,12 +152,21 @@ class DBManager:
             session.commit()
 
     def is_task_solving(self) -> bool:
-        with self.session_maker() as session:
-            state = session.scalar(
+        with self.engine.connect() as connection:
+            state = connection.scalar(
                 select(models.Task.state).where(models.Task.id == self.task_id)
             )
             return state == models.TaskState.SOLVING
 
+    def get_solving_tasks(self) -> List[Tuple[int, str, int]]:
+        with self.session_maker() as session:
+            rows = session.execute(
+                select(models.Task.id, models.Task.name, models.Task.priority)
+                .where(models.Task.state == models.TaskState.SOLVING)
+                .order_by(models.Task.id)
+            ).all()
+            return [(row.id, row.name, row.priority) for row in rows]
+
     def delete_task(self) -> None:
         with self.session_maker() as session:
             task = session.get(models.Task, self.task_id)
@@ -76,77 +174,103 @@ class DBManager:
             session.commit()
 
     def count_not_calculated_points(self) -> int:
-        with self.session_maker() as session:
-            return session.scalar(
+        with self.engine.connect() as connection:
+            return connection.scalar(
                 select(func.count())
                 .select_from(models.Point)
                 .where(models.Point.task_id == self.task_id)
-                .where(models.Point.state < models.PointState.CALCULATED)
+                .where(models.Point.state.in_([models.PointState.WAITING, models.PointState.CALCULATING]))
             )
 
     def set_point_to_calculate(self, point: SearchDataItem) -> int:
-        with self.session_maker() as session:
-            db_point = models.Point(
+        with self.engine.begin() as connection:
+            return self._insert_point(connection, point)
+
+    def set_points_to_calculate(self, points: List[SearchDataItem]) -> List[int]:
+        with self.engine.begin() as connection:
+            return [self._insert_point(connection, point) for point in points]
+
+    def _insert_point(self, connection, point: SearchDataItem) -> int:
+        db_point_id = connection.scalar(
+            insert(models.Point)
+            .values(
                 task_id=self.task_id,
                 state=models.PointState.WAITING,
                 x=point.get_x(),
                 index=point.get_index(),
                 z=point.get_z(),
-                float_variables=[
-                    models.FloatVariable(value=var)
-                    for var in point.point.float_variables
-                ],
-                discrete_variables=[
-                    models.DiscreteVariable(value=var)
-                    for var in point.point.discrete_variables
-                ],
             )
-            session.add(db_point)
-            session.commit()
-            return db_point.id
+            .returning(models.Point.id)
+        )
+        if len(point.point.float_variables) > 0:
+            connection.execute(
+                insert(models.FloatVariable),
+                [{"point_id": db_point_id, "value": var} for var in point.point.float_variables],
+            )
+        if point.point.discrete_variables is not None and len(point.point.discrete_variables) > 0:
+            connection.execute(
+                insert(models.DiscreteVariable),
+                [{"point_id": db_point_id, "value": var} for var in point.point.discrete_variables],
+            )
+        return db_point_id
 
     def get_point_to_calculate(
-        self, n_func: int
+        self, n_func: int, task_id: int | None = None
     ) -> Tuple[SearchDataItem, int] | Tuple[None, None]:
-        with self.session_maker() as session:
-            db_point = session.scalars(
-                select(models.Point)
-                .where(models.Point.task_id == self.task_id)
-                .where(models.Point.state == models.PointState.WAITING)
-                .with_for_update(skip_locked=True)
-                .limit(1)
-            ).first()
-            if db_point is None:
-                return None, None
-            db_point.state = models.PointState.CALCULATING
-            session.commit()
+        if task_id is None:
+            task_id = self.task_id
+        waiting_point = aliased(models.Point)
+        point, db_point_id, _ = self._take_point_to_calculate(
+            select(waiting_point.id)
+            .where(waiting_point.task_id == task_id)
+            .where(waiting_point.state == models.PointState.WAITING),
+            {task_id: n_func},
+        )
+        return point, db_point_id
 
-            point = SearchDataItem(
-                Point(
-                    [var.value for var in db_point.float_variables],
-                    [var.value for var in db_point.discrete_variables],
-                ),
-                db_point.x,
-                [FunctionValue()] * n_func,
-            )
-            point.set_index(db_point.index)
-            point.set_z(db_point.z)
-            return point, db_point.id
+    def get_oldest_point_to_calculate(
+        self, n_funcs: Dict[int, int]
+    ) -> Tuple[SearchDataItem, int, int] | Tuple[None, None, None]:
+        waiting_point = aliased(models.Point)
+        return self._take_point_to_calculate(
+            select(waiting_point.id)
+            .where(waiting_point.task_id.in_(list(n_funcs)))
+            .where(waiting_point.state == models.PointState.WAITING)
+            .order_by(waiting_point.id),
+            n_funcs,
+        )
+
+    def _take_point_to_calculate(
+        self, query, n_funcs: Dict[int, int]
+    ) -> Tuple[SearchDataItem, int, int] | Tuple[None, None, None]:
+        with self.engine.begin() as connection:
+            row = connection.execute(
+                update(models.Point)
+                .where(models.Point.id == query.limit(1).with_for_update(skip_locked=True).scalar_subquery())
+                .values(state=models.PointState.CALCULATING)
+                .returning(models.Point.id, models.Point.task_id, models.Point.x,
+                           models.Point.index, models.Point.z)
+            ).first()
+            if row is None:
+                return None, None, None
+            point = self._build_points(connection, [row], n_funcs[row.task_id])[0]
+            return point, row.id, row.task_id
 
     def set_calculated_point(self, point: SearchDataItem, db_point_id: int) -> None:
-        with self.session_maker() as session:
-            session.add_all(
+        with self.engine.begin() as connection:
+            connection.execute(
+                insert(models.FunctionValue),
                 [
-                    models.FunctionValue(
-                        point_id=db_point_id,
-                        type=fv.type,
-                        function_id=fv.functionID,
-                        value=fv.value,
-                    )
+                    {
+                        "point_id": db_point_id,
+                        "type": fv.type,
+                        "function_id": fv.functionID,
+                        "value": fv.value,
+                    }
                     for fv in point.function_values
-                ]
+                ],
             )
-            session.execute(
+            connection.execute(
                 update(models.Point)
                 .where(models.Point.id == db_point_id)
                 .values(
@@ -155,7 +279,75 @@ class DBManager:
                     state=models.PointState.CALCULATED,
                 )
             )
-            session.commit()
+
+    def get_all_calculated_points(self, point_ids: List[int] | None = None) -> List[Tuple[SearchDataItem, int]]:
+        """
+        Take the calculated points of the task and mark them as complete
+
+        :param point_ids: ids of the points to take, all the calculated points of the task if None.
+        :return: pairs of the point and its id in ascending order of the ids.
+        """
+        statement = (
+            update(models.Point)
+            .where(models.Point.task_id == self.task_id)
+            .where(models.Point.state == models.PointState.CALCULATED)
+        )
+        if point_ids is not None:
+            statement = statement.where(models.Point.id.in_(point_ids))
+        with self.engine.begin() as connection:
+            rows = connection.execute(
+                statement
+                .values(state=models.PointState.COMPLETE)
+                .returning(models.Point.id, models.Point.x, models.Point.index, models.Point.z)
+            ).all()
+            if not rows:
+                return []
+            rows.sort(key=lambda row: row.id)
+            points = self._build_points(connection, rows)
+            return [(point, row.id) for point, row in zip(points, rows)]
+
+    @staticmethod
+    def _build_points(connection, rows, n_func: int | None = None) -> List[SearchDataItem]:
+        """
+        Build search points from the rows of the points table, reading the variables
+        (and the function values, if n_func is not given) of all rows with one query per table
+        """
+        ids = [row.id for row in rows]
+        float_variables = {point_id: [] for point_id in ids}
+        discrete_variables = {point_id: [] for point_id in ids}
+        function_values = {point_id: [] for point_id in ids}
+        for var in connection.execute(
+            select(models.FloatVariable.point_id, models.FloatVariable.value)
+            .where(models.FloatVariable.point_id.in_(ids))
+            .order_by(models.FloatVariable.id)
+        ):
+            float_variables[var.point_id].append(var.value)
+        for var in connection.execute(
+            select(models.DiscreteVariable.point_id, models.DiscreteVariable.value)
+            .where(models.DiscreteVariable.point_id.in_(ids))
+            .order_by(models.DiscreteVariable.id)
+        ):
+            discrete_variables[var.point_id].append(var.value)
+        if n_func is None:
+            for fv in connection.execute(
+                select(models.FunctionValue.point_id, models.FunctionValue.type,
+                       models.FunctionValue.function_id, models.FunctionValue.value)
+                .where(models.FunctionValue.point_id.in_(ids))
+                .order_by(models.FunctionValue.id)
+            ):
+                function_values[fv.point_id].append(FunctionValue(fv.type, fv.function_id, fv.value))
+
+        points = []
+        for row in rows:
+            point = SearchDataItem(
+                Point(float_variables[row.id], discrete_variables[row.id]),
+                row.x,
+                function_values[row.id] if n_func is None else [FunctionValue()] * n_func,
+            )
+            point.set_index(row.index)
+            point.set_z(row.z)
+            points.append(point)
+        return points
 
     def get_calculated_point(self) -> Tuple[SearchDataItem, int]:
         with self.session_maker() as session:
@@ -169,17 +361,75 @@ class DBManager:
             session.commit()
             return self._convert_db_point(db_point)
 
-    def get_all_calculated_points(self) -> List[Tuple[SearchDataItem, int]]:
+    def add_task_progress(self, iteration: int, trials: int, best_z: float | None,
+                          min_delta: float, iteration_time: float) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(
+                insert(models.TaskProgress).values(
+                    task_id=self.task_id,
+                    iteration=iteration,
+                    trials=trials,
+                    best_z=best_z,
+                    min_delta=min_delta,
+                    iteration_time=iteration_time,
+                )
+            )
+
+    def get_task_progress(self, since_id: int = 0) -> List[Dict[str, float | int | None]]:
+        """
+        Get the progress rows of the task written after the given one
+
+        :param since_id: id of the last row already read, 0 - read all rows.
+        :return: list of rows with the keys id, iteration, trials, best_z, min_delta, iteration_time.
+        """
+        with self.engine.connect() as connection:
+            rows = connection.execute(
+                select(models.TaskProgress.id, models.TaskProgress.iteration, models.TaskProgress.trials,
+                       models.TaskProgress.best_z, models.TaskProgress.min_delta,
+                       models.TaskProgress.iteration_time)
+                .where(models.TaskProgress.task_id == self.task_id)
+                .where(models.TaskProgress.id > since_id)
+                .order_by(models.TaskProgress.id)
+            ).all()
+            return [dict(row._mapping) for row in rows]
+
+    def get_points_since(self, point_id: int = 0) -> List[Tuple[SearchDataItem, int]]:
+        """
+        Get the calculated points of the task stored after the given one, without changing their state
+
+        :param point_id: id of the last point already read, 0 - read all points.
+        :return: list of pairs (point, point id) ordered by id.
+        """
+        with self.engine.connect() as connection:
+            rows = connection.execute(
+                select(models.Point.id, models.Point.x, models.Point.index, models.Point.z)
+                .where(models.Point.task_id == self.task_id)
+                .where(models.Point.id > point_id)
+                .where(models.Point.state.in_([models.PointState.CALCULATED, models.PointState.COMPLETE]))
+                .order_by(models.Point.id)
+            ).all()
+            if not rows:
+                return []
+            points = self._build_points(connection, rows)
+            return [(point, row.id) for point, row in zip(points, rows)]
+
+    def load_points(self) -> Tuple[List[Tuple[SearchDataItem, int]], List[Tuple[float, int]]]:
         with self.session_maker() as session:
             list_db_points = session.scalars(
                 select(models.Point)
                 .where(models.Point.task_id == self.task_id)
-                .where(models.Point.state == models.PointState.CALCULATED)
+                .order_by(models.Point.id)
             ).all()
+            calculated_points = []
+            waiting_points = []
             for db_point in list_db_points:
-                db_point.state = models.PointState.COMPLETE
+                if db_point.state >= models.PointState.CALCULATED:
+                    calculated_points.append(self._convert_db_point(db_point))
+                    db_point.state = models.PointState.COMPLETE
+                else:
+                    waiting_points.append((db_point.x, db_point.id))
             session.commit()
-            return list(map(self._convert_db_point, list_db_points))
+            return calculated_points, waiting_points
 
     @staticmethod
     def _convert_db_point(db_point: models.Point) -> Tuple[SearchDataItem, int]:
@@ -201,16 +451,31 @@ class DBManager:
     def calculate_functionals_for_items(
         self, points: List[SearchDataItem]
     ) -> List[SearchDataItem]:
-        t = {}
-        for point in points:
-            point_id = self.set_point_to_calculate(point)
-            t[point_id] = point
-        while self.count_not_calculated_points() > 0:
-            pass
-        points_res = self.get_all_calculated_points()
-        for point_r, point_id in points_res:
+        t = dict(zip(self.set_points_to_calculate(points), points))
+        for point_r, point_id in self.wait_calculated_points(list(t)):
             point = t[point_id]
             point.function_values = point_r.function_values
             point.set_z(point_r.get_z())
             point.set_index(point_r.get_index())
         return points
+
+    def wait_calculated_points(self, point_ids: List[int],
+                               poll_interval: float = 0.01) -> List[Tuple[SearchDataItem, int]]:
+        """
+        Wait until the given points are calculated and take them, the other calculated points of the task
+        are left to their owners
+
+        :param point_ids: ids of the points.
+        :param poll_interval: pause in seconds after a request that returned no points.
+        :return: pairs of the point and its id.
+        """
+        remaining = set(point_ids)
+        points = []
+        while remaining:
+            calculated = self.get_all_calculated_points(list(remaining))
+            for point, point_id in calculated:
+                remaining.discard(point_id)
+                points.append((point, point_id))
+            if remaining and not calculated:
+                time.sleep(poll_interval)
+        return points
@@ -1,6 +1,10 @@
+import enum
+import queue
+import threading
+import time
 import traceback
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Tuple
 
 from iOpt.evolvent.evolvent import Evolvent
 from iOpt.method.db_manager import DBManager
@@ -10,6 +14,7 @@ from iOpt.method.method import Method
 from iOpt.method.optim_task import OptimizationTask
 from iOpt.method.process import Process
 from iOpt.method.search_data import SearchData, SearchDataItem
+from iOpt.problem import Problem
 from iOpt.solution import Solution
 from iOpt.solver_parametrs import SolverParameters
 
@@ -33,17 +38,68 @@ class DBProcess(Process):
         self.waiting_oldpoints[db_newpoint_id] = oldpoint
         oldpoint.blocked = True
 
-    def find_oldpoint(self, db_newpoint_id: int) -> SearchDataItem:
-        oldpoint = self.waiting_oldpoints.pop(db_newpoint_id)
+    def find_oldpoint(self, newpoint: SearchDataItem, db_newpoint_id: int) -> SearchDataItem:
+        oldpoint = self.waiting_oldpoints.pop(db_newpoint_id, None)
+        if oldpoint is None:
+            # точка была поставлена в очередь предыдущим запуском координатора
+            oldpoint = self.search_data.find_data_item_by_one_dimensional_point(newpoint.get_x())
         oldpoint.blocked = False
         return oldpoint
 
+    def restore_search_data(self) -> list[SearchDataItem]:
+        """
+        Rebuild the search information from the points already stored in the database,
+        e.g. after a restart of the coordinator. Points that are still waiting or being calculated
+        are taken as in-flight ones. If no point is calculated yet, the previous run was stopped
+        in the first iteration, the waiting points are its points and they are awaited
+
+        :return: restored trials, or an empty list if the task has no points.
+        """
+        calculated_points, waiting_points = self.db.load_points()
+        if not calculated_points:
+            if not waiting_points:
+                return []
+            calculated_points = self.db.wait_calculated_points([db_point_id for _, db_point_id in waiting_points])
+            waiting_points = []
+        items = [point for point, _ in calculated_points]
+        self.method.restore_search_data(items)
+
+        for x, db_point_id in waiting_points:
+            oldpoint = self.search_data.find_data_item_by_one_dimensional_point(x)
+            self.save_oldpoint(oldpoint, db_point_id)
+        self.search_data.solution.number_of_global_trials += len(waiting_points)
+
+        self.db.set_task_solving()
+        return items
+
+    def get_progress(self, iteration_time: float) -> Dict[str, float | int | None]:
+        best = self.method.best
+        return {
+            "iteration": self.method.iterations_count,
+            "trials": self.search_data.solution.number_of_global_trials,
+            "best_z": None if best is None else float(best.get_z()),
+            "min_delta": float(self.method.min_delta),
+            "iteration_time": iteration_time,
+        }
+
+    def write_progress(self, iteration_time: float) -> None:
+        """
+        Write a progress row of the task into the database, if it is enabled by the parameters
+
+        :param iteration_time: duration of the iteration in seconds.
+        """
+        if self.parameters.db_task_progress:
+            self.db.add_task_progress(**self.get_progress(iteration_time))
+
     def do_global_iteration(self, number: int = 1):
+        start_time = time.perf_counter()
         done_trials = []
         if self._first_iteration is True:
             for listener in self._listeners:
                 listener.before_method_start(self.method)
-            done_trials = self.method.first_iteration()
+            done_trials = self.restore_search_data()
+            if not done_trials:
+                done_trials = self.method.first_iteration()
             self._first_iteration = False
         else:
             for _ in range(
@@ -55,16 +111,220 @@ class DBProcess(Process):
                 self.save_oldpoint(oldpoint, db_newpoint_id)
 
             for newpoint, db_newpoint_id in self.db.get_all_calculated_points():
-                oldpoint = self.find_oldpoint(db_newpoint_id)
+                oldpoint = self.find_oldpoint(newpoint, db_newpoint_id)
                 self.method.update_optimum(newpoint)
                 self.method.renew_search_data(newpoint, oldpoint)
                 self.method.finalize_iteration()
                 done_trials.append(newpoint)
 
+        self.write_progress(time.perf_counter() - start_time)
+        for listener in self._listeners:
+            listener.on_end_iteration(done_trials, self.get_results())
+
+    def solve(self) -> Solution:
+        self.start_deadline()
+        start_time = datetime.now()
+
+        try:
+            while not self.method.check_stop_condition():
+                self.do_global_iteration()
+            self.db.set_task_solved()
+        except Exception:
+            self.db.set_task_error()
+            print("Exception was thrown")
+            print(traceback.format_exc())
+
+        if self.parameters.refine_solution:
+            self.do_local_refinement(self.parameters.local_method_iteration_count)
+
+        result = self.get_results()
+        result.solving_time += (datetime.now() - start_time).total_seconds()
+
+        for listener in self._listeners:
+            status = self.method.check_stop_condition()
+            listener.on_method_stop(self.search_data, self.get_results(), status)
+
+        return result
+
+
+class DBPipeline:
+    """
+    Background thread that writes new points into the database and fetches the calculated ones,
+    so that the coordinator does not wait for the database round trips
+    """
+
+    def __init__(self, db_manager: DBManager, poll_interval: float = 0.01):
+        """
+        Constructor of the DBPipeline class
+
+        :param db_manager: database manager of the solved task.
+        :param poll_interval: pause in seconds between requests when there is nothing to write or read.
+        """
+        self.db = db_manager
+        self.poll_interval = poll_interval
+        self.points_to_write: queue.Queue = queue.Queue()
+        self.progress_to_write: queue.Queue = queue.Queue()
+        self.calculated_points: queue.Queue = queue.Queue()
+        self.oldpoints: Dict[int, SearchDataItem] = {}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        # момент времени (time.monotonic), после которого ожидание вычисленных точек прекращается
+        self.deadline: float | None = None
+        self.error: Exception | None = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def adopt_point(self, oldpoint: SearchDataItem, db_newpoint_id: int) -> None:
+        """
+        Take a point that is already stored in the database (e.g. by a previous run) as in-flight one
+        """
+        with self.lock:
+            self.oldpoints[db_newpoint_id] = oldpoint
+
+    def give_point(self, newpoint: SearchDataItem, oldpoint: SearchDataItem) -> None:
+        oldpoint.blocked = True
+        self.points_to_write.put_nowait((newpoint, oldpoint))
+
+    def give_progress(self, progress: Dict[str, float | int | None]) -> None:
+        self.progress_to_write.put_nowait(progress)
+
+    def run(self) -> None:
+        try:
+            while not self.stop_event.is_set():
+                written = self._write_points()
+                self._write_progress()
+                calculated = self.db.get_all_calculated_points()
+                for newpoint, db_newpoint_id in calculated:
+                    with self.lock:
+                        oldpoint = self.oldpoints.pop(db_newpoint_id, None)
+                    self.calculated_points.put_nowait((newpoint, oldpoint))
+                if not written and not calculated:
+                    self.stop_event.wait(self.poll_interval)
+        except Exception as error:
+            self.error = error
+
+    def _write_points(self) -> int:
+        points = []
+        while True:
+            try:
+                points.append(self.points_to_write.get_nowait())
+            except queue.Empty:
+                break
+        if points:
+            db_ids = self.db.set_points_to_calculate([newpoint for newpoint, _ in points])
+            with self.lock:
+                for db_newpoint_id, (_, oldpoint) in zip(db_ids, points):
+                    self.oldpoints[db_newpoint_id] = oldpoint
+        return len(points)
+
+    def _write_progress(self) -> None:
+        while not self.progress_to_write.empty():
+            self.db.add_task_progress(**self.progress_to_write.get_nowait())
+
+    def take_list_of_calculated_points(
+        self, block: bool = True
+    ) -> List[Tuple[SearchDataItem, SearchDataItem | None]]:
+        """
+        Take the calculated points fetched from the database
+
+        :param block: wait until at least one point is calculated or the deadline has passed.
+        :return: list of pairs (new point, old point); the old point is None
+            if the new point was not given through this pipeline.
+        """
+        list_points = []
+        while block and not list_points and (self.deadline is None or time.monotonic() < self.deadline):
+            if self.error is not None:
+                raise self.error
+            try:
+                list_points.append(self.calculated_points.get(timeout=self.poll_interval))
+            except queue.Empty:
+                pass
+        while not self.calculated_points.empty():
+            list_points.append(self.calculated_points.get_nowait())
+        return list_points
+
+    def stop(self) -> List[Tuple[SearchDataItem, SearchDataItem | None]]:
+        self.stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join()
+        self._write_progress()
+        return self.take_list_of_calculated_points(block=False)
+
+
+class AsyncDBProcess(DBProcess):
+    """
+    Coordinator that overlaps the database writes and reads with the computation of new points:
+    the points are passed to a DBPipeline and the method continues while they are written
+    """
+
+    def __init__(
+        self,
+        parameters: SolverParameters,
+        task: OptimizationTask,
+        evolvent: Evolvent,
+        search_data: SearchData,
+        method: Method,
+        listeners: List[Listener],
+        db_manager: DBManager,
+    ):
+        super().__init__(parameters, task, evolvent, search_data, method, listeners, db_manager)
+        self.pipeline = DBPipeline(db_manager)
+        self.in_flight = 0
+
+    def renew_search_data(self, calculated_points: List[Tuple[SearchDataItem, SearchDataItem | None]]
+                          ) -> List[SearchDataItem]:
+        done_trials = []
+        for newpoint, oldpoint in calculated_points:
+            if oldpoint is None:
+                oldpoint = self.search_data.find_data_item_by_one_dimensional_point(newpoint.get_x())
+            oldpoint.blocked = False
+            self.method.update_optimum(newpoint)
+            self.method.renew_search_data(newpoint, oldpoint)
+            self.method.finalize_iteration()
+            done_trials.append(newpoint)
+        self.in_flight -= len(calculated_points)
+        return done_trials
+
+    def start_deadline(self) -> None:
+        super().start_deadline()
+        self.pipeline.deadline = self.method.deadline
+
+    def write_progress(self, iteration_time: float) -> None:
+        if self.parameters.db_task_progress:
+            self.pipeline.give_progress(self.get_progress(iteration_time))
+
+    def do_global_iteration(self, number: int = 1):
+        start_time = time.perf_counter()
+        done_trials = []
+        if self._first_iteration is True:
+            for listener in self._listeners:
+                listener.before_method_start(self.method)
+            done_trials = self.restore_search_data()
+            if not done_trials:
+                done_trials = self.method.first_iteration()
+            # точки, поставленные в очередь предыдущим запуском, передаются конвейеру
+            for db_newpoint_id, oldpoint in self.waiting_oldpoints.items():
+                self.pipeline.adopt_point(oldpoint, db_newpoint_id)
+            self.in_flight = len(self.waiting_oldpoints)
+            self.waiting_oldpoints = {}
+            self.pipeline.start()
+            self._first_iteration = False
+        else:
+            for _ in range(self.parameters.number_of_parallel_points - self.in_flight):
+                newpoint, oldpoint = self.method.calculate_iteration_point()
+                self.pipeline.give_point(newpoint, oldpoint)
+                self.in_flight += 1
+
+            done_trials = self.renew_search_data(self.pipeline.take_list_of_calculated_points())
+
+        self.write_progress(time.perf_counter() - start_time)
         for listener in self._listeners:
             listener.on_end_iteration(done_trials, self.get_results())
 
     def solve(self) -> Solution:
+        self.start_deadline()
         start_time = datetime.now()
 
         try:
@@ -76,6 +336,8 @@ class DBProcess(Process):
             print("Exception was thrown")
             print(traceback.format_exc())
 
+        self.renew_search_data(self.pipeline.stop())
+
         if self.parameters.refine_solution:
             self.do_local_refinement(self.parameters.local_method_iteration_count)
 
@@ -117,3 +379,108 @@ class DBProcessWorker(Process):
         while self.db.is_task_solving():
             self.do_global_iteration()
         return self.get_results()
+
+
+class SchedulingPolicy(enum.Enum):
+    ROUND_ROBIN = "round_robin"
+    PRIORITY = "priority"
+    OLDEST_WAITING = "oldest_waiting"
+
+
+class DBMultiTaskWorker:
+    """
+    The DBMultiTaskWorker class calculates points of all tasks in the SOLVING state,
+    so one pool of workers serves every active task stored in the database
+    """
+
+    def __init__(
+        self,
+        db_manager: DBManager,
+        problems: Dict[str, Problem],
+        policy: SchedulingPolicy = SchedulingPolicy.ROUND_ROBIN,
+        wait_for_tasks: bool = False,
+        poll_interval: float = 0.1,
+    ):
+        """
+        Constructor of the DBMultiTaskWorker class
+
+        :param db_manager: connection to the database with tasks.
+        :param problems: registry of problems, the key is the name of the task.
+        :param policy: the order in which the tasks are served: round-robin, by the priority of the task
+               or the point waiting the longest first.
+        :param wait_for_tasks: if True, the worker does not exit when there are no tasks to solve.
+        :param poll_interval: pause in seconds when there are no points to calculate.
+        """
+        self.db = db_manager
+        self.problems = problems
+        self.policy = policy
+        self.wait_for_tasks = wait_for_tasks
+        self.poll_interval = poll_interval
+        self.last_task_id = -1
+        self._evaluate_methods: Dict[str, ICriterionEvaluateMethod] = {}
+
+    def get_evaluate_method(self, task_name: str) -> ICriterionEvaluateMethod:
+        if task_name not in self._evaluate_methods:
+            from iOpt.method.solverFactory import SolverFactory
+            problem = self.problems[task_name]
+            # задача создается по параметрам, с которыми ее решает координатор
+            stored_parameters = self.db.get_task_parameters(task_name)
+            parameters = SolverParameters() if stored_parameters is None \
+                else SolverFactory.get_solver_parameters(stored_parameters)
+            task = SolverFactory.create_task(problem, parameters)
+            self._evaluate_methods[task_name] = SolverFactory.create_evaluate_method(task)
+        return self._evaluate_methods[task_name]
+
+    @staticmethod
+    def get_number_of_functions(problem: Problem) -> int:
+        return problem.number_of_objectives + problem.number_of_constraints
+
+    def get_tasks_in_order(self, tasks: List[tuple]) -> List[tuple]:
+        if self.policy == SchedulingPolicy.PRIORITY:
+            return sorted(tasks, key=lambda task: (-task[2], task[0]))
+        # round-robin: начинаем с задачи, следующей за последней обслуженной
+        position = next((i for i, task in enumerate(tasks) if task[0] > self.last_task_id), 0)
+        return tasks[position:] + tasks[:position]
+
+    def take_point(self, tasks: List[tuple]):
+        if self.policy == SchedulingPolicy.OLDEST_WAITING:
+            names = {task_id: name for task_id, name, _ in tasks}
+            n_funcs = {task_id: self.get_number_of_functions(self.problems[name]) for task_id, name in names.items()}
+            point, db_point_id, task_id = self.db.get_oldest_point_to_calculate(n_funcs)
+            if point is None:
+                return None, None, None
+            self.last_task_id = task_id
+            return point, db_point_id, names[task_id]
+
+        for task_id, name, _ in self.get_tasks_in_order(tasks):
+            point, db_point_id = self.db.get_point_to_calculate(
+                self.get_number_of_functions(self.problems[name]), task_id
+            )
+            if point is not None:
+                self.last_task_id = task_id
+                return point, db_point_id, name
+        return None, None, None
+
+    def do_global_iteration(self) -> bool:
+        """
+        Calculate one point of one of the solving tasks
+
+        :return: False if there are no tasks to solve, True otherwise.
+        """
+        tasks = [task for task in self.db.get_solving_tasks() if task[1] in self.problems]
+        if not tasks:
+            return False
+        point, db_point_id, name = self.take_point(tasks)
+        if point is None:
+            time.sleep(self.poll_interval)
+        else:
+            self.get_evaluate_method(name).calculate_functionals(point)
+            self.db.set_calculated_point(point, db_point_id)
+        return True
+
+    def solve(self) -> None:
+        while True:
+            if not self.do_global_iteration():
+                if not self.wait_for_tasks:
+                    break
+                time.sleep(self.poll_interval)
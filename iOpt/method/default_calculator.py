@@ -5,6 +5,7 @@ from iOpt.method.search_data import SearchDataItem
 from iOpt.solver_parametrs import SolverParameters
 
 import sys
+from time import process_time
 
 
 class DefaultCalculator:
@@ -20,6 +21,8 @@ class DefaultCalculator:
         """
         self.evaluate_method = evaluate_method
         self.parameters = parameters
+        # последовательное испытание не прерывается, срок проверяется между итерациями
+        self.deadline: float | None = None
 
     def calculate_functionals_for_items(self, points: list[SearchDataItem]) -> list[SearchDataItem]:
         r"""
@@ -28,10 +31,12 @@ class DefaultCalculator:
         :param points: точки проведения испытаний
         """
         for point in points:
+            start = process_time()
             try:
                 self.evaluate_method.calculate_functionals(point)
             except Exception:
                 point.set_z(sys.float_info.max)
                 point.set_index(-10)
+            point.evaluation_time = process_time() - start
 
         return points
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+
+from iOpt.method.checkpoint import searchdata_to_arrays
+
+
+def searchdata_to_columns(process) -> dict[str, np.ndarray]:
+    """
+    Get a columnar view of the trials: one typed column for each float variable, discrete variable
+      and functional, plus the service columns x, index, z, iteration and creation_time.
+      The values of the functionals not calculated in a trial are NaN
+
+    :param process: process whose search information is converted.
+    :return: dictionary of columns in the order of the table.
+    """
+    arrays = searchdata_to_arrays(process)
+    problem = process.search_data.solution.problem
+
+    columns = {'x': arrays['x']}
+    names = _column_names(problem.float_variable_names, problem.number_of_float_variables, 'float_variable', columns)
+    for i, name in enumerate(names):
+        columns[name] = arrays['float_variables'][:, i]
+    names = _column_names(problem.discrete_variable_names, problem.number_of_discrete_variables,
+                          'discrete_variable', columns)
+    for i, name in enumerate(names):
+        columns[name] = arrays['discrete_variables'][:, i]
+
+    # столбцы функционалов идут в порядке их вычисления: ограничения 0..k-1, затем критерии;
+    # типы и номера берутся из задачи, а не из испытаний, где невычисленные значения имеют тип по умолчанию
+    number_of_constraints = problem.number_of_constraints
+    number_of_functions = number_of_constraints + problem.number_of_objectives
+    function_values = np.full((len(arrays['x']), number_of_functions), np.nan, dtype=np.double)
+    stored = min(number_of_functions, arrays['function_values'].shape[1])
+    function_values[:, :stored] = arrays['function_values'][:, :stored]
+    number = np.arange(number_of_functions)
+    is_objective = number >= number_of_constraints
+    index = arrays['index'][:, np.newaxis]
+    # ограничения вычисляются до первого нарушенного, критерии - только если все ограничения выполнены
+    calculated = np.where(is_objective, index >= number_of_constraints, number <= index)
+    function_values[~calculated] = np.nan
+    for j in number:
+        name = f"objective_{j - number_of_constraints}" if is_objective[j] else f"constraint_{j}"
+        columns[name] = function_values[:, j]
+
+    columns['index'] = arrays['index']
+    columns['z'] = arrays['z']
+    columns['iteration'] = arrays['iteration']
+    columns['creation_time'] = arrays['creation_time']
+    return columns
+
+
+def export_trials(process, file_name: str, format: str = 'parquet') -> None:
+    """
+    Write the trials into a Parquet file or an Arrow IPC (Feather) file
+
+    :param process: process whose trials are exported.
+    :param file_name: file name.
+    :param format: 'parquet' or 'arrow'.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise Exception("Export of the trials requires the pyarrow package: pip install iOpt[parquet]")
+
+    table = pa.table(searchdata_to_columns(process))
+    if format == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, file_name)
+    elif format == 'arrow':
+        import pyarrow.feather as feather
+        # без сжатия, чтобы файл можно было отобразить в память при чтении
+        feather.write_feather(table, file_name, compression='uncompressed')
+    else:
+        raise Exception(f"Unknown export format: {format}")
+
+
+def _column_names(names, number: int, default_prefix: str, columns: dict) -> list[str]:
+    # имена переменных задачи используются, если они заданы и не совпадают с другими столбцами
+    names = [str(name) for name in names]
+    if len(names) != number or '' in names or len(set(names)) != number or set(names) & set(columns):
+        names = [f"{default_prefix}_{i}" for i in range(number)]
+    return names
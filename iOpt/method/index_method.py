@@ -53,7 +53,7 @@ class IndexMethod(Method):
                 other_point = other_point.get_left()
             if other_point is not None and other_point.get_index() >= 0:
                 # print(index)
-                m = abs(other_point.function_values[index].value - curr_point.get_z()) / \
+                m = abs(self.get_function_value(other_point, index) - curr_point.get_z()) / \
                     self.calculate_delta(other_point, curr_point, self.dimension)
             # Ищем справа
             other_point = left_point.get_right()
@@ -62,12 +62,12 @@ class IndexMethod(Method):
             while (other_point is not None) and (other_point.get_index() < curr_point.get_index()):
                 other_point = other_point.get_right()
             if other_point is not None and other_point.get_index() >= 0:
-                m = max(m, abs(curr_point.get_z() - other_point.function_values[index].value) / \
+                m = max(m, abs(curr_point.get_z() - self.get_function_value(other_point, index)) / \
                         self.calculate_delta(curr_point, other_point, self.dimension))
 
         if m > self.M[index] or (self.M[index] == 1.0 and m > 1e-12):
             self.M[index] = m
-            self.recalcR = True
+            self.estimates_changed()
 
     def calculate_global_r(self, curr_point: SearchDataItem, left_point: SearchDataItem) -> None:
         r"""
@@ -83,35 +83,58 @@ class IndexMethod(Method):
             raise Exception("calculate_global_r: Curr point is NONE")
         if left_point is None:
             curr_point.globalR = -np.infty
+            curr_point.localR = -np.infty
             return None
         zl = left_point.get_z()
         zr = curr_point.get_z()
-        r = self.parameters.r
+        r = self.r
         deltax = curr_point.delta
+        M, Z = self.get_characteristic_estimates()
 
         if left_point.get_index() < 0 and curr_point.get_index() < 0:
-            global_r = 2 * deltax - 4 * math.fabs(self.Z[0]) / (r * self.M[0])
+            global_r = 2 * deltax - 4 * math.fabs(Z[0]) / (r * M[0])
         elif left_point.get_index() == curr_point.get_index():
             v = curr_point.get_index()
-            global_r = deltax + (zr - zl) * (zr - zl) / (deltax * self.M[v] * self.M[v] * r * r) - \
-                       2 * (zr + zl - 2 * self.Z[v]) / (r * self.M[v])
+            m = self.calculate_local_m(curr_point, left_point, M)
+            global_r = deltax + (zr - zl) * (zr - zl) / (deltax * m * m * r * r) - \
+                       2 * (zr + zl - 2 * Z[v]) / (r * m)
         elif left_point.get_index() < curr_point.get_index():
             v = curr_point.get_index()
-            global_r = 2 * deltax - 4 * (zr - self.Z[v]) / (r * self.M[v])
+            global_r = 2 * deltax - 4 * (zr - Z[v]) / (r * M[v])
         else:
             v = left_point.get_index()
-            global_r = 2 * deltax - 4 * (zl - self.Z[v]) / (r * self.M[v])
+            global_r = 2 * deltax - 4 * (zl - Z[v]) / (r * M[v])
         curr_point.globalR = global_r
+        self.calculate_local_r(curr_point, left_point)
+
+    def get_function_value(self, point: SearchDataItem, index: int) -> float:
+        r"""
+        Get the value of the functional with a given index calculated at a point
+
+        :param point: point of a trial with an index not less than the given one.
+        :param index: index of the functional.
+        :return: value of the functional.
+        """
+        return point.function_values[self.task.perm[index]].value
+
+    def get_index_threshold(self, index: int) -> float:
+        r"""
+        Get the threshold the functional should not exceed for the trial to go to the next index
+
+        :param index: index of the functional.
+        :return: 0 for the constraints.
+        """
+        return 0.0
 
     def update_z(self, point: SearchDataItem) -> None:
         for i in range(point.get_index()):
             if self.Z[i] > point.function_values[i].value:
                 self.Z[i] = point.function_values[i].value
-                self.recalcR = True
+                self.estimates_changed()
 
     def recalc_all_characteristics(self) -> None:
         for i in range(self.best.get_index()):
-            self.Z[i] = -self.M[i] * self.parameters.eps_r
+            self.Z[i] = self.get_index_threshold(i) - self.M[i] * self.parameters.eps_r
         self.Z[self.best.get_index()] = self.best.get_z()
         super().recalc_all_characteristics()
 
@@ -121,11 +144,13 @@ class IndexMethod(Method):
 
         :param point: the point of a new trial.
         """
-
+        self.account_evaluation_time(point)
+        if point.approximate:
+            return
         if self.best is None or self.best.get_index() < point.get_index() or (
                 self.best.get_index() == point.get_index() and point.get_z() < self.best.get_z()):
             self.best = point
-            self.recalcR = True
             self.Z[point.get_index()] = point.get_z()
+            self.estimates_changed()
         # self.UpdateZ(point)
         self.search_data.solution.best_trials[0] = self.best
@@ -53,5 +53,6 @@ class IndexMethodEvaluate(ICriterionEvaluateMethod):
         """
 
         dist_point.function_values = copy.deepcopy(src_point.function_values)
+        dist_point.evaluation_time = src_point.evaluation_time
         dist_point.set_z(src_point.get_z())
         dist_point.set_index(src_point.get_index())
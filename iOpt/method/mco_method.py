@@ -74,11 +74,14 @@ class MCOMethod(MixedIntegerMethod):
 
         :param point: new trial point.
         """
+        self.account_evaluation_time(point)
+        if point.approximate:
+            return
         if self.best is None or self.best.get_index() < point.get_index() or (
                 self.best.get_index() == point.get_index() and point.get_z() < self.best.get_z()):
             self.best = point
-            self.recalcR = True
             self.Z[point.get_index()] = point.get_z()
+            self.estimates_changed()
 
         if not self.search_data.solution.best_trials[0].point:
             self.search_data.solution.best_trials[0] = self.best
@@ -87,6 +90,14 @@ class MCOMethod(MixedIntegerMethod):
             self.update_min_max_value(point)
             self.pareto_set_update(point)
 
+    def update_optimum_by_items(self, items: list[SearchDataItem]) -> None:
+        # множество Парето обновляется последовательно
+        for item in items:
+            if item.get_index() >= 0:
+                self.update_optimum(item)
+            else:
+                self.account_evaluation_time(item)
+
     def pareto_set_update(self, point: SearchDataItem) -> None:
         if self.search_data.get_count() == 0:
             return
@@ -158,19 +169,21 @@ class MCOMethod(MixedIntegerMethod):
                     self.task.max_value[i] = data_item.function_values[i].value
                     self.is_recalc_all_convolution = True
 
-    def check_stop_condition(self) -> bool:
+    def get_stop_reason(self) -> str | None:
         r"""
-        Checking the stopping condition.
-        The algorithm must terminate when the eps accuracy is reached or the iteration limit is exceeded.
+        Find the stop criterion met.
+        The algorithm must terminate when the eps accuracy is reached, the iteration limit for the convolution
+        is exceeded, the deadline has passed or any of the additional stop criteria is met.
 
-        :return: True if the stopping criterion is met; False - otherwise.
+        :return: name of the criterion, None if the search should go on.
         """
-        if self.min_delta < self.parameters.eps or self.iterations_count >= self.max_iter_for_convolution:
-            self.stop = True
-        else:
-            self.stop = False
-
-        return self.stop
+        if self.min_delta < self.parameters.eps:
+            return 'accuracy'
+        if self.iterations_count >= self.max_iter_for_convolution:
+            return 'iterations'
+        if self.is_deadline_reached():
+            return 'timeout'
+        return self.get_met_stop_criterion()
 
     def calculate_m(self, curr_point: SearchDataItem, left_point: SearchDataItem) -> None:
         r"""
@@ -220,4 +233,4 @@ class MCOMethod(MixedIntegerMethod):
 
         if m > self.M[index] or (self.M[index] == 1.0 and m > 1e-12):
             self.M[index] = m
-            self.recalcR = True
+            self.estimates_changed()
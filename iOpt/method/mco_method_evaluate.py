@@ -56,6 +56,7 @@ class MCOMethodEvaluate(IndexMethodEvaluate):
         """
 
         dist_point.function_values = copy.deepcopy(src_point.function_values)
+        dist_point.evaluation_time = src_point.evaluation_time
         dist_point.set_index(src_point.get_index())
         self.update_min_max_value(src_point)
         if dist_point.get_index() == self.task.problem.number_of_constraints:
@@ -39,7 +39,9 @@ class MCOMethodManyLambdas(MCOMethod):
         self.init_lambdas()
 
     def check_stop_condition(self) -> bool:
-        if super().check_stop_condition():
+        # следующая свертка, только если остановлен поиск по текущей; время и критерии пользователя общие
+        if super().check_stop_condition() and not self.is_deadline_reached() and \
+                self.search_data.solution.stop_reason in ('accuracy', 'iterations'):
             if self.current_num_lambda < self.number_of_lambdas:
                 self.change_lambdas()
         return super().check_stop_condition()
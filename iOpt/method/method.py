@@ -3,20 +3,25 @@ from __future__ import annotations
 import copy
 import math
 import sys
+import warnings
 from typing import Tuple
-from time import time
+from time import time, monotonic
 
 import numpy as np
+from scipy.stats import qmc
 
 from iOpt.evolvent.evolvent import Evolvent
+from iOpt.method.adaptive_reliability import AdaptiveReliability
 from iOpt.method.calculator import Calculator
 from iOpt.method.default_calculator import DefaultCalculator
 from iOpt.method.index_method_evaluate import IndexMethodEvaluate
 from iOpt.method.optim_task import OptimizationTask
-from iOpt.method.search_data import SearchData
+from iOpt.method.search_data import SearchData, SearchDataDualQueue
 from iOpt.method.search_data import SearchDataItem
+from iOpt.method.stop_criteria import StopCriterion, create_stop_criteria
+from iOpt.method.surrogate import SurrogateScreening
 from iOpt.solver_parametrs import SolverParameters
-from iOpt.trial import Point, FunctionValue
+from iOpt.trial import Point, FunctionValue, FunctionType
 
 
 class Method:
@@ -46,6 +51,14 @@ class Method:
         self.recalcM: bool = True
         self.iterations_count: int = 0
         self.best: SearchDataItem = None
+        # момент времени (time.monotonic), после которого поиск останавливается
+        self.deadline: float | None = None
+        # смешанная схема: число глобальных итераций между локальными, меняется по ходу поиска
+        self.local_period: int = parameters.mixed_local_period
+        self._iterations_since_local: int = 0
+        self._best_at_local: tuple | None = None
+        # наибольшая длина интервала для локальной настройки, обновляется при пересчете всех характеристик
+        self.max_delta: float = 0.0
 
         self.parameters = parameters
         self.task = task
@@ -54,7 +67,26 @@ class Method:
 
         self.M = [1.0 for _ in range(1 + task.problem.number_of_constraints)]
         self.Z = [np.infty for _ in range(1 + task.problem.number_of_constraints)]
+        # оценки, с которыми вычислены характеристики в очереди (при отложенном пересчете)
+        self.M_used = list(self.M)
+        self.Z_used = list(self.Z)
+        self.full_recalc_count: int = 0
         self.dimension = task.problem.number_of_float_variables
+        # отсев точек по суррогату: число точек с приближенными значениями и число уточненных из них
+        self.surrogate: SurrogateScreening | None = None
+        if parameters.surrogate_screening:
+            self.surrogate = SurrogateScreening(self.dimension, parameters.surrogate_kappa,
+                                                parameters.surrogate_neighbors)
+        self.screened_trials_count: int = 0
+        self.reevaluated_trials_count: int = 0
+        # дополнительные критерии остановки, поиск останавливается при выполнении любого из них
+        self.stop_criteria: list[StopCriterion] = create_stop_criteria(parameters, task.problem)
+        # параметр надежности: постоянный или изменяемый по ходу поиска
+        self.reliability: AdaptiveReliability | None = None
+        if parameters.adaptive_r:
+            r_max = parameters.adaptive_r_max if parameters.adaptive_r_max > 0 else 2 * parameters.r
+            period = parameters.adaptive_r_period if parameters.adaptive_r_period > 0 else 10 * (self.dimension + 1)
+            self.reliability = AdaptiveReliability(parameters.r, r_max, period)
         self.search_data.solution.solution_accuracy = np.infty
         self.numberOfAllFunctions = task.problem.number_of_objectives + task.problem.number_of_constraints
 
@@ -63,6 +95,13 @@ class Method:
         else:
             self.calculator = calculator
 
+    @property
+    def r(self) -> float:
+        r"""
+        The reliability parameter the characteristics are calculated with
+        """
+        return self.parameters.r if self.reliability is None else self.reliability.r
+
     @property
     def min_delta(self):
         return self.search_data.solution.solution_accuracy
@@ -96,50 +135,22 @@ class Method:
         right = SearchDataItem(Point(self.evolvent.get_image(1.0), None), 1.0,
                                function_values=[FunctionValue()] * self.numberOfAllFunctions)
 
-        items: list[SearchDataItem] = []
-
+        initial_points = list(self.parameters.initial_points)
         if self.parameters.start_point:
-            number_of_point: int = self.parameters.number_of_parallel_points - 1
-            h: float = 1.0 / (number_of_point + 1)
-
-            ystart_point = Point(copy.copy(self.parameters.start_point.float_variables), None)
-            xstart_point = self.evolvent.get_inverse_image(self.parameters.start_point.float_variables)
-
-            itemstart_point = SearchDataItem(ystart_point, xstart_point,
-                                             function_values=[FunctionValue()] * self.numberOfAllFunctions)
-
-            is_add_start_point: bool = False
-
-            for i in range(number_of_point):
-                x = h * (i + 1)
-                y = Point(self.evolvent.get_image(x))
-                item = SearchDataItem(y, x,
-                                      function_values=[FunctionValue()] * self.numberOfAllFunctions)
-                if x < xstart_point < h * (i + 2):
-                    items.append(item)
-                    items.append(itemstart_point)
-                    is_add_start_point = True
-                else:
-                    items.append(item)
-
-            if not is_add_start_point:
-                items.append(itemstart_point)
-        else:
-
-            number_of_point: int = self.parameters.number_of_parallel_points
-            h: float = 1.0 / (number_of_point + 1)
-
-            for i in range(number_of_point):
-                x = h * (i + 1)
-                y = Point(self.evolvent.get_image(x))
-                item = SearchDataItem(y, x,
-                                      function_values=[FunctionValue()] * self.numberOfAllFunctions)
-                items.append(item)
+            initial_points.insert(0, self.parameters.start_point)
+        items = [SearchDataItem(Point(y, None), x, function_values=[FunctionValue()] * self.numberOfAllFunctions)
+                 for x, y in self.create_initial_design(self.get_initial_design_size() - len(initial_points))]
+        for point in initial_points:
+            items.append(SearchDataItem(Point(copy.copy(point.float_variables), None),
+                                        self.get_initial_point_x(point.float_variables),
+                                        function_values=[FunctionValue()] * self.numberOfAllFunctions))
+        items = self.sort_initial_items(items)
 
         self.calculator.calculate_functionals_for_items(items)
 
         for item in items:
             self.update_optimum(item)
+        self.add_surrogate_trials(items)
 
         left.delta = 0
         self.calculate_global_r(left, None)
@@ -169,20 +180,168 @@ class Method:
 
         return items
 
+    def get_initial_design_size(self) -> int:
+        r"""
+        Get the number of points of the first iteration
+
+        :return: initial_design_size or, if it is not set, number_of_parallel_points.
+        """
+        if self.parameters.initial_design_size > 0:
+            return self.parameters.initial_design_size
+        return self.parameters.number_of_parallel_points
+
+    def create_initial_design(self, number: int) -> list[tuple[float, np.ndarray]]:
+        r"""
+        Create the points of the initial design: uniform on the segment [0,1] of the evolvent or a Sobol, Halton
+          or Latin hypercube design in the search region mapped to [0,1] by the inverse evolvent
+
+        :param number: number of points.
+        :return: pairs of the point on [0,1] and the point of the search region.
+        """
+        if number <= 0:
+            return []
+        if self.parameters.initial_design == 'uniform':
+            h: float = 1.0 / (number + 1)
+            return [(h * (i + 1), self.evolvent.get_image(h * (i + 1))) for i in range(number)]
+
+        samplers = {'sobol': qmc.Sobol, 'halton': qmc.Halton, 'lhs': qmc.LatinHypercube}
+        # последовательность фиксирована, чтобы решение задачи было воспроизводимым
+        sampler = samplers[self.parameters.initial_design](d=self.dimension, seed=0)
+        with warnings.catch_warnings():
+            # для последовательности Соболя рекомендуется число точек, равное степени двойки
+            warnings.simplefilter('ignore', UserWarning)
+            sample = sampler.random(number)
+        sample = qmc.scale(sample, self.task.problem.lower_bound_of_float_variables,
+                           self.task.problem.upper_bound_of_float_variables)
+        return [(self.get_initial_point_x(y), y) for y in sample]
+
+    def get_initial_point_x(self, y) -> float:
+        r"""
+        Map a point of the search region to the interior of the segment [0,1]: the points mapped
+          to the ends of the segment are moved inside, the boundary points are not evaluated
+
+        :param y: point of the search region.
+        :return: point on the segment [0,1].
+        """
+        x = self.evolvent.get_inverse_image(np.asarray(y, dtype=np.double))
+        return min(max(x, 1e-12), 1.0 - 1e-12)
+
+    def get_trial_x(self, point: Point) -> tuple[float, int] | None:
+        r"""
+        Map a point of a trial performed outside the search (e.g. in a previous run) to the segment [0,1]
+
+        :param point: point of the trial.
+        :return: point on the segment [0,1] and the index of the discrete parameters,
+          None if the point lies outside the search region.
+        """
+        y = np.asarray(point.float_variables, dtype=np.double)
+        if y.shape != (self.dimension,) or \
+                np.any(y < np.asarray(self.task.problem.lower_bound_of_float_variables, dtype=np.double)) or \
+                np.any(y > np.asarray(self.task.problem.upper_bound_of_float_variables, dtype=np.double)):
+            return None
+        return self.get_initial_point_x(y), 0
+
+    @staticmethod
+    def sort_initial_items(items: list[SearchDataItem]) -> list[SearchDataItem]:
+        r"""
+        Sort the points of the first iteration, the points coinciding on [0,1] with a previous one are dropped
+
+        :param items: points of the first iteration.
+        :return: points in ascending order of x.
+        """
+        sorted_items: list[SearchDataItem] = []
+        for item in sorted(items, key=lambda item: item.get_x()):
+            if not sorted_items or item.get_x() > sorted_items[-1].get_x():
+                sorted_items.append(item)
+        return sorted_items
+
+    def create_boundary_items(self) -> list[SearchDataItem]:
+        r"""
+        Create the boundary points of the search interval [0,1], in which no trials are performed
+
+        :return: list of boundary points.
+        """
+        left = SearchDataItem(Point(self.evolvent.get_image(0.0), None), 0.,
+                              function_values=[FunctionValue()] * self.numberOfAllFunctions)
+        right = SearchDataItem(Point(self.evolvent.get_image(1.0), None), 1.0,
+                               function_values=[FunctionValue()] * self.numberOfAllFunctions)
+        return [left, right]
+
+    def restore_search_data(self, items: list[SearchDataItem]) -> None:
+        r"""
+        Rebuild the search information from already performed trials, e.g. stored in a database.
+        The intervals are linked in one pass, after that M, Z and the characteristics are recalculated once
+
+        :param items: points of the performed trials.
+        """
+        self.search_data.insert_data_items(self.create_boundary_items() + items)
+
+        sorted_items = list(self.search_data)
+        x = np.array([item.get_x() for item in sorted_items])
+        deltas = np.concatenate(([0.0], np.power(np.diff(x), 1.0 / self.dimension)))
+        for item, delta in zip(sorted_items, deltas.tolist()):
+            item.delta = delta
+
+        self.update_optimum_by_items(items)
+        self.add_surrogate_trials(items)
+
+        self.recalcM = True
+        self.recalcR = True
+        self.recalc_m()
+        self.recalc_all_characteristics()
+
+        self.iterations_count = len(items)
+        self.search_data.solution.number_of_global_trials = len(items)
+
     def check_stop_condition(self) -> bool:
         r"""
         Check the stop condition.
-        The algorithm should terminate when eps accuracy is reached or the iteration limit is exceeded
+        The algorithm should terminate when eps accuracy is reached, the iteration limit is exceeded,
+        the deadline has passed or any of the additional stop criteria is met.
+        The criterion met is saved in the stop_reason of the solution
 
         :return: True if the stop criterion is met; False otherwise.
         """
-        if self.min_delta < self.parameters.eps or self.iterations_count >= self.parameters.global_method_iteration_count:
-            self.stop = True
-        else:
-            self.stop = False
+        stop_reason = self.get_stop_reason()
+        self.stop = stop_reason is not None
+        if self.stop:
+            self.search_data.solution.stop_reason = stop_reason
 
         return self.stop
 
+    def get_stop_reason(self) -> str | None:
+        r"""
+        Find the stop criterion met
+
+        :return: name of the criterion, None if the search should go on.
+        """
+        if self.min_delta < self.parameters.eps:
+            return 'accuracy'
+        if self.iterations_count >= self.parameters.global_method_iteration_count:
+            return 'iterations'
+        if self.is_deadline_reached():
+            return 'timeout'
+        return self.get_met_stop_criterion()
+
+    def get_met_stop_criterion(self) -> str | None:
+        r"""
+        Find the additional stop criterion met
+
+        :return: name of the criterion, None if none of the criteria is met.
+        """
+        for criterion in self.stop_criteria:
+            if criterion.is_met(self):
+                return criterion.name
+        return None
+
+    def is_deadline_reached(self) -> bool:
+        """
+        Check whether the time limit of the search has expired
+
+        :return: True if the deadline is set and has passed.
+        """
+        return self.deadline is not None and monotonic() >= self.deadline
+
     def recalc_m(self) -> None:
         r"""
         Recalculate the estimate of the Lipschitz constant
@@ -199,11 +358,50 @@ class Method:
         """
         if self.recalcR is not True:
             return
+        if self.parameters.local_tuning:
+            self.max_delta = max(item.delta for item in self.search_data)
+        self.M_used = list(self.M)
+        self.Z_used = list(self.Z)
         self.search_data.clear_queue()
         for item in self.search_data:  # Должно работать...
             self.calculate_global_r(item, item.get_left())
         self.search_data.refill_queue()
         self.recalcR = False
+        self.full_recalc_count += 1
+
+    def get_characteristic_estimates(self) -> Tuple[list[float], list[float]]:
+        r"""
+        Get the estimates of the Holder constants and of the minimum values the characteristics are calculated with:
+          the current ones or, with the deferred recalculation (recalc_threshold > 0), the ones
+          of the last full recalculation, so all the characteristics in the queue are consistent
+
+        :return: the estimates M and Z.
+        """
+        if self.parameters.recalc_threshold > 0:
+            return self.M_used, self.Z_used
+        return self.M, self.Z
+
+    def estimates_changed(self) -> None:
+        r"""
+        Request the full recalculation of the characteristics after an estimate M or Z has changed.
+          With recalc_threshold = :math:`\theta > 0` it is deferred while for every index
+          :math:`M_{used} / (1 + \theta) \le M \le (1 + \theta) M_{used}`
+          and :math:`4 (Z_{used} - Z) / (r M_{used}) \le \theta \delta_{min}`.
+          Until then the characteristics are those of the algorithm with the reliability parameter
+          :math:`r M_{used} / M \in [r / (1 + \theta), r (1 + \theta)]`, and the characteristics of the intervals of one index
+          are shifted by the same value not greater than :math:`\theta \delta_{min}`, so the choice among them
+          is not affected by Z
+        """
+        theta = self.parameters.recalc_threshold
+        if theta <= 0:
+            self.recalcR = True
+            return
+        r = self.r
+        for m, z, m_used, z_used in zip(self.M, self.Z, self.M_used, self.Z_used):
+            if not m_used / (1 + theta) <= m <= (1 + theta) * m_used or (z < z_used and (np.isinf(z_used) or
+                                                         4 * (z_used - z) / (r * m_used) > theta * self.min_delta)):
+                self.recalcR = True
+                return
 
     def calculate_next_point_coordinate(self, point: SearchDataItem) -> float:
         r"""
@@ -230,7 +428,8 @@ class Method:
                 dg = 1.0
 
             x = 0.5 * (xl + xr)
-            x -= 0.5 * dg * pow(abs(dif) / self.M[v], self.task.problem.number_of_float_variables) / self.parameters.r
+            m = self.calculate_local_m(point, left)
+            x -= 0.5 * dg * pow(abs(dif) / m, self.task.problem.number_of_float_variables) / self.r
 
         else:
             x = 0.5 * (xl + xr)
@@ -251,8 +450,8 @@ class Method:
         if self.recalcR is True:
             self.recalc_all_characteristics()
 
-        old = self.search_data.get_data_item_with_max_global_r()
-        self.min_delta = min(old.delta, self.min_delta)
+        old = self.select_interval()
+        old = self.reevaluate_relevant_items(old)
         newx = self.calculate_next_point_coordinate(old)
         newy = self.evolvent.get_image(newx)
         new = copy.deepcopy(SearchDataItem(Point(newy, []), newx,
@@ -263,12 +462,80 @@ class Method:
 
         return new, old
 
+    def select_interval(self) -> SearchDataItem:
+        r"""
+        Choose the interval of a new trial by the global characteristic or, on the local iterations
+          of the mixed scheme, by the local one. The accuracy is updated on the global iterations only
+
+        :return: interval given by its right point.
+        """
+        if self.is_local_iteration():
+            old = self.search_data.get_data_item_with_max_local_r()
+        else:
+            old = self.search_data.get_data_item_with_max_global_r()
+            self.min_delta = min(old.delta, self.min_delta)
+        if isinstance(self.search_data, SearchDataDualQueue):
+            # записи интервала в другой очереди устаревают, пока его характеристики не пересчитаны
+            old.globalR = -np.infty
+            old.localR = -np.infty
+        return old
+
+    def is_local_iteration(self) -> bool:
+        r"""
+        Check whether the next iteration of the mixed scheme is local. A local iteration follows every
+          local_period global ones; the period is halved if the optimum estimate has improved since the previous
+          local iteration and grows by one otherwise (up to four times mixed_local_period)
+
+        :return: True if the interval is chosen by the local characteristic.
+        """
+        if self.local_period <= 0 or self.best is None:
+            return False
+        if self._iterations_since_local < self.local_period:
+            self._iterations_since_local += 1
+            return False
+
+        self._iterations_since_local = 0
+        best = (self.best.get_index(), -self.best.get_z())
+        if self._best_at_local is not None:
+            if best > self._best_at_local:
+                self.local_period = max(self.local_period // 2, 1)
+            else:
+                self.local_period = min(self.local_period + 1, 4 * self.parameters.mixed_local_period)
+        self._best_at_local = best
+        return True
+
     def calculate_functionals(self, point: SearchDataItem) -> SearchDataItem:
         r"""
         Perform a search trial at a given point
 
         :param point: the point at which the trial is to be performed.
 
+        :return: the point at which the trial results are saved.
+        """
+        if self.surrogate is None:
+            return self.evaluate_trial(point)
+
+        prediction = self.surrogate.predict(point.get_y().float_variables)
+        if self.best is not None and self.surrogate.is_unpromising(prediction, self.best.get_z()):
+            # точка заведомо хуже лучшей: вместо испытания - значение суррогата
+            point.function_values[0] = FunctionValue(FunctionType.OBJECTIV, 0, prediction)
+            point.set_z(prediction)
+            point.set_index(0)
+            point.approximate = True
+            self.screened_trials_count += 1
+            return point
+
+        self.evaluate_trial(point)
+        if point.get_index() >= 0:
+            self.surrogate.add_trial(point.get_y().float_variables, point.get_z(), prediction)
+        return point
+
+    def evaluate_trial(self, point: SearchDataItem) -> SearchDataItem:
+        r"""
+        Perform a search trial at a given point without the surrogate screening
+
+        :param point: the point at which the trial is to be performed.
+
         :return: the point at which the trial results are saved.
         """
         try:
@@ -279,6 +546,49 @@ class Method:
 
         return point
 
+    def add_surrogate_trials(self, items: list[SearchDataItem]) -> None:
+        r"""
+        Add the calculated trials performed outside calculate_functionals (e.g. at the first iteration) to the surrogate
+
+        :param items: points of the performed trials.
+        """
+        if self.surrogate is None:
+            return
+        for item in items:
+            if item.get_index() >= 0 and not item.approximate:
+                self.surrogate.add_trial(item.get_y().float_variables, item.get_z())
+
+    def reevaluate_relevant_items(self, old: SearchDataItem) -> SearchDataItem:
+        r"""
+        Perform the trials at the points with approximate values bounding the chosen interval.
+          The interval is chosen anew until it is bounded by calculated points only
+
+        :param old: chosen interval given by its right point.
+        :return: chosen interval given by its right point.
+        """
+        if self.surrogate is None:
+            return old
+        min_delta = self.min_delta
+        while True:
+            items = [item for item in (old.get_left(), old) if item is not None and item.approximate]
+            if not items:
+                return old
+            for item in items:
+                prediction = item.get_z()
+                item.approximate = False
+                self.evaluate_trial(item)
+                if item.get_index() >= 0:
+                    self.surrogate.add_trial(item.get_y().float_variables, item.get_z(), prediction)
+                self.reevaluated_trials_count += 1
+                self.update_optimum(item)
+            # точность не меняется: выбранный интервал мог быть выбран только из-за приближенного значения
+            self.min_delta = min_delta
+            self.recalcM = True
+            self.recalcR = True
+            self.recalc_m()
+            self.recalc_all_characteristics()
+            old = self.select_interval()
+
     def calculate_m(self, curr_point: SearchDataItem, left_point: SearchDataItem) -> None:
         r"""
         Calculate an estimate of the Gelder constant between curr_point and left_point
@@ -296,7 +606,7 @@ class Method:
             m = abs(left_point.get_z() - curr_point.get_z()) / curr_point.delta
             if m > self.M[index]:
                 self.M[index] = m
-                self.recalcR = True
+                self.estimates_changed()
 
     def calculate_global_r(self, curr_point: SearchDataItem, left_point: SearchDataItem) -> None:
         r"""
@@ -310,25 +620,102 @@ class Method:
             raise Exception("calculate_global_r: Curr point is NONE")
         if left_point is None:
             curr_point.globalR = -np.infty
+            curr_point.localR = -np.infty
             return None
         zl = left_point.get_z()
         zr = curr_point.get_z()
-        r = self.parameters.r
+        r = self.r
         deltax = curr_point.delta
+        M, Z = self.get_characteristic_estimates()
 
         if left_point.get_index() < 0 and curr_point.get_index() < 0:
-            global_r = 2 * deltax - 4 * math.fabs(self.Z[0]) / (r * self.M[0])
+            global_r = 2 * deltax - 4 * math.fabs(Z[0]) / (r * M[0])
         elif left_point.get_index() == curr_point.get_index():
             v = curr_point.get_index()
-            global_r = deltax + (zr - zl) * (zr - zl) / (deltax * self.M[v] * self.M[v] * r * r) - \
-                       2 * (zr + zl - 2 * self.Z[v]) / (r * self.M[v])
+            m = self.calculate_local_m(curr_point, left_point, M)
+            global_r = deltax + (zr - zl) * (zr - zl) / (deltax * m * m * r * r) - \
+                       2 * (zr + zl - 2 * Z[v]) / (r * m)
         elif left_point.get_index() < curr_point.get_index():
             v = curr_point.get_index()
-            global_r = 2 * deltax - 4 * (zr - self.Z[v]) / (r * self.M[v])
+            global_r = 2 * deltax - 4 * (zr - Z[v]) / (r * M[v])
         else:
             v = left_point.get_index()
-            global_r = 2 * deltax - 4 * (zl - self.Z[v]) / (r * self.M[v])
+            global_r = 2 * deltax - 4 * (zl - Z[v]) / (r * M[v])
         curr_point.globalR = global_r
+        self.calculate_local_r(curr_point, left_point)
+
+    def calculate_local_r(self, curr_point: SearchDataItem, left_point: SearchDataItem) -> None:
+        r"""
+        Calculate the local characteristic of an interval [left_point, curr_point] for the mixed scheme:
+          the global characteristic divided by :math:`\sqrt{(z_r - Z)(z_l - Z)}/M + 1.5^{-\alpha}`, so the intervals
+          with values close to the optimum estimate are preferred. Only the intervals with the same index
+          of the end points have it
+
+        :param curr_point: right interval point.
+        :param left_point: left interval point.
+        """
+        if self.parameters.mixed_local_period <= 0:
+            return
+        v = curr_point.get_index()
+        if left_point is None or left_point.get_index() != v or v < 0:
+            curr_point.localR = -np.infty
+            return
+        M, Z = self.get_characteristic_estimates()
+        distance = math.sqrt(max(curr_point.get_z() - Z[v], 0) * max(left_point.get_z() - Z[v], 0))
+        m = self.calculate_local_m(curr_point, left_point, M)
+        curr_point.localR = curr_point.globalR / (distance / m + pow(1.5, -self.parameters.mixed_local_alpha))
+
+    def calculate_local_m(self, curr_point: SearchDataItem, left_point: SearchDataItem,
+                          M: list[float] | None = None) -> float:
+        r"""
+        Get the estimate of the Holder constant for an interval [left_point, curr_point] whose end points have
+          the same index. Without the local tuning it is the global estimate M of the index. With the local tuning
+          it is the maximum of the slopes of the interval and its neighbours and of the global estimate multiplied
+          by the ratio of the interval length to the largest one
+
+        :param curr_point: right interval point.
+        :param left_point: left interval point.
+        :param M: global estimates of the Holder constants, by default the current ones.
+        :return: estimate of the Holder constant.
+        """
+        v = curr_point.get_index()
+        M = self.M if M is None else M
+        if not self.parameters.local_tuning:
+            return M[v]
+        slope = max(self.calculate_slope(left_point, left_point.get_left(), v),
+                    self.calculate_slope(curr_point, left_point, v),
+                    self.calculate_slope(curr_point.get_right(), curr_point, v))
+        global_part = M[v] * curr_point.delta / self.max_delta if self.max_delta > 0 else M[v]
+        return max(slope, global_part, 1e-12)
+
+    @staticmethod
+    def calculate_slope(curr_point: SearchDataItem, left_point: SearchDataItem, index: int) -> float:
+        r"""
+        Calculate the slope of the values of the index between the end points of an interval
+
+        :param curr_point: right interval point.
+        :param left_point: left interval point.
+        :param index: index of the functional.
+        :return: the slope, 0 if one of the points is absent or has another index.
+        """
+        if curr_point is None or left_point is None or curr_point.get_index() != index \
+                or left_point.get_index() != index or curr_point.delta <= 0:
+            return 0.0
+        return abs(curr_point.get_z() - left_point.get_z()) / curr_point.delta
+
+    def update_neighbour_characteristics(self, newpoint: SearchDataItem) -> None:
+        r"""
+        Recalculate the characteristics of the intervals near a new point after its insertion: with the local tuning
+          they depend on the slopes of the neighbouring intervals. The intervals with trials in progress
+          are recalculated when their trials are completed
+
+        :param newpoint: the inserted point.
+        """
+        oldpoint = newpoint.get_right()
+        for item in (newpoint.get_left(), newpoint, oldpoint, oldpoint.get_right()):
+            if item is not None and item.get_left() is not None and not item.blocked:
+                self.calculate_global_r(item, item.get_left())
+                self.search_data.update_characteristics(item)
 
     def renew_search_data(self, newpoint: SearchDataItem, oldpoint: SearchDataItem) -> None:
         """
@@ -349,6 +736,8 @@ a new point into the repository
         self.calculate_global_r(oldpoint, newpoint)
 
         self.search_data.insert_data_item(newpoint, oldpoint)
+        if self.parameters.local_tuning:
+            self.update_neighbour_characteristics(newpoint)
 
     def update_optimum(self, point: SearchDataItem) -> None:
         r"""
@@ -356,14 +745,55 @@ a new point into the repository
 
         :param point: point of a new trial.
         """
+        self.account_evaluation_time(point)
+        if point.approximate:
+            return
         if self.best is None or self.best.get_index() < point.get_index():
             self.best = point
-            self.recalcR = True
             self.Z[point.get_index()] = point.get_z()
+            self.estimates_changed()
         elif self.best.get_index() == point.get_index() and point.get_z() < self.best.get_z():
             self.best = point
-            self.recalcR = True
             self.Z[point.get_index()] = point.get_z()
+            self.estimates_changed()
+        self.search_data.solution.best_trials[0] = self.best
+
+    def account_evaluation_time(self, point: SearchDataItem) -> None:
+        r"""
+        Add the processor time of the calculations at a point of a new trial to the total time of the solution.
+          Every implementation of update_optimum should call it
+
+        :param point: point of a new trial.
+        """
+        self.search_data.solution.evaluation_time += point.evaluation_time
+
+    def update_optimum_by_items(self, items: list[SearchDataItem]) -> None:
+        r"""
+        Update the optimum estimate by a set of trials at once. The result is the same
+          as of update_optimum called for each trial in the given order
+
+        :param items: points of the performed trials.
+        """
+        for item in items:
+            self.account_evaluation_time(item)
+        items = [item for item in items if item.get_index() >= 0 and not item.approximate]
+        if not items:
+            return
+        index = np.array([item.get_index() for item in items])
+        z = np.array([item.get_z() for item in items])
+        best_index = -1 if self.best is None else self.best.get_index()
+        best_z = np.inf if self.best is None else self.best.get_z()
+
+        # испытание меняет оценку, только если до него не было испытания с большим индексом
+        previous_index = np.maximum.accumulate(np.concatenate(([best_index], index[:-1])))
+        updating = index >= previous_index
+        for v in np.unique(index[updating]).tolist():
+            candidates = np.flatnonzero(updating & (index == v))
+            best_candidate = candidates[np.argmin(z[candidates])]
+            if v > best_index or z[best_candidate] < best_z:
+                self.best = items[best_candidate]
+                self.Z[v] = z[best_candidate]
+                self.estimates_changed()
         self.search_data.solution.best_trials[0] = self.best
 
     def finalize_iteration(self) -> None:
@@ -373,6 +803,18 @@ a new point into the repository
         self.search_data.get_last_item().creation_time = time()
         self.search_data.get_last_item().iterationNumber = self.iterations_count  # будет ли работать в параллельном случае?
         self.iterations_count += 1
+        self.update_reliability()
+
+    def update_reliability(self) -> None:
+        r"""
+        Change the reliability parameter r with the adaptive schedule, the characteristics are recalculated
+          with the new value
+        """
+        if self.reliability is None:
+            return
+        best = None if self.best is None else (self.best.get_index(), self.best.get_z())
+        if self.reliability.update(self.iterations_count, best, self.M):
+            self.recalcR = True
 
     def get_iterations_count(self) -> int:
         r"""
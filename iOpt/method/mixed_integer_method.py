@@ -54,87 +54,40 @@ class MixedIntegerMethod(IndexMethod):
         image_right = self.evolvent.get_image(1.0)
         right: list[SearchDataItem] = []
 
-        # [(x + y - 1)/y]
-
-        items: list[SearchDataItem] = []
-        image_x: list = []
-        is_init_image_x: bool = False
-
         number_of_points_in_one_interval = \
-            int(math.modf((self.parameters.number_of_parallel_points + self.numberOfParameterCombinations - 1)
+            int(math.modf((self.get_initial_design_size() + self.numberOfParameterCombinations - 1)
                           / self.numberOfParameterCombinations)[1])
+        design = self.create_initial_design(number_of_points_in_one_interval)
 
-        h: float = 1.0 / (number_of_points_in_one_interval + 1)
-
+        initial_points = list(self.parameters.initial_points)
         if self.parameters.start_point:
-            for id_comb in range(self.numberOfParameterCombinations):
-                if np.array_equal(self.parameters.start_point.discrete_variables, self.discreteParameters[id_comb]):
-                    num_temp = number_of_points_in_one_interval - 1
-
-                    ystart_point = Point(copy.copy(self.parameters.start_point.float_variables),
-                                         self.discreteParameters[id_comb])
-                    xstart_point = id_comb + self.evolvent.get_inverse_image(
-                        self.parameters.start_point.float_variables)
-                    itemstart_point = SearchDataItem(ystart_point, xstart_point, discrete_value_index=id_comb,
-                                                     function_values=[FunctionValue()] * self.numberOfAllFunctions)
-
-                    is_add_start_point: bool = False
-
-                    for i in range(num_temp):
-                        x = id_comb + h * (i + 1)
-
-                        y_temp = self.evolvent.get_image(x)
-
-                        y = Point(copy.copy(y_temp), self.discreteParameters[id_comb])
-                        item = SearchDataItem(y, x, discrete_value_index=id_comb,
-                                              function_values=[FunctionValue()] * self.numberOfAllFunctions)
-                        if x < xstart_point < id_comb + h * (i + 1):
-                            items.append(item)
-                            items.append(itemstart_point)
-                            is_add_start_point = True
-                        else:
-                            items.append(item)
-
-                    if not is_add_start_point:
-                        items.append(itemstart_point)
-
-                else:
-                    for i in range(number_of_points_in_one_interval):
-                        x = id_comb + h * (i + 1)
-                        if not is_init_image_x:
-                            image_x.append(self.evolvent.get_image(x))
-
-                        y = Point(copy.copy(image_x[i]), self.discreteParameters[id_comb])
-                        item = SearchDataItem(y, x, discrete_value_index=id_comb,
-                                              function_values=[FunctionValue()] * self.numberOfAllFunctions)
-                        items.append(item)
-
-                right.append(SearchDataItem(Point(copy.copy(image_right), self.discreteParameters[id_comb]),
-                                            float(id_comb + 1),
-                                            function_values=[FunctionValue()] * self.numberOfAllFunctions,
-                                            discrete_value_index=id_comb))
-
-                if not is_init_image_x:
-                    is_init_image_x = True
-        else:
-            for id_comb in range(self.numberOfParameterCombinations):
-                for i in range(number_of_points_in_one_interval):
-                    x = id_comb + h * (i + 1)
-                    if not is_init_image_x:
-                        image_x.append(self.evolvent.get_image(x))
-
-                    y = Point(copy.copy(image_x[i]), self.discreteParameters[id_comb])
-                    item = SearchDataItem(y, x, discrete_value_index=id_comb,
-                                          function_values=[FunctionValue()] * self.numberOfAllFunctions)
-                    items.append(item)
+            initial_points.insert(0, self.parameters.start_point)
 
-                right.append(SearchDataItem(Point(copy.copy(image_right), self.discreteParameters[id_comb]),
-                                            float(id_comb + 1),
-                                            function_values=[FunctionValue()] * self.numberOfAllFunctions,
-                                            discrete_value_index=id_comb))
-
-                if not is_init_image_x:
-                    is_init_image_x = True
+        # точки первой итерации для каждого сочетания дискретных параметров
+        groups: list[list[SearchDataItem]] = []
+        for id_comb in range(self.numberOfParameterCombinations):
+            comb_points = [point for point in initial_points
+                           if np.array_equal(point.discrete_variables, self.discreteParameters[id_comb])]
+            # начальные точки пользователя заменяют последние точки плана
+            comb_design = design[:max(number_of_points_in_one_interval - len(comb_points), 0)]
+            comb_items = [SearchDataItem(Point(copy.copy(y), self.discreteParameters[id_comb]), id_comb + x,
+                                         discrete_value_index=id_comb,
+                                         function_values=[FunctionValue()] * self.numberOfAllFunctions)
+                          for x, y in comb_design]
+            for point in comb_points:
+                comb_items.append(SearchDataItem(Point(copy.copy(point.float_variables),
+                                                       self.discreteParameters[id_comb]),
+                                                 id_comb + self.get_initial_point_x(point.float_variables),
+                                                 discrete_value_index=id_comb,
+                                                 function_values=[FunctionValue()] * self.numberOfAllFunctions))
+            groups.append(self.sort_initial_items(comb_items))
+
+            right.append(SearchDataItem(Point(copy.copy(image_right), self.discreteParameters[id_comb]),
+                                        float(id_comb + 1),
+                                        function_values=[FunctionValue()] * self.numberOfAllFunctions,
+                                        discrete_value_index=id_comb))
+
+        items: list[SearchDataItem] = [item for group in groups for item in group]
 
         self.calculator.calculate_functionals_for_items(items)
 
@@ -145,36 +98,27 @@ class MixedIntegerMethod(IndexMethod):
         # left надо для всех считать
         self.calculate_global_r(left, None)
 
-        items[0].delta = self.calculate_delta(left, items[0], self.dimension)
-        self.calculate_global_r(items[0], left)
+        for id_comb, group in enumerate(groups):
+            previous = left if id_comb == 0 else right[id_comb - 1]
+            for id_item, item in enumerate(group):
+                item.delta = self.calculate_delta(previous, item, self.dimension)
+                self.calculate_global_r(item, previous)
+                if id_item > 0:
+                    self.calculate_m(item, previous)
+                previous = item
 
-        for id_comb in range(self.numberOfParameterCombinations):
-            if id_comb > 0:
-                # вычисление left
-                index = id_comb * number_of_points_in_one_interval
-                items[index].delta = self.calculate_delta(right[id_comb - 1], items[index], self.dimension)
-                self.calculate_global_r(items[index], right[id_comb - 1])
-
-            for id_item in range(1, number_of_points_in_one_interval):
-                index = id_comb * number_of_points_in_one_interval + id_item
-                items[index].delta = self.calculate_delta(items[index - 1], items[index], self.dimension)
-                self.calculate_global_r(items[index], items[index - 1])
-                self.calculate_m(items[index], items[index - 1])
-
-            left_index = id_comb * number_of_points_in_one_interval + number_of_points_in_one_interval - 1
-            right[id_comb].delta = self.calculate_delta(items[left_index], right[id_comb], self.dimension)
-            self.calculate_global_r(right[id_comb], items[left_index])
+            right[id_comb].delta = self.calculate_delta(previous, right[id_comb], self.dimension)
+            self.calculate_global_r(right[id_comb], previous)
 
         # вставить left  и right, потом middle
         self.search_data.insert_first_data_item(left, right[-1])
 
-        for right_item in range(self.numberOfParameterCombinations):
-            if right_item < self.numberOfParameterCombinations - 1:
-                self.search_data.insert_data_item(right[right_item], right[-1])
+        for id_comb, group in enumerate(groups):
+            if id_comb < self.numberOfParameterCombinations - 1:
+                self.search_data.insert_data_item(right[id_comb], right[-1])
 
-            for id_item in range(number_of_points_in_one_interval):
-                index = right_item * number_of_points_in_one_interval + id_item
-                self.search_data.insert_data_item(items[index], right[right_item])
+            for item in group:
+                self.search_data.insert_data_item(item, right[id_comb])
 
         self.recalcR = True
         self.recalcM = True
@@ -183,6 +127,40 @@ class MixedIntegerMethod(IndexMethod):
 
         return items
 
+    def create_boundary_items(self) -> list[SearchDataItem]:
+        r"""
+        Create the boundary points of the search intervals of all combinations of discrete parameters
+
+        :return: list of boundary points.
+        """
+        left = SearchDataItem(Point(self.evolvent.get_image(0.0), self.discreteParameters[0]), 0.0,
+                              function_values=[FunctionValue()] * self.numberOfAllFunctions)
+        image_right = self.evolvent.get_image(1.0)
+        right = [SearchDataItem(Point(copy.copy(image_right), self.discreteParameters[id_comb]),
+                                float(id_comb + 1),
+                                function_values=[FunctionValue()] * self.numberOfAllFunctions,
+                                discrete_value_index=id_comb)
+                 for id_comb in range(self.numberOfParameterCombinations)]
+        # тот же порядок, что и при вставке в first_iteration: left и последняя правая точка идут первыми
+        return [left, right[-1]] + right[:-1]
+
+    def get_trial_x(self, point: Point) -> tuple[float, int] | None:
+        r"""
+        Map a point of a trial performed outside the search to the segment of its combination of discrete parameters
+
+        :param point: point of the trial.
+        :return: point on the segment [0, number of combinations] and the index of the combination,
+          None if the point lies outside the search region.
+        """
+        discrete_variables = tuple(point.discrete_variables) if point.discrete_variables is not None else ()
+        if discrete_variables not in self.discreteParameters:
+            return None
+        mapped = super().get_trial_x(point)
+        if mapped is None:
+            return None
+        id_comb = self.discreteParameters.index(discrete_variables)
+        return id_comb + mapped[0], id_comb
+
     def calculate_iteration_point(self) -> Tuple[SearchDataItem, SearchDataItem]:  # return  (new, old)
         r"""
         Calculate the point of a new trial :math:`x^{k+1}`
@@ -196,8 +174,7 @@ class MixedIntegerMethod(IndexMethod):
         if self.recalcR is True:
             self.recalc_all_characteristics()
 
-        old = self.search_data.get_data_item_with_max_global_r()
-        self.min_delta = min(old.delta, self.min_delta)
+        old = self.select_interval()
         newx = self.calculate_next_point_coordinate(old)
         newy = self.evolvent.get_image(newx - math.modf(newx)[1])
         new = copy.deepcopy(SearchDataItem(Point(newy, old.point.discrete_variables),
@@ -244,7 +221,7 @@ class MixedIntegerMethod(IndexMethod):
             if other_point is not None and other_point.get_index() >= 0 \
                     and other_point.get_discrete_value_index() == curr_point.get_discrete_value_index():
                 # print(index)
-                m = abs(other_point.function_values[index].value - curr_point.get_z()) / \
+                m = abs(self.get_function_value(other_point, index) - curr_point.get_z()) / \
                     self.calculate_delta(other_point, curr_point, self.dimension)
 
             # Ищем справа
@@ -260,9 +237,9 @@ class MixedIntegerMethod(IndexMethod):
 
             if other_point is not None and other_point.get_index() >= 0 \
                     and other_point.get_discrete_value_index() == curr_point.get_discrete_value_index():
-                m = max(m, abs(curr_point.get_z() - other_point.function_values[index].value) / \
+                m = max(m, abs(curr_point.get_z() - self.get_function_value(other_point, index)) / \
                         self.calculate_delta(curr_point, other_point, self.dimension))
 
         if m > self.M[index] or (self.M[index] == 1.0 and m > 1e-12):
             self.M[index] = m
-            self.recalcR = True
+            self.estimates_changed()
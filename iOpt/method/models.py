@@ -82,5 +82,21 @@ class Task(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[String] = mapped_column(String, unique=True)
     state: Mapped[TaskState] = mapped_column(Enum(TaskState))
+    priority: Mapped[int] = mapped_column(Integer, default=0)
+    # параметры решения в формате JSON, по ним исполнители создают задачу
+    parameters: Mapped[str] = mapped_column(String, nullable=True)
 
     points: Mapped[List[Point]] = relationship(cascade="all, delete-orphan")
+    progress: Mapped[List["TaskProgress"]] = relationship(cascade="all, delete-orphan")
+
+
+class TaskProgress(Base):
+    __tablename__ = "task_progress"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id"))
+    iteration: Mapped[int] = mapped_column(Integer)
+    trials: Mapped[int] = mapped_column(Integer)
+    best_z: Mapped[float] = mapped_column(Float, nullable=True)
+    min_delta: Mapped[float] = mapped_column(Float)
+    iteration_time: Mapped[float] = mapped_column(Float)
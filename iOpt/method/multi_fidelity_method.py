@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import numpy as np
+
+from iOpt.evolvent.evolvent import Evolvent
+from iOpt.method.calculator import Calculator
+from iOpt.method.index_method import IndexMethod
+from iOpt.method.mixed_integer_method import MixedIntegerMethod
+from iOpt.method.multi_fidelity_optim_task import MultiFidelityOptimizationTask
+from iOpt.method.search_data import SearchData, SearchDataItem
+from iOpt.solver_parametrs import SolverParameters
+
+
+class MultiFidelityMethod(IndexMethod):
+    """
+    The MultiFidelityMethod class solves problems whose objective can be calculated with reduced fidelities.
+      The fidelities are the functionals of the index scheme after the constraints, each with its own estimates
+      M and Z. A point goes to the next fidelity if its value is not greater than the threshold
+      best + fidelity_margin * (worst - best) over the values of the fidelity calculated so far
+    """
+
+    def __init__(self,
+                 parameters: SolverParameters,
+                 task: MultiFidelityOptimizationTask,
+                 evolvent: Evolvent,
+                 search_data: SearchData,
+                 calculator: Calculator = None
+                 ):
+        super().__init__(parameters, task, evolvent, search_data, calculator)
+        number_of_reduced_fidelities = task.problem.number_of_fidelities - 1
+        self.numberOfAllFunctions += number_of_reduced_fidelities
+        self.M += [1.0] * number_of_reduced_fidelities
+        self.Z += [np.infty] * number_of_reduced_fidelities
+        self.M_used = list(self.M)
+        self.Z_used = list(self.Z)
+
+        # лучшее и худшее значения на каждом уровне пониженной точности
+        self.fidelity_min = [np.infty] * number_of_reduced_fidelities
+        self.fidelity_max = [-np.infty] * number_of_reduced_fidelities
+        # число испытаний, остановленных на каждом уровне точности; последний уровень - полное вычисление
+        self.fidelity_trials_count = [0] * (number_of_reduced_fidelities + 1)
+        # пороги перехода вводятся, когда на уровне накоплено достаточно значений
+        self.fidelity_min_trials = 2 * (self.dimension + 1)
+
+    def get_index_threshold(self, index: int) -> float:
+        r"""
+        Get the threshold the functional should not exceed for the trial to go to the next index
+
+        :param index: index of the functional.
+        :return: 0 for the constraints, the threshold of the task for the reduced fidelities.
+        """
+        fidelity = self.task.get_fidelity(index)
+        if fidelity < 0:
+            return 0.0
+        return self.task.fidelity_thresholds[fidelity]
+
+    def update_optimum(self, point: SearchDataItem) -> None:
+        r"""
+        Update the estimate of the optimum and the thresholds of the fidelities
+
+        :param point: the point of a new trial.
+        """
+        super().update_optimum(point)
+        self.update_fidelity_thresholds(point)
+
+    def update_optimum_by_items(self, items: list[SearchDataItem]) -> None:
+        r"""
+        Update the estimate of the optimum and the thresholds of the fidelities by a set of trials at once
+
+        :param items: points of the performed trials.
+        """
+        super().update_optimum_by_items(items)
+        for item in items:
+            self.update_fidelity_thresholds(item)
+
+    def update_fidelity_thresholds(self, point: SearchDataItem) -> None:
+        r"""
+        Account the values of the fidelities calculated at a point of a new trial
+
+        :param point: the point of a new trial.
+        """
+        fidelity = self.task.get_fidelity(point.get_index())
+        if fidelity < 0:
+            return
+        self.fidelity_trials_count[fidelity] += 1
+        for level in range(min(fidelity + 1, len(self.fidelity_min))):
+            value = self.get_function_value(point, self.task.problem.number_of_constraints + level)
+            self.fidelity_min[level] = min(self.fidelity_min[level], value)
+            self.fidelity_max[level] = max(self.fidelity_max[level], value)
+            # значение уровня level вычислено во всех испытаниях, остановленных на нем и выше
+            if sum(self.fidelity_trials_count[level:]) < self.fidelity_min_trials:
+                continue
+            threshold = self.fidelity_min[level] + \
+                self.parameters.fidelity_margin * (self.fidelity_max[level] - self.fidelity_min[level])
+            if threshold != self.task.fidelity_thresholds[level]:
+                self.task.fidelity_thresholds[level] = threshold
+                # характеристики точек, остановленных на этом уровне, зависят от порога
+                self.recalcR = True
+
+
+class MultiFidelityMixedIntegerMethod(MultiFidelityMethod, MixedIntegerMethod):
+    """
+    The MultiFidelityMixedIntegerMethod class solves problems with discrete parameters
+      whose objective can be calculated with reduced fidelities
+    """
+    pass
@@ -0,0 +1,54 @@
+import sys
+
+from iOpt.method.index_method_evaluate import IndexMethodEvaluate
+from iOpt.method.multi_fidelity_optim_task import MultiFidelityOptimizationTask
+from iOpt.method.search_data import SearchDataItem
+from iOpt.trial import FunctionValue, FunctionType
+
+
+class MultiFidelityMethodEvaluate(IndexMethodEvaluate):
+    """
+    The MultiFidelityMethodEvaluate class calculates the objective from the lowest fidelity up:
+      a point goes to the next fidelity only if its value is not greater than the threshold of the task
+    """
+
+    def __init__(self,
+                 task: MultiFidelityOptimizationTask
+                 ):
+        super().__init__(task)
+
+    def calculate_functionals(self, point: SearchDataItem) -> SearchDataItem:
+        r"""
+        Perform a search trial at a given point
+
+        :param point: the point at which the trial is to be performed.
+
+        :return: the point at which the trial results are saved.
+        """
+        try:
+            number_of_constraints = self.task.problem.number_of_constraints
+            for i in range(number_of_constraints):
+                point.function_values[i] = FunctionValue(FunctionType.CONSTRAINT, i)
+                point = self.task.calculate(point, i)
+                point.set_z(point.function_values[i].value)
+                point.set_index(i)
+                if point.get_z() > 0:
+                    return point
+
+            number_of_fidelities = self.task.problem.number_of_fidelities
+            for fidelity in range(number_of_fidelities):
+                index = number_of_constraints + fidelity
+                position = self.task.perm[index]
+                # значения пониженной точности отличаются номером функции: -1 - уровень 0, -2 - уровень 1, ...
+                function_id = 0 if fidelity == number_of_fidelities - 1 else -1 - fidelity
+                point.function_values[position] = FunctionValue(FunctionType.OBJECTIV, function_id)
+                point = self.task.calculate(point, index)
+                point.set_z(point.function_values[position].value)
+                point.set_index(index)
+                if fidelity < number_of_fidelities - 1 and point.get_z() > self.task.fidelity_thresholds[fidelity]:
+                    return point
+        except Exception:
+            point.set_z(sys.float_info.max)
+            point.set_index(-10)
+
+        return point
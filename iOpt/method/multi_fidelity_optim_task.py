@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import numpy as np
+
+from iOpt.method.optim_task import OptimizationTask, TypeOfCalculation
+from iOpt.method.search_data import SearchDataItem
+from iOpt.problem import Problem
+
+
+class MultiFidelityOptimizationTask(OptimizationTask):
+    """
+    The MultiFidelityOptimizationTask class calculates the objective with reduced fidelities as the functionals
+      of the index scheme following the constraints: the index number_of_constraints + k is the fidelity k,
+      the last index is the full calculation. The full value is kept at the position number_of_constraints
+      of the function values, the values of the reduced fidelities follow it
+    """
+
+    def __init__(self,
+                 problem: Problem
+                 ):
+        number_of_constraints = problem.number_of_constraints
+        number_of_fidelities = problem.number_of_fidelities
+        perm = np.arange(number_of_constraints + number_of_fidelities)
+        perm[number_of_constraints:-1] = np.arange(number_of_constraints + 1,
+                                                   number_of_constraints + number_of_fidelities)
+        perm[-1] = number_of_constraints
+        super().__init__(problem, perm)
+        # точка переходит на следующий уровень точности, если значение не больше порога;
+        # пороги задаются методом по мере накопления испытаний
+        self.fidelity_thresholds = [np.infty] * (number_of_fidelities - 1)
+
+    def get_fidelity(self, function_index: int) -> int:
+        """
+        Get the fidelity of the functional with a given index
+
+        :param function_index: index of the functional.
+        :return: fidelity, -1 for a constraint.
+        """
+        return function_index - self.problem.number_of_constraints
+
+    def calculate(self,
+                  data_item: SearchDataItem,
+                  function_index: int,
+                  calculation_type: TypeOfCalculation = TypeOfCalculation.FUNCTION
+                  ) -> SearchDataItem:
+        """Compute selected function by number"""
+        fidelity = self.get_fidelity(function_index)
+        if fidelity < 0 or fidelity == self.problem.number_of_fidelities - 1:
+            return super().calculate(data_item, function_index, calculation_type)
+
+        position = self.perm[function_index]
+        data_item.function_values[position] = self.problem.calculate_fidelity(data_item.point,
+                                                                              data_item.function_values[position],
+                                                                              fidelity)
+        if not np.isfinite(data_item.function_values[position].value):
+            raise Exception("Infinity values")
+        return data_item
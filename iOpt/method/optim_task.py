@@ -2,6 +2,7 @@ from __future__ import annotations
 import numpy as np
 from enum import Enum
 
+from iOpt.method.pruner import Pruner
 from iOpt.method.search_data import SearchDataItem
 from iOpt.problem import Problem
 
@@ -17,6 +18,8 @@ class OptimizationTask:
                  perm: np.ndarray(shape=(1), dtype=int) = None
                  ):
         self.problem = problem
+        # остановка бесперспективных вычислений критерия, задается решателем
+        self.pruner: Pruner | None = None
 
         if perm is None:
             self.perm = np.ndarray(shape=(self.problem.number_of_objectives +
@@ -1,7 +1,12 @@
+from __future__ import annotations
+
+from time import monotonic
 from typing import List
 
+from multiprocess.pool import AsyncResult
+
 from iOpt.evolvent.evolvent import Evolvent
-from iOpt.method.calculator import Calculator
+from iOpt.method.calculator import Calculator, DeadlineExceeded
 from iOpt.method.listener import Listener
 from iOpt.method.method import Method
 
@@ -36,6 +41,9 @@ class ParallelProcess(Process):
         :param listeners: List of "observers" (used to display current information).
         """
         super(ParallelProcess, self).__init__(parameters, task, evolvent, search_data, method, listeners, calculator)
+        # испытания, перенесенные в следующий пакет: (новая точка, старая точка, результат)
+        self.pending: list[tuple[SearchDataItem, SearchDataItem, AsyncResult]] = []
+        self.poll_interval = 0.001
 
     def do_global_iteration(self, number: int = 1):
         """
@@ -52,7 +60,12 @@ class ParallelProcess(Process):
             self._first_iteration = False
             number -= 1
 
+        quorum = self.parameters.parallel_quorum
         for _ in range(number):
+            if 0 < quorum < self.parameters.number_of_parallel_points:
+                done_trials.extend(self.do_quorum_iteration(quorum))
+                continue
+
             list_newpoint: list[SearchDataItem] = []
             list_oldpoint: list[SearchDataItem] = []
 
@@ -70,3 +83,68 @@ class ParallelProcess(Process):
 
         for listener in self._listeners:
             listener.on_end_iteration(done_trials, self.get_results())
+
+    def do_quorum_iteration(self, quorum: int) -> list[SearchDataItem]:
+        """
+        Perform an iteration in the k-of-p mode: the batch is completed with number_of_parallel_points trials,
+          as soon as quorum trials are completed exactly quorum of them are committed in the order of the batch,
+          the rest are carried over to the next batch with their intervals blocked.
+          So the iteration does not depend on how many trials are completed by the time of the check
+
+        :param quorum: number of completed trials that ends the iteration.
+        :return: the committed trials.
+        """
+        while len(self.pending) < self.parameters.number_of_parallel_points:
+            newpoint, oldpoint = self.method.calculate_iteration_point()
+            oldpoint.blocked = True
+            self.pending.append((newpoint, oldpoint, self.calculator.submit(newpoint)))
+
+        while sum(result.ready() for _, _, result in self.pending) < quorum:
+            if self.method.is_deadline_reached():
+                raise DeadlineExceeded('Trials are cancelled by the deadline')
+            next(result for _, _, result in self.pending if not result.ready()).wait(self.poll_interval)
+        return self.commit_ready_trials(quorum)
+
+    def commit_ready_trials(self, limit: int | None = None) -> list[SearchDataItem]:
+        """
+        Add the completed trials to the search information in the order they were given
+
+        :param limit: the largest number of the committed trials, None - all the completed ones.
+        :return: the committed trials.
+        """
+        done_trials = []
+        pending = []
+        for newpoint, oldpoint, result in self.pending:
+            if not result.ready() or (limit is not None and len(done_trials) >= limit):
+                pending.append((newpoint, oldpoint, result))
+                continue
+            self.calculator.evaluate_method.copy_functionals(newpoint, result.get())
+            oldpoint.blocked = False
+            self.method.update_optimum(newpoint)
+            self.method.renew_search_data(newpoint, oldpoint)
+            self.method.finalize_iteration()
+            done_trials.append(newpoint)
+        self.pending = pending
+        return done_trials
+
+    def complete_trials(self) -> None:
+        """
+        Wait for the carried over trials when the search stops; the trials not completed
+          by the deadline are cancelled and their intervals are unblocked
+        """
+        for _, _, result in self.pending:
+            if self.method.deadline is None:
+                result.wait()
+            else:
+                result.wait(max(self.method.deadline - monotonic(), 0))
+        done_trials = self.commit_ready_trials()
+        if self.pending:
+            self.calculator.cancel()
+            for _, oldpoint, _ in self.pending:
+                oldpoint.blocked = False
+            self.search_data.solution.number_of_global_trials -= len(self.pending)
+            self.pending = []
+            self.method.recalcR = True
+        if done_trials:
+            for listener in self._listeners:
+                listener.on_end_iteration(done_trials, self.get_results())
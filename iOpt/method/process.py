@@ -1,11 +1,17 @@
 from datetime import datetime
+from time import monotonic
 from typing import List
 
 import traceback
 import json
 
+import numpy as np
+
 from iOpt.evolvent.evolvent import Evolvent
-from iOpt.method.calculator import Calculator
+from iOpt.method.ask_tell import FirstIterationCalculator, FirstIterationPointsRecorded
+from iOpt.method.calculator import Calculator, DeadlineExceeded
+from iOpt.method.checkpoint import Checkpointer, CheckpointLog, arrays_to_trials, gc_paused, load_arrays, save_arrays, \
+    searchdata_to_arrays, write_atomically
 from iOpt.method.listener import Listener
 from iOpt.method.local_optimizer import local_optimize
 from iOpt.method.method import Method
@@ -13,7 +19,7 @@ from iOpt.method.optim_task import OptimizationTask
 from iOpt.method.search_data import SearchData, SearchDataItem
 from iOpt.solution import Solution
 from iOpt.solver_parametrs import SolverParameters
-from iOpt.trial import FunctionValue, FunctionType
+from iOpt.trial import FunctionValue, FunctionType, Point, Trial
 
 
 class Process:
@@ -48,6 +54,13 @@ class Process:
         self.method = method
         self._listeners = listeners
         self._first_iteration = True
+        self._checkpoint_logs: dict[str, CheckpointLog] = {}
+        self.checkpointer = Checkpointer(parameters)
+        # точки, выданные методом ask: старые точки (интервалы) по координате x новой точки
+        self._asked_points: dict[float, SearchDataItem] = {}
+        self._first_iteration_points: list[SearchDataItem] | None = None
+        self._told_first_points: dict[float, SearchDataItem] = {}
+        self._evaluate_method = None
         if calculator is None:
             self.calculator = method.calculator
         else:
@@ -61,12 +74,20 @@ class Process:
         :return: Current evaluation of the solution to the optimization problem.
         """
 
+        self.resume_from_checkpoint()
+        self.start_deadline()
         start_time = datetime.now()
 
         try:
             while not self.method.check_stop_condition():
                 self.do_global_iteration()
+                self.checkpointer.checkpoint(self)
+            self.complete_trials()
+            self.checkpointer.checkpoint(self, force=True)
 
+        except DeadlineExceeded:
+            self.complete_trials()
+            self.checkpointer.checkpoint(self, force=True)
         except Exception:
             print('Exception was thrown')
             print(traceback.format_exc())
@@ -83,6 +104,127 @@ class Process:
 
         return result
 
+    def get_evaluate_method(self):
+        if self._evaluate_method is None:
+            from iOpt.method.solverFactory import SolverFactory
+            self._evaluate_method = SolverFactory.create_evaluate_method(self.task)
+        return self._evaluate_method
+
+    def ask(self, number: int = 1) -> list[SearchDataItem]:
+        """
+        Get the points of new trials without calculating them. The first call returns the points of
+          the first iteration, the next points are given only after they are told.
+          The intervals of the given points are blocked until the points are told
+
+        :param number: number of points, at most the number of intervals not blocked.
+        :return: points to calculate, e.g. with calculate_functionals of the evaluation method of the task.
+        """
+        if self._first_iteration:
+            if self._first_iteration_points is not None:
+                return []
+            for listener in self._listeners:
+                listener.before_method_start(self.method)
+            calculator = FirstIterationCalculator(self.get_evaluate_method())
+            self._run_first_iteration(calculator)
+            self._first_iteration_points = calculator.points
+            return list(calculator.points)
+
+        points = []
+        for _ in range(number):
+            newpoint, oldpoint = self.method.calculate_iteration_point()
+            oldpoint.blocked = True
+            self._asked_points[newpoint.get_x()] = oldpoint
+            points.append(newpoint)
+        return points
+
+    def tell(self, points: list[SearchDataItem]) -> None:
+        """
+        Add the calculated points given by ask to the search information
+
+        :param points: points with the results of the trials.
+        """
+        done_trials = []
+        if self._first_iteration_points is not None:
+            waiting = {point.get_x() for point in self._first_iteration_points}
+            other_points = []
+            for point in points:
+                if point.get_x() in waiting:
+                    self._told_first_points[point.get_x()] = point
+                else:
+                    other_points.append(point)
+            points = other_points
+            if len(self._told_first_points) == len(waiting):
+                # первая итерация повторяется с полученными значениями
+                done_trials = self._run_first_iteration(
+                    FirstIterationCalculator(self.get_evaluate_method(), self._told_first_points))
+                self._first_iteration = False
+                self._first_iteration_points = None
+                self._told_first_points = {}
+
+        for point in points:
+            oldpoint = self._asked_points.pop(point.get_x())
+            self.get_evaluate_method().copy_functionals(point, point)
+            oldpoint.blocked = False
+            self.method.update_optimum(point)
+            self.method.renew_search_data(point, oldpoint)
+            self.method.finalize_iteration()
+            done_trials.append(point)
+
+        if done_trials:
+            for listener in self._listeners:
+                listener.on_end_iteration(done_trials, self.get_results())
+
+    def cancel_asked_points(self) -> None:
+        """
+        Forget the points given by ask and not told, their intervals are unblocked
+        """
+        for oldpoint in self._asked_points.values():
+            oldpoint.blocked = False
+        self.search_data.solution.number_of_global_trials -= len(self._asked_points)
+        self._asked_points = {}
+        self._first_iteration_points = None
+        self._told_first_points = {}
+        self.method.recalcR = True
+
+    def _run_first_iteration(self, calculator: FirstIterationCalculator) -> list[SearchDataItem]:
+        method_calculator = self.method.calculator
+        self.method.calculator = calculator
+        try:
+            return self.method.first_iteration()
+        except FirstIterationPointsRecorded:
+            return []
+        finally:
+            self.method.calculator = method_calculator
+
+    def complete_trials(self) -> None:
+        """
+        Complete the trials still running when the search stops, the sequential process has none
+        """
+        pass
+
+    def start_deadline(self) -> None:
+        """
+        Set the deadline of the search according to the timeout parameter (in minutes).
+          The deadline is checked in the stop condition, the calculators cancel the trials not completed by it
+        """
+        deadline = None
+        if self.parameters.timeout >= 0:
+            deadline = monotonic() + self.parameters.timeout * 60
+        self.method.deadline = deadline
+        for calculator in (self.calculator, self.method.calculator):
+            if hasattr(calculator, 'deadline'):
+                calculator.deadline = deadline
+
+    def resume_from_checkpoint(self) -> None:
+        """
+        Continue the search from the last automatic checkpoint, if it is enabled and the search is not started
+        """
+        if not (self._first_iteration and self.parameters.checkpoint_resume and self.checkpointer.is_enabled()):
+            return
+        file_name = self.checkpointer.get_last_checkpoint()
+        if file_name is not None:
+            self.load_progress(file_name, format=self.parameters.checkpoint_format)
+
     def do_global_iteration(self, number: int = 1):
         """
         Perform several iterations of the global search
@@ -175,13 +317,27 @@ class Process:
         """
         return self.search_data.solution
 
-    def save_progress(self, file_name: str, mode='full') -> None:
+    def save_progress(self, file_name: str, mode='full', format='json') -> None:
         """
         Save the optimization process from a file
 
         :param mode: 'full' - save all optimization information
         :param file_name: file name.
+        :param format: 'json' - the whole search information in one JSON document,
+             'jsonl' - append the new trials to the checkpoint log,
+             'npz' - columnar NumPy arrays of the trials.
+             The 'json' and 'npz' files are replaced atomically, the checkpoint log is only appended
         """
+        if format == 'jsonl':
+            self.get_checkpoint_log(file_name).write(self)
+            return
+        elif format == 'npz':
+            arrays = searchdata_to_arrays(self)
+            write_atomically(file_name, lambda name: save_arrays(name, arrays))
+            return
+        elif format != 'json':
+            raise Exception(f"Unknown progress format: {format}")
+
         data = self.search_data.searchdata_to_json(mode=mode)
         data['Parameters'] = []
         data['Parameters'].append({
@@ -191,25 +347,44 @@ class Process:
             'start_point': self.parameters.start_point,
             'number_of_parallel_points': self.parameters.number_of_parallel_points
         })
-        with open(file_name, 'w') as f:
-            json.dump(data, f, indent='\t', separators=(',', ':'))
-            f.write('\n')
 
-    def load_progress(self, file_name: str, mode='full') -> None:
+        def write_json(name: str) -> None:
+            with open(name, 'w') as f:
+                json.dump(data, f, indent='\t', separators=(',', ':'))
+                f.write('\n')
+
+        write_atomically(file_name, write_json)
+
+    def get_checkpoint_log(self, file_name: str) -> CheckpointLog:
+        if file_name not in self._checkpoint_logs:
+            self._checkpoint_logs[file_name] = CheckpointLog(file_name)
+        return self._checkpoint_logs[file_name]
+
+    def load_progress(self, file_name: str, mode='full', format='json') -> None:
         """
         Load the optimization process from a file
 
         :param file_name: file name.
+        :param format: 'json', 'jsonl' or 'npz', see save_progress.
         """
+        if format == 'jsonl':
+            self.load_checkpoint_log(file_name, mode)
+            return
+        elif format == 'npz':
+            self.load_arrays(file_name, mode)
+            return
+        elif format != 'json':
+            raise Exception(f"Unknown progress format: {format}")
+
         with open(file_name) as json_file:
             data = json.load(json_file)
 
         self.search_data.json_to_searchdata(data=data, mode=mode)
-        self.method.iterations_count = self.search_data.get_count() - 2
+        self.method.iterations_count = self.search_data.get_count() - len(self.method.create_boundary_items())
+        if mode == 'only search_data':
+            self.search_data.solution.number_of_global_trials = self.method.iterations_count
 
-        for ditem in self.search_data:
-            if ditem.get_index() >= 0:
-                self.method.update_optimum(ditem)
+        self.method.update_optimum_by_items(list(self.search_data))
 
         self.method.recalc_m()
         self.method.recalc_all_characteristics()
@@ -218,6 +393,129 @@ class Process:
         for listener in self._listeners:
             listener.before_method_start(self.method)
 
+    def load_arrays(self, file_name: str, mode='full') -> None:
+        """
+        Recover the optimization process from the columnar arrays saved in the npz format
+
+        :param file_name: file name.
+        """
+        arrays = load_arrays(file_name)
+        with gc_paused():
+            self.method.restore_search_data(arrays_to_trials(arrays))
+        if mode == 'full':
+            self.method.iterations_count = int(arrays['iterations_count'])
+            solution = self.search_data.solution
+            solution.number_of_global_trials = int(arrays['number_of_global_trials'])
+            solution.number_of_local_trials = int(arrays['number_of_local_trials'])
+            solution.solving_time = float(arrays['solving_time'])
+        self._first_iteration = False
+
+        for listener in self._listeners:
+            listener.before_method_start(self.method)
+
+    def load_checkpoint_log(self, file_name: str, mode='full') -> None:
+        """
+        Recover the optimization process by replaying the checkpoint log.
+        The next savings to the same file append to the log
+
+        :param file_name: file name.
+        """
+        checkpoint_log = self.get_checkpoint_log(file_name)
+        with gc_paused():
+            trials, header = checkpoint_log.read()
+            self.method.restore_search_data(trials)
+        if header is not None and mode == 'full':
+            self.method.iterations_count = header['iterations_count']
+            solution = self.search_data.solution
+            solution.number_of_global_trials = header['number_of_global_trials']
+            solution.number_of_local_trials = header['number_of_local_trials']
+            solution.solving_time = header['solving_time']
+        self._first_iteration = False
+
+        # журнал дописывается с того места, на котором он был прочитан
+        checkpoint_log.number_of_written_trials = self.search_data.get_count()
+
+        for listener in self._listeners:
+            listener.before_method_start(self.method)
+
+    def warm_start(self, trials: list[Trial] | Solution) -> int:
+        """
+        Add already performed trials (e.g. of a previous run with other bounds or r, or on related data)
+          to the search information before the search, as if they had been performed by the method.
+          The trials outside the search region and the failed trials are skipped, the estimates M and Z
+          are calculated anew. The added trials are not counted in the number of iterations
+
+        :param trials: performed trials or the solution of a previous run (its best trials).
+        :return: number of the added trials.
+        """
+        if not self._first_iteration:
+            raise Exception("Warm start is possible only before the first iteration of the search")
+        if isinstance(trials, Solution):
+            trials = trials.best_trials
+
+        evaluate_method = self.get_evaluate_method()
+        items = []
+        for trial in trials:
+            item = self.create_warm_start_item(trial)
+            if item is not None:
+                evaluate_method.copy_functionals(item, item)
+                items.append(item)
+        items = self.method.sort_initial_items(items)
+        if not items:
+            return 0
+
+        self.method.restore_search_data(items)
+        self.method.iterations_count = 0
+        self.search_data.solution.number_of_global_trials = 0
+        self._first_iteration = False
+
+        for listener in self._listeners:
+            listener.before_method_start(self.method)
+        return len(items)
+
+    def create_warm_start_item(self, trial: Trial) -> SearchDataItem | None:
+        """
+        Create a point of the search information from a trial performed outside the search.
+          The index and the value z are determined by the values of the functionals: constraints go first
+          and are calculated up to the first violated one
+
+        :param trial: performed trial.
+        :return: point of the search information, None if the trial can not be added.
+        """
+        if isinstance(trial, SearchDataItem) and (trial.get_index() < 0 or trial.approximate):
+            # граничная точка, неудачное испытание или значение суррогата
+            return None
+        mapped = self.method.get_trial_x(trial.point)
+        if mapped is None:
+            return None
+        x, discrete_value_index = mapped
+
+        number_of_constraints = self.task.problem.number_of_constraints
+        function_values = list(trial.function_values)
+        index = -1
+        if self.task.problem.number_of_fidelities > 1:
+            # уровень точности известен только по индексу испытания
+            if not isinstance(trial, SearchDataItem) or len(function_values) < self.method.numberOfAllFunctions:
+                return None
+            index = trial.get_index()
+        for i in range(min(number_of_constraints, len(function_values))):
+            if index >= 0:
+                break
+            if function_values[i].value > 0:
+                index = i
+        if index < 0:
+            if len(function_values) < number_of_constraints + self.task.problem.number_of_objectives:
+                return None
+            index = number_of_constraints
+
+        discrete_variables = trial.point.discrete_variables if self.task.problem.number_of_discrete_variables > 0 \
+            else None
+        item = SearchDataItem(Point(np.array(trial.point.float_variables, dtype=np.double), discrete_variables), x,
+                              function_values=function_values, discrete_value_index=discrete_value_index)
+        item.set_index(index)
+        item.set_z(function_values[self.task.perm[index]].value)
+        return item
+
     '''
     def RefreshListener(self):
         pass
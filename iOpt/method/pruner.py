@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class TrialPruned(Exception):
+    """
+    The exception raised by :meth:`Problem.calculate` to stop the calculation of the objective
+      the pruner considers unpromising
+    """
+    pass
+
+
+class Pruner:
+    """
+    The Pruner class keeps the intermediate values reported by the calculations of the objective, e.g. the scores
+      of the folds of a cross-validation, and decides whether the current calculation should be stopped.
+      The values are minimized as the objective
+    """
+
+    def __init__(self,
+                 min_trials: int = 5,
+                 warmup_steps: int = 1
+                 ):
+        r"""
+        Constructor of the Pruner class
+
+        :param min_trials: number of the previous trials with a value at a step needed to prune at this step.
+        :param warmup_steps: a calculation is not pruned at the steps less than warmup_steps.
+        """
+        self.min_trials = min_trials
+        self.warmup_steps = warmup_steps
+        # промежуточные значения предыдущих испытаний и итоговые значения, None - испытание остановлено
+        self.trials: list[dict[int, float]] = []
+        self.finals: list[float | None] = []
+        self.current: dict[int, float] = {}
+        self.pruned_trials_count = 0
+
+    def start_trial(self) -> None:
+        r"""
+        Start a new calculation of the objective
+        """
+        self.current = {}
+
+    def report(self, step: int, value: float) -> None:
+        r"""
+        Save an intermediate value of the current calculation
+
+        :param step: number of the step of the calculation.
+        :param value: intermediate value of the objective.
+        """
+        self.current[step] = value
+
+    def should_prune(self) -> bool:
+        r"""
+        Check whether the current calculation should be stopped by its last reported value
+
+        :return: True if the calculation is unpromising.
+        """
+        if not self.current:
+            return False
+        step = max(self.current)
+        if step < self.warmup_steps:
+            return False
+        return self.prune(step, self.current[step])
+
+    def prune(self, step: int, value: float) -> bool:
+        r"""
+        Decide whether a calculation with a given intermediate value is unpromising.
+          For any new pruner that inherits from :class:`Pruner`, this method should be overloaded
+
+        :param step: number of the step.
+        :param value: intermediate value at the step.
+        :return: True if the calculation should be stopped.
+        """
+        return False
+
+    def complete_trial(self, value: float) -> None:
+        r"""
+        Save the intermediate values of the current calculation finished with a given value
+
+        :param value: final value of the objective.
+        """
+        self.trials.append(self.current)
+        self.finals.append(value)
+        self.current = {}
+
+    def prune_trial(self) -> float | None:
+        r"""
+        Save the intermediate values of the stopped current calculation
+
+        :return: the last reported value, None if no values were reported.
+        """
+        value = self.current[max(self.current)] if self.current else None
+        self.trials.append(self.current)
+        self.finals.append(None)
+        self.current = {}
+        self.pruned_trials_count += 1
+        return value
+
+
+class MedianPruner(Pruner):
+    """
+    The MedianPruner class stops a calculation whose intermediate value is worse
+      than the median of the values of the previous trials at the same step
+    """
+
+    def prune(self, step: int, value: float) -> bool:
+        values = [trial[step] for trial in self.trials if step in trial]
+        if len(values) < self.min_trials:
+            return False
+        return value > np.median(values)
+
+
+class BoundPruner(Pruner):
+    """
+    The BoundPruner class stops a calculation whose final value can not be better than the best one:
+      the final value is bounded below by the intermediate value minus the largest excess
+      of the intermediate value at the same step over the final value in the completed trials
+    """
+
+    def prune(self, step: int, value: float) -> bool:
+        excess = [trial[step] - final for trial, final in zip(self.trials, self.finals)
+                  if final is not None and step in trial]
+        if len(excess) < self.min_trials:
+            return False
+        best = min(final for final in self.finals if final is not None)
+        return value - max(max(excess), 0.0) > best
@@ -0,0 +1,63 @@
+import sys
+
+from iOpt.method.index_method_evaluate import IndexMethodEvaluate
+from iOpt.method.optim_task import OptimizationTask
+from iOpt.method.pruner import TrialPruned
+from iOpt.method.search_data import SearchDataItem
+from iOpt.trial import FunctionValue, FunctionType
+
+
+class PruningMethodEvaluate(IndexMethodEvaluate):
+    """
+    The PruningMethodEvaluate class calculates the objective with the pruner of the task, which is given to the problem
+      only during the calculation. A calculation stopped by the pruner gives the trial with the last reported value
+      marked as approximate,
+      such a trial takes part in the characteristics of the index scheme but does not estimate the optimum
+    """
+
+    def __init__(self,
+                 task: OptimizationTask
+                 ):
+        super().__init__(task)
+
+    def calculate_functionals(self, point: SearchDataItem) -> SearchDataItem:
+        r"""
+        Perform a search trial at a given point
+
+        :param point: the point at which the trial is to be performed.
+
+        :return: the point at which the trial results are saved.
+        """
+        pruner = self.task.pruner
+        problem = self.task.problem
+        try:
+            number_of_constraints = self.task.problem.number_of_constraints
+            for i in range(number_of_constraints):
+                point.function_values[i] = FunctionValue(FunctionType.CONSTRAINT, i)
+                point = self.task.calculate(point, i)
+                point.set_z(point.function_values[i].value)
+                point.set_index(i)
+                if point.get_z() > 0:
+                    return point
+
+            point.function_values[number_of_constraints] = FunctionValue(FunctionType.OBJECTIV, 0)
+            pruner.start_trial()
+            problem.pruner = pruner
+            try:
+                point = self.task.calculate(point, number_of_constraints)
+                pruner.complete_trial(point.function_values[number_of_constraints].value)
+            except TrialPruned:
+                value = pruner.prune_trial()
+                if value is None:
+                    raise
+                point.function_values[number_of_constraints].value = value
+                point.approximate = True
+            finally:
+                problem.pruner = None
+            point.set_z(point.function_values[number_of_constraints].value)
+            point.set_index(number_of_constraints)
+        except Exception:
+            point.set_z(sys.float_info.max)
+            point.set_index(-10)
+
+        return point
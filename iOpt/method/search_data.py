@@ -48,7 +48,12 @@ class SearchDataItem(Trial):
         self.localR: np.double = -1.0
         self.iterationNumber: int = -1
         self.blocked: bool = False
+        # значение предсказано суррогатом или вычисление остановлено на промежуточном значении,
+        # точка не может быть оценкой оптимума
+        self.approximate: bool = False
         self.creation_time = 0
+        # процессорное время вычисления функционалов в точке
+        self.evaluation_time: float = 0.0
 
     def get_x(self) -> np.double:
         """
@@ -180,6 +185,23 @@ class CharacteristicsQueue:
         """
         self.__baseQueue.insert(data_item, key)
 
+    def insert_items(self, items: list[tuple[np.double, SearchDataItem]]):
+        """
+        Add a set of search intervals at once. The queue is rebuilt from one sort instead of
+          inserting the intervals one by one with a binary search, the order of the intervals
+          with equal priority is the same as after sequential insertion
+
+        :param items: Pairs (priority of the search interval, search interval).
+        """
+        base_queue = self.__baseQueue
+        data = sorted(list(base_queue) + [(data_item, key) for key, data_item in items],
+                      key=lambda pair: pair[1], reverse=True)
+        base_queue.clear()
+        # интервалы идут по убыванию приоритета, каждый добавляется в конец очереди за O(1),
+        # при заполненной очереди addlast интервал отбрасывает
+        for data_item, key in data:
+            base_queue.addlast(data_item, key)
+
     def get_best_item(self) -> (SearchDataItem, np.double):
         """
         Get the interval with the best characteristic
@@ -289,6 +311,25 @@ class SearchData:
 
         self.__firstDataItem = left_data_item
 
+    def insert_data_items(self, data_items: list[SearchDataItem]):
+        """
+        Add a set of trial intervals at once. The intervals are sorted by x and linked
+          with their neighbours in one pass, the characteristic queue is not filled
+
+        :param data_items: Trial intervals, including the boundary points of the search interval.
+        """
+        sorted_items = sorted(data_items, key=lambda item: item.get_x())
+        left_data_item = None
+        for data_item in sorted_items:
+            data_item.set_left(left_data_item)
+            if left_data_item is not None:
+                left_data_item.set_right(data_item)
+            left_data_item = data_item
+        left_data_item.set_right(None)
+
+        self._allTrials.extend(data_items)
+        self.__firstDataItem = sorted_items[0]
+
     # поиск покрывающего интервала
     # возвращает правую точку
     def find_data_item_by_one_dimensional_point(self, x: np.double) -> SearchDataItem:
@@ -322,9 +363,7 @@ class SearchData:
 
         """
         self._RGlobalQueue.Clear()
-        for itr in self:
-            if not itr.blocked:
-                self._RGlobalQueue.insert(itr.globalR, itr)
+        self._RGlobalQueue.insert_items([(itr.globalR, itr) for itr in self if not itr.blocked])
 
     # Возвращает текущее число интервалов в дереве
     def get_count(self) -> int:
@@ -499,8 +538,7 @@ class SearchData:
             first_data_item[-1].localR = trial['localR']
             first_data_item[-1].set_index(trial['index'])
 
-        self.insert_first_data_item(first_data_item[0], first_data_item[1])
-
+        data_items = first_data_item
         for trial in data['SearchDataItem'][2:]:
             function_values = []
             for fv in trial['function_values']:
@@ -518,7 +556,10 @@ class SearchData:
             data_item.creation_time = trial['creation_time']
             data_item.set_index(trial['index'])
 
-            self.insert_data_item(data_item)
+            data_items.append(data_item)
+
+        # все интервалы связываются за один проход после сортировки по x
+        self.insert_data_items(data_items)
 
         if mode == 'full':
             for trial in data['solution']:
@@ -627,6 +668,16 @@ class SearchDataDualQueue(SearchData):
             best_item = self.__RLocalQueue.get_best_item()
         return best_item[0]
 
+    def update_characteristics(self, data_item: SearchDataItem) -> None:
+        """
+        Put the recalculated characteristics of an interval already in the search information into the queues,
+          the previous entries of the interval become outdated
+
+        :param data_item: the interval with the recalculated characteristics.
+        """
+        self._RGlobalQueue.insert(data_item.globalR, data_item)
+        self.__RLocalQueue.insert(data_item.localR, data_item)
+
     def refill_queue(self):
         """
        Refill the queues of global and local characteristics, e.g.,
@@ -634,6 +685,5 @@ class SearchDataDualQueue(SearchData):
 
        """
         self.clear_queue()
-        for itr in self:
-            self._RGlobalQueue.insert(itr.globalR, itr)
-            self.__RLocalQueue.insert(itr.localR, itr)
+        self._RGlobalQueue.insert_items([(itr.globalR, itr) for itr in self if not itr.blocked])
+        self.__RLocalQueue.insert_items([(itr.localR, itr) for itr in self if not itr.blocked])
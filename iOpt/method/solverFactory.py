@@ -3,7 +3,7 @@ from typing import List
 from iOpt.evolvent.evolvent import Evolvent
 from iOpt.method.async_parallel_process import AsyncParallelProcess
 from iOpt.method.db_manager import DBManager
-from iOpt.method.db_process import DBProcess, DBProcessWorker
+from iOpt.method.db_process import AsyncDBProcess, DBProcess, DBProcessWorker
 from iOpt.method.calculator import Calculator
 from iOpt.method.default_calculator import DefaultCalculator
 from iOpt.method.index_method import IndexMethod
@@ -12,14 +12,20 @@ from iOpt.method.listener import Listener
 from iOpt.method.mco_method_many_lambdas import MCOMethodManyLambdas
 from iOpt.method.method import Method
 from iOpt.method.mixed_integer_method import MixedIntegerMethod
+from iOpt.method.multi_fidelity_method import MultiFidelityMethod, MultiFidelityMixedIntegerMethod
+from iOpt.method.multi_fidelity_method_evaluate import MultiFidelityMethodEvaluate
+from iOpt.method.multi_fidelity_optim_task import MultiFidelityOptimizationTask
 from iOpt.method.mco_method_evaluate import MCOMethodEvaluate
 from iOpt.method.optim_task import OptimizationTask
 from iOpt.method.mco_optim_task import MCOOptimizationTask, MinMaxConvolution
 from iOpt.problem import Problem
 from iOpt.method.parallel_process import ParallelProcess
+from iOpt.method.pruner import BoundPruner, MedianPruner, Pruner
+from iOpt.method.pruning_method_evaluate import PruningMethodEvaluate
 from iOpt.method.process import Process
-from iOpt.method.search_data import SearchData
+from iOpt.method.search_data import SearchData, SearchDataDualQueue
 from iOpt.solver_parametrs import SolverParameters
+from iOpt.trial import Point
 
 
 class SolverFactory:
@@ -49,14 +55,52 @@ class SolverFactory:
             else:
                 convolution = MinMaxConvolution(problem, [1.0 / problem.number_of_objectives] * problem.number_of_objectives, parameters.is_scaling)
             return MCOOptimizationTask(problem, convolution)
+        elif problem.number_of_fidelities > 1:
+            return MultiFidelityOptimizationTask(problem)
         else:
-            return OptimizationTask(problem)
+            task = OptimizationTask(problem)
+            # pruner хранится в задаче, а не в problem: один problem может решаться в нескольких задачах
+            task.pruner = SolverFactory.create_pruner(parameters)
+            return task
 
 
+    @staticmethod
+    def create_pruner(parameters: SolverParameters) -> Pruner | None:
+        """
+        Create the pruner stopping the unpromising calculations of the objective
+
+        :param parameters: parameters of the solution of the optimization problem.
+        :return: the pruner, None if the calculations are not stopped.
+        """
+        if parameters.pruner == 'median':
+            return MedianPruner(parameters.pruning_min_trials, parameters.pruning_warmup_steps)
+        elif parameters.pruner == 'bound':
+            return BoundPruner(parameters.pruning_min_trials, parameters.pruning_warmup_steps)
+        return None
+
+    @staticmethod
+    def create_search_data(problem: Problem,
+                           parameters: SolverParameters) -> SearchData:
+        """
+        Create the storage of the search information: the mixed scheme of local and global iterations
+          needs the queue of local characteristics, the local tuning updates the characteristics
+          of the neighbouring intervals in the queue
+
+        :param problem: the problem to solve.
+        :param parameters: parameters of the solution of the optimization problem.
+        """
+        if parameters.mixed_local_period > 0 or parameters.local_tuning:
+            return SearchDataDualQueue(problem)
+        return SearchData(problem)
+
     @staticmethod
     def create_evaluate_method(task: OptimizationTask):
         if task.problem.number_of_objectives > 1:
             return MCOMethodEvaluate(task)
+        elif isinstance(task, MultiFidelityOptimizationTask):
+            return MultiFidelityMethodEvaluate(task)
+        elif task.pruner is not None:
+            return PruningMethodEvaluate(task)
         else:
             return IndexMethodEvaluate(task)
 
@@ -65,7 +109,11 @@ class SolverFactory:
                           parameters: SolverParameters):
         index_method_evaluate = SolverFactory.create_evaluate_method(task)
         if isinstance(parameters.url_db, str):
-            return DBManager(parameters.url_db)
+            return DBManager(parameters.url_db,
+                             pool_size=parameters.db_pool_size,
+                             max_overflow=parameters.db_max_overflow,
+                             pool_pre_ping=parameters.db_pool_pre_ping,
+                             pool_recycle=parameters.db_pool_recycle)
         elif parameters.number_of_parallel_points > 1:
             return Calculator(index_method_evaluate, parameters)
         else:
@@ -90,6 +138,10 @@ class SolverFactory:
         """
         if task.problem.number_of_objectives > 1:
             return MCOMethodManyLambdas(parameters, task, evolvent, search_data, calculator)
+        elif task.problem.number_of_fidelities > 1:
+            if task.problem.number_of_discrete_variables > 0:
+                return MultiFidelityMixedIntegerMethod(parameters, task, evolvent, search_data, calculator)
+            return MultiFidelityMethod(parameters, task, evolvent, search_data, calculator)
         elif task.problem.number_of_discrete_variables > 0:
             return MixedIntegerMethod(parameters, task, evolvent, search_data, calculator)
         elif task.problem.number_of_constraints > 0:
@@ -131,6 +183,49 @@ class SolverFactory:
             return ParallelProcess(parameters=parameters, task=task, evolvent=evolvent,
                                    search_data=search_data, method=method, listeners=listeners, calculator=calculator)
 
+    @staticmethod
+    def get_task_parameters(parameters: SolverParameters) -> dict:
+        """
+        Get the parameters of the solution saved with a task in the database, the workers serving
+          several tasks create the tasks by them (see DBMultiTaskWorker). The connection and the role
+          of the process are not saved
+
+        :param parameters: parameters of the solution of the optimization problem.
+        :return: the parameters by their names, the points are saved as dictionaries of their variables.
+        """
+        task_parameters = {name: value for name, value in vars(parameters).items()
+                           if name not in ('url_db', 'main_process')}
+        task_parameters['start_point'] = SolverFactory.point_to_dict(parameters.start_point) \
+            if parameters.start_point else []
+        task_parameters['initial_points'] = [SolverFactory.point_to_dict(point) for point in parameters.initial_points]
+        return task_parameters
+
+    @staticmethod
+    def get_solver_parameters(task_parameters: dict) -> SolverParameters:
+        r"""
+        Create the parameters of the solution from the parameters saved with a task, see get_task_parameters
+
+        :param task_parameters: the parameters by their names.
+        :return: parameters of the solution of the optimization problem.
+        """
+        parameters = SolverParameters()
+        vars(parameters).update(task_parameters)
+        if parameters.start_point:
+            parameters.start_point = SolverFactory.dict_to_point(parameters.start_point)
+        parameters.initial_points = [SolverFactory.dict_to_point(point) for point in parameters.initial_points]
+        return parameters
+
+    @staticmethod
+    def point_to_dict(point: Point) -> dict:
+        return {
+            'float_variables': [float(value) for value in point.float_variables],
+            'discrete_variables': [] if point.discrete_variables is None else list(point.discrete_variables),
+        }
+
+    @staticmethod
+    def dict_to_point(point: dict) -> Point:
+        return Point(point['float_variables'], point['discrete_variables'])
+
     @staticmethod
     def create_db_process(parameters: SolverParameters,
                           task: OptimizationTask,
@@ -139,10 +234,14 @@ class SolverFactory:
                           method: Method,
                           listeners: List[Listener],
                           db_manager: DBManager):
-        is_creator = db_manager.set_task(parameters.task_name)
+        is_creator = db_manager.set_task(parameters.task_name, parameters.task_priority,
+                                         SolverFactory.get_task_parameters(parameters))
         if parameters.main_process is None:
             parameters.main_process = is_creator
-        if parameters.main_process:
+        if parameters.main_process and parameters.async_scheme:
+            return AsyncDBProcess(parameters=parameters, task=task, evolvent=evolvent,
+                                  search_data=search_data, method=method, listeners=listeners, db_manager=db_manager)
+        elif parameters.main_process:
             return DBProcess(parameters=parameters, task=task, evolvent=evolvent,
                              search_data=search_data, method=method, listeners=listeners, db_manager=db_manager)
         else:
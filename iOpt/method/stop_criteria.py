@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from iOpt.problem import Problem
+from iOpt.solver_parametrs import SolverParameters
+
+
+class StopCriterion(ABC):
+    """
+    Base class of the additional stop criteria of the search. The search stops when any of the criteria is met,
+      the name of the criterion is saved in the stop_reason of the solution
+    """
+
+    name: str = ''
+
+    @abstractmethod
+    def is_met(self, method) -> bool:
+        r"""
+        Check the criterion after an iteration
+
+        :param method: the search method.
+        :return: True if the search should be stopped.
+        """
+        pass
+
+
+class StagnationCriterion(StopCriterion):
+    """
+    The search stops if the estimate of the optimum has not improved for a given number of iterations
+    """
+
+    name = 'stagnation'
+
+    def __init__(self, iterations: int, tolerance: float = 0.0):
+        r"""
+        Constructor of the StagnationCriterion class
+
+        :param iterations: number of iterations without improvement.
+        :param tolerance: relative decrease of the best value since the last improvement
+          that counts as an improvement.
+        """
+        self.iterations = iterations
+        self.tolerance = tolerance
+        self.best_index = -1
+        self.best_z = np.infty
+        self.improvement_iteration = 0
+
+    def is_met(self, method) -> bool:
+        if method.best is None:
+            return False
+        index, z = method.best.get_index(), method.best.get_z()
+        if index > self.best_index or z < self.best_z - self.tolerance * abs(self.best_z):
+            self.best_index, self.best_z = index, z
+            self.improvement_iteration = method.iterations_count
+        return method.iterations_count - self.improvement_iteration >= self.iterations
+
+
+class TargetValueCriterion(StopCriterion):
+    """
+    The search stops when a feasible value of the objective not greater than the target is found
+    """
+
+    name = 'target_value'
+
+    def __init__(self, target_value: float):
+        r"""
+        Constructor of the TargetValueCriterion class
+
+        :param target_value: the target value of the objective.
+        """
+        self.target_value = target_value
+
+    def is_met(self, method) -> bool:
+        return is_feasible_optimum(method) and method.best.get_z() <= self.target_value
+
+
+class RelativeAccuracyCriterion(StopCriterion):
+    """
+    The search stops when the best value is within the relative accuracy of the reference value:
+      z - reference <= accuracy * max(abs(reference), 1)
+    """
+
+    name = 'relative_accuracy'
+
+    def __init__(self, reference_value: float, accuracy: float):
+        r"""
+        Constructor of the RelativeAccuracyCriterion class
+
+        :param reference_value: the known optimal or the target value of the objective.
+        :param accuracy: relative accuracy.
+        """
+        self.reference_value = reference_value
+        self.accuracy = accuracy
+
+    def is_met(self, method) -> bool:
+        return is_feasible_optimum(method) and \
+            method.best.get_z() - self.reference_value <= self.accuracy * max(abs(self.reference_value), 1.0)
+
+
+class EvaluationTimeCriterion(StopCriterion):
+    """
+    The search stops when the total processor time of the calculations of the functionals exceeds the budget
+    """
+
+    name = 'evaluation_time'
+
+    def __init__(self, time_limit: float):
+        r"""
+        Constructor of the EvaluationTimeCriterion class
+
+        :param time_limit: budget of the processor time in seconds.
+        """
+        self.time_limit = time_limit
+
+    def is_met(self, method) -> bool:
+        return method.search_data.solution.evaluation_time >= self.time_limit
+
+
+def is_feasible_optimum(method) -> bool:
+    r"""
+    Check whether the estimate of the optimum is a trial with all the functionals calculated
+
+    :param method: the search method.
+    :return: True if the best trial has the index of the objective.
+    """
+    return method.best is not None and method.best.get_index() == method.numberOfAllFunctions - 1
+
+
+def get_known_optimum_value(problem: Problem) -> float | None:
+    r"""
+    Get the known optimal value of the objective of the problem
+
+    :param problem: the problem.
+    :return: the value, None if the optimum is not known.
+    """
+    if len(problem.known_optimum) == 0 or len(problem.known_optimum[0].function_values) == 0:
+        return None
+    return problem.known_optimum[0].function_values[0].value
+
+
+def create_stop_criteria(parameters: SolverParameters, problem: Problem) -> list[StopCriterion]:
+    r"""
+    Create the additional stop criteria given by the parameters
+
+    :param parameters: parameters of the solution of the optimization problem.
+    :param problem: the problem.
+    :return: list of the criteria.
+    """
+    criteria: list[StopCriterion] = []
+    if parameters.stagnation_iterations > 0:
+        criteria.append(StagnationCriterion(parameters.stagnation_iterations, parameters.stagnation_tolerance))
+    if parameters.target_value is not None:
+        criteria.append(TargetValueCriterion(parameters.target_value))
+    if parameters.relative_accuracy > 0:
+        reference_value = parameters.target_value
+        if reference_value is None:
+            reference_value = get_known_optimum_value(problem)
+        criteria.append(RelativeAccuracyCriterion(reference_value, parameters.relative_accuracy))
+    if parameters.evaluation_time_limit > 0:
+        criteria.append(EvaluationTimeCriterion(parameters.evaluation_time_limit))
+    return criteria
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import numpy as np
+from scipy.interpolate import RBFInterpolator
+
+
+class SurrogateScreening:
+    """
+    The SurrogateScreening class predicts the objective by a radial basis function surrogate fitted on the trials.
+      Each prediction uses the nearest trials only, so the surrogate is rebuilt cheaply after every trial.
+      The error of the surrogate is estimated by its predictions of the trials calculated later:
+      a point is unpromising if the prediction minus kappa errors is still worse than the best value
+    """
+
+    def __init__(self,
+                 dimension: int,
+                 kappa: float = 5.0,
+                 neighbors: int = 30,
+                 min_trials: int | None = None,
+                 min_residuals: int = 5,
+                 window: int = 20
+                 ):
+        """
+        Constructor of the SurrogateScreening class
+
+        :param dimension: number of float variables.
+        :param kappa: number of the errors of the surrogate subtracted from the prediction to get the lower bound.
+        :param neighbors: number of the nearest trials used for a prediction.
+        :param min_trials: number of trials to start the predictions, by default 5 * (dimension + 1).
+        :param min_residuals: number of checked predictions to start the screening.
+        :param window: number of the last checked predictions the error is estimated by.
+        """
+        self.dimension = dimension
+        self.kappa = kappa
+        self.neighbors = max(neighbors, dimension + 2)
+        self.min_trials = min_trials if min_trials is not None else 5 * (dimension + 1)
+        self.min_residuals = min_residuals
+        self.window = window
+
+        self.points: list[np.ndarray] = []
+        self.values: list[float] = []
+        self.residuals: list[float] = []
+        self._interpolator: RBFInterpolator | None = None
+
+    def add_trial(self, y, z: float, prediction: float | None = None) -> None:
+        """
+        Add a calculated trial to the surrogate
+
+        :param y: point of the trial.
+        :param z: value of the objective.
+        :param prediction: value predicted before the trial, it is used to estimate the error of the surrogate.
+        """
+        if prediction is not None:
+            self.residuals.append(z - prediction)
+            del self.residuals[:-self.window]
+        self.points.append(np.array(y, dtype=np.double))
+        self.values.append(z)
+        self._interpolator = None
+
+    def predict(self, y) -> float | None:
+        """
+        Predict the objective at a point
+
+        :param y: point.
+        :return: predicted value, None if there are too few trials.
+        """
+        if len(self.points) < self.min_trials:
+            return None
+        if self._interpolator is None:
+            # сглаживание допускает совпадающие точки и зашумленные значения
+            self._interpolator = RBFInterpolator(np.array(self.points), np.array(self.values),
+                                                 neighbors=min(self.neighbors, len(self.points)),
+                                                 kernel='thin_plate_spline', smoothing=1e-10)
+        try:
+            return float(self._interpolator(np.array([y], dtype=np.double))[0])
+        except np.linalg.LinAlgError:
+            return None
+
+    def get_error(self) -> float | None:
+        """
+        Get the root mean square error of the last checked predictions
+
+        :return: the error, None if there are too few checked predictions.
+        """
+        if len(self.residuals) < self.min_residuals:
+            return None
+        return float(np.sqrt(np.mean(np.square(self.residuals))))
+
+    def is_unpromising(self, prediction: float | None, best_z: float) -> bool:
+        """
+        Check that the lower bound of the prediction can not beat the best value
+
+        :param prediction: predicted value.
+        :param best_z: best calculated value.
+        :return: True if the point can be given the approximate value.
+        """
+        error = self.get_error()
+        if prediction is None or error is None:
+            return False
+        return prediction - self.kappa * error > best_z
@@ -15,6 +15,8 @@ class Problem(ABC):
         self.number_of_discrete_variables: int = 0
         self.number_of_objectives: int = 0
         self.number_of_constraints: int = 0
+        # число уровней точности вычисления критерия, последний уровень - полное вычисление calculate
+        self.number_of_fidelities: int = 1
 
         self.float_variable_names: np.ndarray(shape=(1), dtype=str) = []
         self.discrete_variable_names: np.ndarray(shape=(1), dtype=str) = []
@@ -24,6 +26,9 @@ class Problem(ABC):
         self.discrete_variable_values: np.ndarray(shape=(1, 1), dtype=str) = []
 
         self.known_optimum: np.ndarray(shape=(1), dtype=Trial) = []
+        # задается решателем на время вычисления критерия, если включена остановка бесперспективных испытаний;
+        # сам pruner хранится в задаче оптимизации (OptimizationTask), задача может решаться несколькими решателями
+        self.pruner = None
 
     def calculate(self, point: Point, function_value: FunctionValue) -> FunctionValue:
         """
@@ -34,6 +39,35 @@ class Problem(ABC):
         function_value.value = 0;
         return function_value
 
+    def calculate_fidelity(self, point: Point, function_value: FunctionValue, fidelity: int) -> FunctionValue:
+        """
+        Calculate the objective at a given point with a reduced fidelity, e.g. on a subsample of the data.
+          For a problem with number_of_fidelities > 1 this method should be overloaded,
+          the full fidelity number_of_fidelities - 1 is calculated by :meth:`calculate`
+
+        :param fidelity: fidelity from 0 (the cheapest) to number_of_fidelities - 2.
+        :return: Calculated value of the function."""
+        return self.calculate(point, function_value)
+
+    def report(self, step: int, value: float) -> None:
+        """
+        Report an intermediate value of the objective being calculated by :meth:`calculate`,
+          e.g. the mean score of the folds of a cross-validation calculated so far
+
+        :param step: number of the step of the calculation.
+        :param value: intermediate value of the objective, the smaller the better."""
+        if self.pruner is not None:
+            self.pruner.report(step, value)
+
+    def should_prune(self) -> bool:
+        """
+        Ask the solver whether the calculation is unpromising by the reported intermediate values.
+          If so, :meth:`calculate` may raise :class:`iOpt.method.pruner.TrialPruned`,
+          the trial is saved with the last reported value
+
+        :return: True if the calculation should be stopped."""
+        return self.pruner is not None and self.pruner.should_prune()
+
     def calculateAllFunction(self, point: Point, function_values: np.ndarray(shape=(1), dtype=FunctionValue)) -> \
             np.ndarray(shape=(1), dtype=FunctionValue):
         """
@@ -13,7 +13,9 @@ class Solution:
                  number_of_global_trials: int = 1,
                  number_of_local_trials: int = 0,
                  solving_time: np.double = 0.0,
-                 solution_accuracy: np.double = 0.0
+                 solution_accuracy: np.double = 0.0,
+                 evaluation_time: np.double = 0.0,
+                 stop_reason: str | None = None
                  ):
         """
         Class constructor
@@ -24,6 +26,9 @@ class Solution:
         :param number_of_local_trials: Number of local search iterations performed.
         :param solving_time: Problem solution time.
         :param solution_accuracy: Accuracy of the solution found.
+        :param evaluation_time: Total processor time of the calculations of the functionals in seconds.
+        :param stop_reason: Criterion that stopped the search: 'accuracy', 'iterations', 'timeout'
+             or the name of an additional stop criterion.
         """
 
         self.problem = problem
@@ -33,3 +38,5 @@ class Solution:
         self.number_of_local_trials = number_of_local_trials
         self.solving_time = solving_time
         self.solution_accuracy = solution_accuracy
+        self.evaluation_time = evaluation_time
+        self.stop_reason = stop_reason
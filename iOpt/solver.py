@@ -5,13 +5,13 @@ import numpy as np
 from iOpt.evolvent.evolvent import Evolvent
 from iOpt.method.grid_search_method import GridSearchMethod
 from iOpt.method.calculator import Calculator
+from iOpt.method.export import export_trials
 from iOpt.method.index_method_evaluate import IndexMethodEvaluate
 from iOpt.method.listener import Listener
 from iOpt.method.optim_task import OptimizationTask
-from iOpt.method.search_data import SearchData
 from iOpt.method.solverFactory import SolverFactory
+from iOpt.method.stop_criteria import StopCriterion, get_known_optimum_value
 from iOpt.problem import Problem
-from iOpt.routine.timeout import timeout
 from iOpt.solution import Solution
 from iOpt.solver_parametrs import SolverParameters
 
@@ -41,7 +41,7 @@ class Solver:
 
         self.__listeners: List[Listener] = []
 
-        self.search_data = SearchData(problem)
+        self.search_data = SolverFactory.create_search_data(problem, parameters)
         self.evolvent = Evolvent(problem.lower_bound_of_float_variables, problem.upper_bound_of_float_variables,
                                  problem.number_of_float_variables)
         self.task = SolverFactory.create_task(problem, parameters)
@@ -62,23 +62,8 @@ class Solver:
         :return: optimization problem solution.
         """
         Solver.check_parameters(self.problem, self.parameters)
-        if self.parameters.timeout < 0:
-            sol = self.process.solve()
-        else:
-            solv_with_timeout = timeout(seconds=self.parameters.timeout * 60)(self.process.solve)
-            try:
-                solv_with_timeout()
-                sol = self.get_results()
-            except Exception as exc:
-                print(exc)
-                sol = self.get_results()
-                sol.solving_time += self.parameters.timeout * 60
-                self.method.recalcR = True
-                self.method.recalcM = True
-                status = self.method.check_stop_condition()
-                for listener in self.__listeners:
-                    listener.on_method_stop(self.search_data, self.get_results(), status)
-        return sol
+        # ограничение по времени (timeout) проверяется процессом между итерациями
+        return self.process.solve()
 
     def do_global_iteration(self, number: int = 1):
         """
@@ -106,39 +91,71 @@ class Solver:
         """
         return self.process.get_results()
 
-    def save_progress(self, file_name: str = None, mode = 'full') -> str:
+    def save_progress(self, file_name: str = None, mode = 'full', format = 'json') -> str:
         """
         Save the optimization process to a file
 
         :param file_name: file name.
+        :param format: 'json' - the whole search information in one JSON document,
+             'jsonl' - append the trials performed since the previous saving to the checkpoint log,
+             'npz' - columnar NumPy arrays of the trials (see iOpt.method.checkpoint.load_arrays).
         """
 
         if file_name is None:
             file_name = "log_" + self.parameters.to_string() + "_" + str(time())
 
-        self.process.save_progress(file_name=file_name, mode=mode)
+        self.process.save_progress(file_name=file_name, mode=mode, format=format)
 
         return file_name
 
-    def load_progress(self, file_name: str, mode = 'full') -> None:
+    def load_progress(self, file_name: str, mode = 'full', format = 'json') -> None:
         """
         Load the optimization process from a file
 
         :param file_name: file name.
+        :param format: 'json', 'jsonl' or 'npz', see save_progress.
+        """
+        Solver.check_parameters(self.problem, self.parameters)
+        self.process.load_progress(file_name=file_name, mode=mode, format=format)
+
+    def warm_start(self, trials) -> int:
+        """
+        Add already performed trials to the search information before the search, see Process.warm_start.
+          The trials may come from a previous run with other bounds or r, e.g. list(solver.search_data)
+
+        :param trials: performed trials (Trial) or the solution of a previous run.
+        :return: number of the added trials.
         """
         Solver.check_parameters(self.problem, self.parameters)
-        self.process.load_progress(file_name=file_name, mode=mode)
+        return self.process.warm_start(trials)
 
-        if (self.problem.number_of_discrete_variables > 0):
-            self.process.method.iterations_count = self.process.search_data.get_count() - (
-                    len(self.method.GetDiscreteParameters(self.problem)) + 1)  # -2
-        else:
-            self.process.method.iterations_count = self.process.search_data.get_count() - 2
+    def ask(self, number: int = 1) -> list:
+        """
+        Get the points of new trials to calculate outside the solver, see Process.ask
+
+        :param number: number of points.
+        :return: list of points (SearchDataItem).
+        """
+        Solver.check_parameters(self.problem, self.parameters)
+        return self.process.ask(number)
+
+    def tell(self, points: list) -> None:
+        """
+        Add the points given by ask and calculated outside the solver to the search information
 
-        if mode == 'only search_data':
-            self.process.search_data.solution.number_of_global_trials = self.process.method.iterations_count
+        :param points: calculated points.
+        """
+        self.process.tell(points)
 
+    def export_trials(self, file_name: str, format: str = 'parquet') -> None:
+        """
+        Export the performed trials into a columnar file for analysis, e.g. with pandas.read_parquet.
+          Requires the pyarrow package: pip install iOpt[parquet]
 
+        :param file_name: file name.
+        :param format: 'parquet' - Parquet file, 'arrow' - Arrow IPC (Feather) file.
+        """
+        export_trials(self.process, file_name, format)
 
     def refresh_listener(self) -> None:
         """
@@ -156,6 +173,15 @@ class Solver:
 
         self.__listeners.append(listener)
 
+    def add_stop_criterion(self, criterion: StopCriterion) -> None:
+        """
+        Add a stop criterion checked together with the criteria given by the parameters
+
+        :param criterion: object implementing the check of the criterion.
+        """
+
+        self.method.stop_criteria.append(criterion)
+
     @staticmethod
     def check_parameters(problem: Problem,
                          parameters: SolverParameters = SolverParameters()) -> None:
@@ -177,6 +203,68 @@ class Solver:
             raise Exception("Evolvent density should be within [2,20]")
         if parameters.eps_r < 0 or parameters.eps_r >= 1:
             raise Exception("The epsilon redundancy parameter must be within [0, 1)")
+        if parameters.parallel_quorum < 0 or parameters.parallel_quorum > parameters.number_of_parallel_points:
+            raise Exception("The quorum of a parallel batch should be within [0, number_of_parallel_points]")
+        if parameters.checkpoints_to_keep < 1:
+            raise Exception("The number of the kept checkpoints should be at least 1")
+        if parameters.mixed_local_period < 0:
+            raise Exception("The period of local iterations must not be negative")
+        if parameters.recalc_threshold < 0:
+            raise Exception("The threshold of the recalculation of the characteristics must not be negative")
+        if parameters.surrogate_screening:
+            if problem.number_of_constraints > 0 or problem.number_of_objectives > 1 or \
+                    problem.number_of_discrete_variables > 0:
+                raise Exception("Surrogate screening is possible for problems with float variables, "
+                                "one criterion and no constraints")
+            if parameters.number_of_parallel_points > 1:
+                raise Exception("Surrogate screening is possible without parallel trials only")
+            if parameters.surrogate_kappa < 0 or parameters.surrogate_neighbors < 1:
+                raise Exception("The parameters of the surrogate should be surrogate_kappa >= 0 "
+                                "and surrogate_neighbors >= 1")
+        if problem.number_of_fidelities < 1:
+            raise Exception("The number of fidelities must be positive")
+        if problem.number_of_fidelities > 1:
+            if problem.number_of_objectives > 1:
+                raise Exception("Several fidelities are possible for problems with one criterion only")
+            if parameters.number_of_parallel_points > 1:
+                raise Exception("Several fidelities are possible without parallel trials only")
+            if parameters.fidelity_margin < 0:
+                raise Exception("The margin of the fidelities must not be negative")
+        if parameters.pruner not in ('none', 'median', 'bound'):
+            raise Exception("The pruner should be 'none', 'median' or 'bound'")
+        if parameters.pruner != 'none':
+            if problem.number_of_objectives > 1 or problem.number_of_fidelities > 1:
+                raise Exception("Pruning is possible for problems with one criterion and one fidelity only")
+            if parameters.number_of_parallel_points > 1:
+                raise Exception("Pruning is possible without parallel trials only")
+            if parameters.surrogate_screening:
+                raise Exception("Pruning is not combined with surrogate screening")
+            if parameters.pruning_min_trials < 1 or parameters.pruning_warmup_steps < 0:
+                raise Exception("The parameters of the pruner should be pruning_min_trials >= 1 "
+                                "and pruning_warmup_steps >= 0")
+        if parameters.stagnation_iterations > 0 or parameters.target_value is not None or \
+                parameters.relative_accuracy > 0:
+            if problem.number_of_objectives > 1:
+                raise Exception("The stop criteria by the best value are possible for problems with one criterion only")
+            if parameters.stagnation_tolerance < 0:
+                raise Exception("The tolerance of the stagnation must not be negative")
+        if parameters.stagnation_iterations < 0 or parameters.relative_accuracy < 0:
+            raise Exception("The number of the stagnation iterations and the relative accuracy must not be negative")
+        if parameters.relative_accuracy > 0 and parameters.target_value is None and \
+                get_known_optimum_value(problem) is None:
+            raise Exception("The relative accuracy needs the target value or the known optimum of the problem")
+        if parameters.adaptive_r:
+            if 0 < parameters.adaptive_r_max < parameters.r or parameters.adaptive_r_max < 0:
+                raise Exception("The initial reliability parameter of the adaptive schedule must not be less than r")
+            if parameters.adaptive_r_period < 0:
+                raise Exception("The period of the adaptive reliability parameter must not be negative")
+        if parameters.async_stop_policy not in ('drain', 'drain_timeout', 'terminate'):
+            raise Exception("The stop policy of the asynchronous scheme should be 'drain', 'drain_timeout' or 'terminate'")
+        if parameters.async_stop_timeout < 0:
+            raise Exception("The stop timeout of the asynchronous scheme must not be negative")
+        if parameters.async_min_parallel_points < 1 or \
+                parameters.async_min_parallel_points > parameters.number_of_parallel_points:
+            raise Exception("The minimum number of trials in flight should be within [1, number_of_parallel_points]")
 
         if problem.number_of_float_variables < 1:
             raise Exception("Must have at least one float variable")
@@ -220,6 +308,21 @@ class Solver:
                                                    parameters.start_point.float_variables):
                 if y < lower_bound or y > upper_bound:
                     raise Exception("Incorrect start point coordinate")
+        for point in parameters.initial_points:
+            if len(point.float_variables) != problem.number_of_float_variables:
+                raise Exception("Incorrect initial point size")
+            if problem.number_of_discrete_variables > 0 and \
+                    len(point.discrete_variables or []) != problem.number_of_discrete_variables:
+                raise Exception("Incorrect initial point discrete variables")
+            for lower_bound, upper_bound, y in zip(problem.lower_bound_of_float_variables,
+                                                   problem.upper_bound_of_float_variables,
+                                                   point.float_variables):
+                if y < lower_bound or y > upper_bound:
+                    raise Exception("Incorrect initial point coordinate")
+        if parameters.initial_design not in ('uniform', 'sobol', 'halton', 'lhs'):
+            raise Exception("The initial design should be 'uniform', 'sobol', 'halton' or 'lhs'")
+        if parameters.initial_design_size < 0:
+            raise Exception("The size of the initial design must not be negative")
         if parameters.number_of_lambdas:
             if parameters.number_of_lambdas < 0:
                 raise Exception("Number of lambda sets is incorrect, parameters.number_of_lambdas <= 0")
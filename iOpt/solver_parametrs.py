@@ -15,12 +15,51 @@ class SolverParameters:
                  eps_r: np.double = 0.01,
                  refine_solution: bool = False,
                  start_point: Point = [],
+                 initial_points: list[Point] | None = None,
+                 initial_design: str = 'uniform',
+                 initial_design_size: int = 0,
                  number_of_parallel_points: int = 1,
                  async_scheme: bool = False,
+                 parallel_quorum: int = 0,
+                 async_stop_policy: str = 'drain',
+                 async_stop_timeout: float = 0,
+                 async_adaptive_concurrency: bool = False,
+                 async_min_parallel_points: int = 1,
                  timeout: int = -1,
+                 checkpoint_dir: str | None = None,
+                 checkpoint_every_iterations: int = 0,
+                 checkpoint_every_seconds: float = 0,
+                 checkpoints_to_keep: int = 3,
+                 checkpoint_format: str = 'json',
+                 checkpoint_resume: bool = True,
                  proportion_of_global_iterations: float = 0.95,
+                 mixed_local_period: int = 0,
+                 mixed_local_alpha: float = 15,
+                 local_tuning: bool = False,
+                 recalc_threshold: float = 0.0,
+                 surrogate_screening: bool = False,
+                 surrogate_kappa: float = 5.0,
+                 surrogate_neighbors: int = 30,
+                 fidelity_margin: float = 0.25,
+                 pruner: str = 'none',
+                 pruning_min_trials: int = 5,
+                 pruning_warmup_steps: int = 1,
+                 stagnation_iterations: int = 0,
+                 stagnation_tolerance: float = 0.0,
+                 target_value: float | None = None,
+                 relative_accuracy: float = 0.0,
+                 evaluation_time_limit: float = -1,
+                 adaptive_r: bool = False,
+                 adaptive_r_max: float = 0,
+                 adaptive_r_period: int = 0,
                  url_db: str | None = None,
                  task_name: str = '',
+                 task_priority: int = 0,
+                 db_pool_size: int | None = None,
+                 db_max_overflow: int | None = None,
+                 db_pool_recycle: int = -1,
+                 db_pool_pre_ping: bool = False,
+                 db_task_progress: bool = False,
                  main_process: bool | None = None,
                  start_lambdas: list = [],
                  number_of_lambdas: int = 10,
@@ -41,14 +80,102 @@ class SolverParameters:
              to the exact solution, eps_r>0 - fast convergence to the neighbourhood of the solution.
         :param refine_solution: if true, the solution will be refined using the local method.
         :param start_point: point of initial approximation to the solution.
+        :param initial_points: more points evaluated at the first iteration together with the start point.
+        :param initial_design: placement of the points of the first iteration: 'uniform' - uniformly on the evolvent,
+             'sobol', 'halton' or 'lhs' (Latin hypercube) - in the search region.
+        :param initial_design_size: number of points of the initial design evaluated in one batch at the first
+             iteration, including the start point; 0 - number_of_parallel_points.
         :param number_of_parallel_points: number of parallel computed trials.
+        :param parallel_quorum: number of completed trials that commits a batch of the synchronous parallel scheme,
+             the rest are carried over to the next batch; 0 - wait for all number_of_parallel_points trials.
+        :param async_stop_policy: what the asynchronous scheme does with the trials running when the search stops:
+             'drain' - wait for them, 'drain_timeout' - wait at most async_stop_timeout seconds,
+             'terminate' - terminate the workers at once, the results of the running trials are lost.
+        :param async_stop_timeout: time in seconds to wait for the running trials with the 'drain_timeout' policy.
+        :param async_adaptive_concurrency: if true, the asynchronous scheme adjusts the number of trials in flight
+             between async_min_parallel_points and number_of_parallel_points by the observed throughput.
+        :param async_min_parallel_points: minimum number of trials in flight with the adaptive concurrency.
         :param timeout: calculation time limit in minutes.
+        :param checkpoint_dir: directory for automatic checkpoints, None - checkpoints are not saved.
+        :param checkpoint_every_iterations: save a checkpoint every given number of iterations, 0 - never.
+        :param checkpoint_every_seconds: save a checkpoint every given number of seconds, 0 - never.
+        :param checkpoints_to_keep: number of the last checkpoints kept in the directory.
+        :param checkpoint_format: format of the checkpoints, 'json', 'npz' or 'jsonl' - one append-only
+             checkpoint log in the directory.
+        :param checkpoint_resume: if true, the search continues from the last checkpoint of the directory.
         :param proportion_of_global_iterations: share of global iterations in the search when using the local method.
+        :param mixed_local_period: number of global iterations between the iterations by the local characteristic
+             (mixed scheme), the period adapts during the search; 0 - global iterations only.
+        :param mixed_local_alpha: the higher the value, the more the local iterations concentrate near the optimum
+             estimate.
+        :param local_tuning: if true, the estimate of the Holder constant of each interval combines the slopes
+             of the interval and its neighbours with the global estimate scaled by the interval length.
+        :param recalc_threshold: relative change of the estimates of the Holder constants (and the corresponding shift
+             of the optimum estimates) that triggers the full recalculation of the characteristics;
+             0 - recalculate at every change.
+        :param surrogate_screening: if true, a point whose value predicted by the surrogate of the trials
+             can not beat the best value gets the approximate value instead of the trial; the point is calculated
+             when an interval next to it is chosen. Only for problems with float variables, one criterion
+             and no constraints, solved without parallel trials.
+        :param surrogate_kappa: the lower bound of the prediction is the predicted value minus surrogate_kappa
+             root mean square errors of the previous predictions.
+        :param surrogate_neighbors: number of the nearest trials used by the surrogate for a prediction.
+        :param fidelity_margin: for a problem with several fidelities, a point is calculated with the next fidelity
+             if its value is within fidelity_margin * (worst - best) of the best value of the current fidelity.
+        :param pruner: rule stopping the calculations of the objective by the intermediate values reported
+             with :meth:`Problem.report`: 'none', 'median' - worse than the median of the previous trials at the step,
+             'bound' - can not beat the best value by the deviations of the intermediate values from the final ones.
+             The trial of a stopped calculation keeps the last intermediate value, which is used by the search rule
+             but is not taken as the optimum. Only for problems with one criterion and one fidelity,
+             solved without parallel trials.
+        :param pruning_min_trials: number of the previous trials with a value at a step needed to prune at this step.
+        :param pruning_warmup_steps: a calculation is not pruned at the steps less than pruning_warmup_steps.
+        :param stagnation_iterations: stop the search if the best value has not improved
+             for the given number of iterations; 0 - do not check.
+        :param stagnation_tolerance: relative decrease of the best value that counts as an improvement.
+        :param target_value: stop the search when a feasible value not greater than the target is found.
+        :param relative_accuracy: stop the search when the best value z satisfies
+             z - f* <= relative_accuracy * max(abs(f*), 1), f* is target_value if given, otherwise the known optimum
+             of the problem; 0 - do not check.
+        :param evaluation_time_limit: stop the search when the total processor time of the calculations
+             of the functionals exceeds the given number of seconds; -1 - no limit.
+        :param adaptive_r: if true, the search starts with the reliability parameter adaptive_r_max and lowers it
+             down to r when the optimum estimate does not improve and the estimates of the Holder constants are
+             stable over a period; r is raised back if the estimates grow.
+        :param adaptive_r_max: the initial reliability parameter of the adaptive schedule; 0 - 2 * r.
+        :param adaptive_r_period: number of iterations between the changes of the reliability parameter;
+             0 - 10 * (number of float variables + 1).
+        :param task_priority: priority of the task in the database, used by workers serving several tasks.
+        :param db_pool_size: number of database connections kept open, None - the SQLAlchemy default.
+        :param db_max_overflow: number of database connections allowed in addition to db_pool_size,
+             None - the SQLAlchemy default.
+        :param db_pool_recycle: recycle database connections older than the given number of seconds, -1 - never.
+        :param db_pool_pre_ping: test database connections for liveness before using them.
+        :param db_task_progress: if true, the coordinator writes a progress row into the database on every iteration.
         """
         self.eps = eps
         self.r = r
         self.iters_limit = iters_limit
         self.proportion_of_global_iterations = proportion_of_global_iterations
+        self.mixed_local_period = mixed_local_period
+        self.mixed_local_alpha = mixed_local_alpha
+        self.local_tuning = local_tuning
+        self.recalc_threshold = recalc_threshold
+        self.surrogate_screening = surrogate_screening
+        self.surrogate_kappa = surrogate_kappa
+        self.surrogate_neighbors = surrogate_neighbors
+        self.fidelity_margin = fidelity_margin
+        self.pruner = pruner
+        self.pruning_min_trials = pruning_min_trials
+        self.pruning_warmup_steps = pruning_warmup_steps
+        self.stagnation_iterations = stagnation_iterations
+        self.stagnation_tolerance = stagnation_tolerance
+        self.target_value = target_value
+        self.relative_accuracy = relative_accuracy
+        self.evaluation_time_limit = evaluation_time_limit
+        self.adaptive_r = adaptive_r
+        self.adaptive_r_max = adaptive_r_max
+        self.adaptive_r_period = adaptive_r_period
         if refine_solution:
             self.global_method_iteration_count = int(self.iters_limit * self.proportion_of_global_iterations)
             self.local_method_iteration_count = self.iters_limit - self.global_method_iteration_count
@@ -60,11 +187,31 @@ class SolverParameters:
         self.eps_r = eps_r
         self.refine_solution = refine_solution
         self.start_point = start_point
+        self.initial_points = initial_points if initial_points is not None else []
+        self.initial_design = initial_design
+        self.initial_design_size = initial_design_size
         self.number_of_parallel_points = number_of_parallel_points
         self.async_scheme = async_scheme
+        self.parallel_quorum = parallel_quorum
+        self.async_stop_policy = async_stop_policy
+        self.async_stop_timeout = async_stop_timeout
+        self.async_adaptive_concurrency = async_adaptive_concurrency
+        self.async_min_parallel_points = async_min_parallel_points
         self.timeout = timeout
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_every_iterations = checkpoint_every_iterations
+        self.checkpoint_every_seconds = checkpoint_every_seconds
+        self.checkpoints_to_keep = checkpoints_to_keep
+        self.checkpoint_format = checkpoint_format
+        self.checkpoint_resume = checkpoint_resume
         self.url_db = url_db
         self.task_name = task_name
+        self.task_priority = task_priority
+        self.db_pool_size = db_pool_size
+        self.db_max_overflow = db_max_overflow
+        self.db_pool_recycle = db_pool_recycle
+        self.db_pool_pre_ping = db_pool_pre_ping
+        self.db_task_progress = db_task_progress
         self.main_process = main_process
         self.start_lambdas = start_lambdas
         self.number_of_lambdas = number_of_lambdas
@@ -31,6 +31,7 @@ setup(
    python_requires='>=3.9',
    packages=find_packages(exclude=["*test*", "examples", "benchmarks"]),
    install_requires=_get_requirements('requirements.txt'),
+   extras_require={'parquet': ['pyarrow']},
    classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: BSD License",
@@ -1,7 +1,12 @@
 import json
+import tempfile
 import unittest
+from unittest import mock
 import os
 
+import numpy as np
+
+from iOpt.method.checkpoint import load_arrays
 from iOpt.solver import Solver
 from iOpt.solver_parametrs import SolverParameters
 from problems.GKLS import GKLS
@@ -181,6 +186,179 @@ class TestLoadProgress(unittest.TestCase):
             if os.path.isfile(path):
                 os.remove(path)
 
+    def test_CheckpointLog(self):
+        for self.problem in [Rastrigin(2), RastriginInt(5, 2)]:
+            with self.subTest(problem=self.problem.name), tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, 'checkpoint.jsonl')
+
+                self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=30, refine_solution=False)
+                self.solver = Solver(self.problem, parameters=self.params)
+                self.solver.solve()
+                self.solver.save_progress(path, format='jsonl')
+                self.solver.parameters.global_method_iteration_count = 50
+                self.solver.solve()
+                self.solver.save_progress(path, format='jsonl')
+                # запись, оборванная при аварийном завершении
+                with open(path, 'a') as f:
+                    f.write('{"type":"trial","x":')
+
+                self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=100, refine_solution=False)
+                self.solver = Solver(self.problem, parameters=self.params)
+                self.solver.load_progress(path, format='jsonl')
+                self.assertEqual(50, self.solver.method.iterations_count)
+                self.sol50_100 = self.solver.solve()
+                self.solver.save_progress(path, format='jsonl')
+
+                solver100 = Solver(self.problem, parameters=self.params)
+                self.sol100 = solver100.solve()
+
+                self.assertEqual(self.sol100.best_trials[0].get_z(), self.sol50_100.best_trials[0].get_z())
+                self.assertEqual(self.sol100.number_of_global_trials, self.sol50_100.number_of_global_trials)
+                self.assertEqual(self.sol100.solution_accuracy, self.sol50_100.solution_accuracy)
+
+                self.solver = Solver(self.problem, parameters=self.params)
+                self.solver.load_progress(path, format='jsonl')
+                self.assertEqual([item.get_x() for item in solver100.search_data],
+                                 [item.get_x() for item in self.solver.search_data])
+
+    def test_NpzProgress(self):
+        for self.problem in [Stronginc2(), RastriginInt(5, 2)]:
+            with self.subTest(problem=self.problem.name), tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, 'progress.npz')
+
+                self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=50, refine_solution=False)
+                self.solver = Solver(self.problem, parameters=self.params)
+                self.sol50 = self.solver.solve()
+                self.solver.save_progress(path, format='npz')
+
+                arrays = load_arrays(path)
+                self.assertIsInstance(arrays['x'], np.memmap)
+                self.assertEqual(50, len(arrays['x']))
+                feasible = arrays['index'] == np.max(arrays['index'])
+                self.assertEqual(self.sol50.best_trials[0].get_z(), np.min(arrays['z'][feasible]))
+                del arrays
+
+                self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=100, refine_solution=False)
+                self.solver = Solver(self.problem, parameters=self.params)
+                self.solver.load_progress(path, format='npz')
+                self.sol50_100 = self.solver.solve()
+
+                solver100 = Solver(self.problem, parameters=self.params)
+                self.sol100 = solver100.solve()
+
+                self.assertEqual(self.sol100.best_trials[0].get_z(), self.sol50_100.best_trials[0].get_z())
+                self.assertEqual(self.sol100.number_of_global_trials, self.sol50_100.number_of_global_trials)
+                self.assertEqual([item.get_x() for item in solver100.search_data],
+                                 [item.get_x() for item in self.solver.search_data])
+
+    def test_AutomaticCheckpoints(self):
+        self.problem = Rastrigin(2)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=50, refine_solution=False,
+                                           checkpoint_dir=tmp_dir, checkpoint_every_iterations=10,
+                                           checkpoints_to_keep=2)
+            self.solver = Solver(self.problem, parameters=self.params)
+            self.solver.solve()
+            self.assertEqual(['checkpoint_000000041.json', 'checkpoint_000000050.json'], sorted(os.listdir(tmp_dir)))
+
+            # повторный запуск с тем же каталогом продолжает поиск с последней контрольной точки
+            self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=100, refine_solution=False,
+                                           checkpoint_dir=tmp_dir, checkpoint_every_iterations=10,
+                                           checkpoints_to_keep=2)
+            self.solver = Solver(self.problem, parameters=self.params)
+            self.sol50_100 = self.solver.solve()
+            self.assertEqual(['checkpoint_000000091.json', 'checkpoint_000000100.json'], sorted(os.listdir(tmp_dir)))
+
+        self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=100, refine_solution=False)
+        solver100 = Solver(self.problem, parameters=self.params)
+        self.sol100 = solver100.solve()
+        self.assertEqual(self.sol100.best_trials[0].get_z(), self.sol50_100.best_trials[0].get_z())
+        self.assertEqual([item.get_x() for item in solver100.search_data],
+                         [item.get_x() for item in self.solver.search_data])
+
+    def test_AutomaticCheckpointLog(self):
+        self.problem = Rastrigin(2)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=50, refine_solution=False,
+                                           checkpoint_dir=tmp_dir, checkpoint_every_iterations=10,
+                                           checkpoint_format='jsonl')
+            self.solver = Solver(self.problem, parameters=self.params)
+            with mock.patch('iOpt.method.checkpoint.os.fsync', wraps=os.fsync) as fsync:
+                self.solver.solve()
+            self.assertEqual(['checkpoint.jsonl'], os.listdir(tmp_dir))
+            # каждая дописанная часть журнала сбрасывается на диск
+            self.assertGreaterEqual(fsync.call_count, 5)
+            path = os.path.join(tmp_dir, 'checkpoint.jsonl')
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+            # каждая контрольная точка дописывает только новые испытания
+            self.assertEqual(50, len([record for record in records if record['type'] == 'trial']))
+            self.assertEqual(50, records[-1]['iterations_count'])
+
+            self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=100, refine_solution=False,
+                                           checkpoint_dir=tmp_dir, checkpoint_every_iterations=10,
+                                           checkpoint_format='jsonl')
+            self.solver = Solver(self.problem, parameters=self.params)
+            self.sol50_100 = self.solver.solve()
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+            self.assertEqual(100, len([record for record in records if record['type'] == 'trial']))
+
+        self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=100, refine_solution=False)
+        solver100 = Solver(self.problem, parameters=self.params)
+        self.sol100 = solver100.solve()
+        self.assertEqual(self.sol100.best_trials[0].get_z(), self.sol50_100.best_trials[0].get_z())
+        self.assertEqual([item.get_x() for item in solver100.search_data],
+                         [item.get_x() for item in self.solver.search_data])
+
+    def test_CheckpointsOfPreviousRun(self):
+        self.problem = Rastrigin(2)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # контрольные точки прошлого запуска с большими номерами итераций
+            for iteration in (500, 600):
+                stale_file_name = os.path.join(tmp_dir, f"checkpoint_{iteration:09d}.json")
+                with open(stale_file_name, 'w') as f:
+                    f.write('{}')
+                os.utime(stale_file_name, (1e9, 1e9))
+
+            self.params = SolverParameters(r=2.5, eps=0.01, iters_limit=50, refine_solution=False,
+                                           checkpoint_dir=tmp_dir, checkpoint_every_iterations=10,
+                                           checkpoints_to_keep=2, checkpoint_resume=False)
+            self.solver = Solver(self.problem, parameters=self.params)
+            self.solver.solve()
+            self.assertEqual(['checkpoint_000000041.json', 'checkpoint_000000050.json'], sorted(os.listdir(tmp_dir)))
+            self.assertEqual(os.path.join(tmp_dir, 'checkpoint_000000050.json'),
+                             self.solver.process.checkpointer.get_last_checkpoint())
+
+    def test_SaveProgressIsAtomic(self):
+        self.problem = Rastrigin(2)
+        for format in ('json', 'npz'):
+            with self.subTest(format=format), tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, f'progress.{format}')
+                self.solver = Solver(self.problem, parameters=SolverParameters(r=2.5, eps=0.01, iters_limit=20))
+                self.solver.solve()
+                self.solver.save_progress(path, format=format)
+                with open(path, 'rb') as f:
+                    saved = f.read()
+
+                self.solver.parameters.global_method_iteration_count = 30
+                self.solver.solve()
+                # сбой во время записи не повреждает сохраненный ранее файл
+                with mock.patch('iOpt.method.process.json.dump', side_effect=OSError), \
+                        mock.patch('iOpt.method.checkpoint.np.savez', side_effect=OSError), \
+                        self.assertRaises(OSError):
+                    self.solver.save_progress(path, format=format)
+                with open(path, 'rb') as f:
+                    self.assertEqual(saved, f.read())
+                self.assertEqual([f'progress.{format}'], os.listdir(tmp_dir))
+
+    def test_WrongCheckpointsToKeep(self):
+        for checkpoints_to_keep in (0, -1):
+            with self.assertRaises(Exception):
+                Solver(Rastrigin(2), parameters=SolverParameters(checkpoint_dir='checkpoints',
+                                                                 checkpoint_every_iterations=10,
+                                                                 checkpoints_to_keep=checkpoints_to_keep))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+import numpy as np
+
+from iOpt.problem import Problem
+from iOpt.trial import Point, FunctionValue
+
+
+class SlowProblem(Problem):
+    """Тестовая задача, каждое вычисление которой дополнительно длится delay секунд,
+       delay может зависеть от точки испытания. Если busy, то задержка занимает процессорное время,
+       по которому решатель считает время вычислений"""
+
+    def __init__(self, problem: Problem, delay: float | Callable[[Point], float], busy: bool = False):
+        super().__init__()
+        self.__dict__.update(problem.__dict__)
+        self.problem = problem
+        self.delay = delay
+        self.busy = busy
+
+    def wait(self, point: Point) -> None:
+        delay = self.delay(point) if callable(self.delay) else self.delay
+        if not self.busy:
+            time.sleep(delay)
+            return
+        start = time.process_time()
+        while time.process_time() - start < delay:
+            pass
+
+    def calculate(self, point: Point, function_value: FunctionValue) -> FunctionValue:
+        self.wait(point)
+        return self.problem.calculate(point, function_value)
+
+    def calculateAllFunction(self, point: Point, function_values: np.ndarray(shape=(1), dtype=FunctionValue)) -> \
+            np.ndarray(shape=(1), dtype=FunctionValue):
+        self.wait(point)
+        return self.problem.calculateAllFunction(point, function_values)
@@ -0,0 +1,55 @@
+import unittest
+
+from iOpt.method.adaptive_reliability import AdaptiveReliability
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from problems.rastrigin import Rastrigin
+
+
+class TestAdaptiveReliability(unittest.TestCase):
+    def setUp(self):
+        self.reliability = AdaptiveReliability(r_min=2.0, r_max=4.0, period=10, decay=0.5)
+        self.reliability.update(0, (0, 1.0), [1.0])
+
+    def test_NoChangeWithinPeriod(self):
+        self.assertFalse(self.reliability.update(5, (0, 1.0), [1.0]))
+        self.assertEqual(4.0, self.reliability.r)
+
+    def test_LowerOnStagnation(self):
+        self.assertTrue(self.reliability.update(10, (0, 1.0), [1.0]))
+        self.assertEqual(2.0, self.reliability.r)
+        # r не опускается ниже r_min
+        self.assertFalse(self.reliability.update(20, (0, 1.0), [1.0]))
+        self.assertEqual(2.0, self.reliability.r)
+        self.assertEqual([(10, 2.0)], self.reliability.history)
+
+    def test_KeepOnImprovement(self):
+        self.assertFalse(self.reliability.update(10, (0, 0.5), [1.0]))
+        self.assertFalse(self.reliability.update(20, (1, 2.0), [1.0]))
+        self.assertEqual(4.0, self.reliability.r)
+
+    def test_RaiseOnGrowthOfM(self):
+        self.reliability.update(10, (0, 1.0), [1.0])
+        self.assertTrue(self.reliability.update(20, (0, 0.5), [2.0]))
+        self.assertEqual(4.0, self.reliability.r)
+
+
+class TestSolveAdaptiveReliability(unittest.TestCase):
+    def test_solve(self):
+        problem = Rastrigin(2)
+        params = SolverParameters(r=2.5, eps=0.01, adaptive_r=True, adaptive_r_max=5.0)
+        solver = Solver(problem, parameters=params)
+        sol = solver.solve()
+        reliability = solver.method.reliability
+        self.assertTrue(reliability.history)
+        self.assertTrue(all(2.5 <= r <= 5.0 for _, r in reliability.history))
+        self.assertEqual(reliability.r, solver.method.r)
+        self.assertAlmostEqual(0.0, sol.best_trials[0].function_values[0].value, delta=0.05)
+
+    def test_WrongParameters(self):
+        with self.assertRaises(Exception):
+            Solver(Rastrigin(2), parameters=SolverParameters(r=3.0, adaptive_r=True, adaptive_r_max=2.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
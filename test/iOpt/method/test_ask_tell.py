@@ -0,0 +1,95 @@
+import multiprocessing
+import unittest
+
+from iOpt.method.ask_tell import AskTellServer, run_ask_tell_worker
+from iOpt.method.solverFactory import SolverFactory
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from problems.rastrigin import Rastrigin
+from problems.stronginc2 import Stronginc2
+
+
+class TestAskTell(unittest.TestCase):
+    def ask_tell(self, problem, params: SolverParameters, number: int) -> Solver:
+        solver = Solver(problem, parameters=params)
+        evaluate_method = SolverFactory.create_evaluate_method(solver.task)
+        while not solver.method.check_stop_condition():
+            points = solver.ask(number)
+            for point in points:
+                evaluate_method.calculate_functionals(point)
+            solver.tell(points)
+        return solver
+
+    def test_SameAsSolve(self):
+        for problem in [Rastrigin(1), Stronginc2()]:
+            with self.subTest(problem=problem):
+                params = SolverParameters(r=3.5, eps=0.01, iters_limit=100)
+                sol = Solver(problem, parameters=params).solve()
+                solver = self.ask_tell(problem, params, 1)
+
+                self.assertEqual(sol.number_of_global_trials, solver.search_data.solution.number_of_global_trials)
+                self.assertEqual(list(sol.best_trials[0].point.float_variables),
+                                 list(solver.get_results().best_trials[0].point.float_variables))
+                self.assertEqual(sol.best_trials[0].function_values[0].value,
+                                 solver.get_results().best_trials[0].function_values[0].value)
+
+    def test_FirstIterationIsToldInParts(self):
+        solver = Solver(Rastrigin(1), parameters=SolverParameters(r=3.5, number_of_parallel_points=3))
+        evaluate_method = SolverFactory.create_evaluate_method(solver.task)
+        points = solver.ask(5)
+        self.assertEqual(3, len(points))
+        # следующие точки выдаются только после получения результатов первой итерации
+        self.assertEqual([], solver.ask(1))
+        for point in points:
+            evaluate_method.calculate_functionals(point)
+        solver.tell(points[:1])
+        self.assertEqual(0, solver.search_data.get_count())
+        solver.tell(points[1:])
+        self.assertEqual(5, solver.search_data.get_count())
+
+        points = solver.ask(2)
+        self.assertEqual(2, sum(item.blocked for item in solver.search_data._allTrials))
+        solver.process.cancel_asked_points()
+        self.assertFalse(any(item.blocked for item in solver.search_data._allTrials))
+        self.assertEqual(3, solver.search_data.solution.number_of_global_trials)
+
+
+class TestAskTellServer(unittest.TestCase):
+    def test_Solve(self):
+        problem = Rastrigin(1)
+        solver = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01, iters_limit=100,
+                                                              number_of_parallel_points=2))
+        server = AskTellServer(solver, poll_interval=0.01)
+        server.start()
+        # исполнители не должны наследовать слушающий сокет сервера, как и удаленные исполнители
+        context = multiprocessing.get_context('spawn')
+        workers = [context.Process(target=run_ask_tell_worker, args=(problem, server.address, server.authkey),
+                                   kwargs={'poll_interval': 0.01}) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        sol = server.solve()
+        for worker in workers:
+            worker.join(5)
+            self.assertFalse(worker.is_alive())
+
+        self.assertFalse(server.thread.is_alive())
+        self.assertTrue(solver.method.check_stop_condition())
+        self.assertEqual(solver.method.iterations_count + 2, solver.search_data.get_count())
+        self.assertFalse(any(item.blocked for item in solver.search_data._allTrials))
+        self.assertAlmostEqual(sol.best_trials[0].point.float_variables[0],
+                               problem.known_optimum[0].point.float_variables[0], delta=0.05)
+
+    def test_AuthKey(self):
+        solver = Solver(Rastrigin(1), parameters=SolverParameters(r=3.5, eps=0.01))
+        servers = [AskTellServer(solver), AskTellServer(solver)]
+        # без явного ключа каждый сервер создает свой случайный ключ
+        self.assertNotEqual(servers[0].authkey, servers[1].authkey)
+        self.assertEqual(32, len(servers[0].authkey))
+        for server in servers:
+            server.start()
+            server.stop()
+            self.assertFalse(server.thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,19 @@
 import unittest
-from time import sleep
+from time import monotonic, sleep
 
 from iOpt.evolvent.evolvent import Evolvent
+from iOpt.method.async_calculator import AsyncCalculator
 from iOpt.method.async_parallel_process import AsyncParallelProcess
 from iOpt.method.method import Method
 from iOpt.method.optim_task import OptimizationTask
-from iOpt.method.search_data import SearchData
+from iOpt.method.search_data import SearchData, SearchDataItem
+from iOpt.method.solverFactory import SolverFactory
 from iOpt.problem import Problem
 from iOpt.solver_parametrs import SolverParameters
 from iOpt.trial import Point, FunctionValue
+from iOpt.solver import Solver
+from problems.rastrigin import Rastrigin
+from test.iOpt.method.slow_problem import SlowProblem
 
 
 class ProblemForTest(Problem):
@@ -63,5 +68,69 @@ class TestAsyncParallelProcess(unittest.TestCase):
         self.assertEqual(5, self.async_parallel_process.method.iterations_count)
 
 
+class TestAsyncParallelProcessStop(unittest.TestCase):
+    def test_CancelledTrialsAreNotCounted(self):
+        param = SolverParameters(number_of_parallel_points=2, iters_limit=4, async_stop_policy="terminate",
+                                 refine_solution=False)
+        problem = ProblemForTest()
+        task = OptimizationTask(problem)
+        evolvent = Evolvent(problem.lower_bound_of_float_variables, problem.upper_bound_of_float_variables,
+                            problem.number_of_float_variables)
+        search_data = SearchData(problem)
+        method = Method(param, task, evolvent, search_data)
+        process = AsyncParallelProcess(param, task, evolvent, search_data, method, [])
+        sol = process.solve()
+        self.assertEqual(1, process.calculator.number_of_cancelled_points)
+        # испытания в search_data без двух граничных точек
+        self.assertEqual(search_data.get_count() - 2, method.iterations_count)
+        self.assertEqual(method.iterations_count, sol.number_of_global_trials)
+        self.assertFalse(any(item.blocked for item in search_data))
+
+
+class TestAsyncParallelProcessAdaptiveConcurrency(unittest.TestCase):
+    def test_Solve(self):
+        problem = Rastrigin(1)
+        params = SolverParameters(r=3.5, eps=0.01, iters_limit=100, number_of_parallel_points=3,
+                                  async_scheme=True, async_adaptive_concurrency=True, async_min_parallel_points=2)
+        solver = Solver(problem, parameters=params)
+        sol = solver.solve()
+        controller = solver.process.calculator.controller
+        self.assertTrue(2 <= controller.target <= 3)
+        self.assertAlmostEqual(sol.best_trials[0].point.float_variables[0],
+                               problem.known_optimum[0].point.float_variables[0], delta=0.05)
+
+
+class TestAsyncCalculatorStop(unittest.TestCase):
+    def stop(self, policy: str, delay: float = 0.0) -> tuple[list, float, SearchDataItem]:
+        param = SolverParameters(number_of_parallel_points=1, async_stop_policy=policy, async_stop_timeout=0.1)
+        evaluate_method = SolverFactory.create_evaluate_method(OptimizationTask(SlowProblem(ProblemForTest(), delay)))
+        calculator = AsyncCalculator(evaluate_method, param)
+        calculator.start()
+        # испытание в точке 0.5 длится 0.5 + delay секунды
+        oldpoint = SearchDataItem(Point([1.0], []), 1.0, [FunctionValue()])
+        calculator.give_point(SearchDataItem(Point([0.5], []), 0.75, [FunctionValue()]), oldpoint)
+        start = monotonic()
+        points = calculator.stop()
+        return points, monotonic() - start, oldpoint
+
+    def test_Drain(self):
+        points, _, oldpoint = self.stop("drain")
+        self.assertEqual(1, len(points))
+        self.assertEqual(0.25, points[0][0].function_values[0].value)
+        self.assertFalse(oldpoint.blocked)
+
+    def test_DrainTimeout(self):
+        points, elapsed, oldpoint = self.stop("drain_timeout", delay=30.0)
+        self.assertEqual([], points)
+        self.assertLess(elapsed, 15.0)
+        self.assertFalse(oldpoint.blocked)
+
+    def test_Terminate(self):
+        points, elapsed, oldpoint = self.stop("terminate", delay=30.0)
+        self.assertEqual([], points)
+        self.assertLess(elapsed, 15.0)
+        self.assertFalse(oldpoint.blocked)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from iOpt.method.concurrency_controller import ConcurrencyController
+
+
+def free_machine(target: int) -> float:
+    # задержка не зависит от числа вычисляемых испытаний
+    return 1.0
+
+
+def shared_machine(target: int) -> float:
+    # больше трех одновременных испытаний мешают друг другу
+    return 1.0 if target <= 3 else target / (3 - 0.5 * (target - 3))
+
+
+def saturated_machine(target: int) -> float:
+    # после трех одновременных испытаний производительность не растет, каждое испытание замедляется
+    return max(1.0, target / 3)
+
+
+class TestConcurrencyController(unittest.TestCase):
+    def setUp(self):
+        self.controller = ConcurrencyController(min_points=1, max_points=6)
+        self.now = 0.0
+        self.controller.start(self.now)
+
+    def run_windows(self, latency_model, number: int) -> list[int]:
+        targets = []
+        for _ in range(number):
+            target = self.controller.target
+            latency = latency_model(target)
+            for _ in range(self.controller.window):
+                self.now += latency / target
+                self.controller.trial_completed(latency, self.now)
+            targets.append(self.controller.target)
+        return targets
+
+    def test_KeepsAllWorkersWithoutContention(self):
+        self.assertEqual([6] * 10, self.run_windows(free_machine, 10))
+        self.assertAlmostEqual(1.0, self.controller.latency)
+        self.assertAlmostEqual(1.0, self.controller.utilization)
+
+    def test_ReducesTargetUnderContention(self):
+        self.run_windows(free_machine, 3)
+        targets = self.run_windows(shared_machine, 20)
+        self.assertTrue(all(2 <= target <= 4 for target in targets[-10:]))
+
+    def test_BacksOffWhenLatencyGrows(self):
+        self.controller.target = 1
+        targets = self.run_windows(saturated_machine, 20)
+        self.assertTrue(all(2 <= target <= 4 for target in targets[-10:]))
+
+    def test_BacksOffWhenOverheadDominates(self):
+        # исполнители заняты, но большую часть времени окна занимает координатор
+        for _ in range(3):
+            for _ in range(self.controller.window):
+                self.controller.add_coordinator_time(0.8)
+                self.now += 1.0
+                self.controller.trial_completed(6.0, self.now)
+        self.assertEqual(3, self.controller.target)
+        self.assertAlmostEqual(0.8, self.controller.overhead)
+        self.assertAlmostEqual(1.0, self.controller.utilization)
+
+    def test_DoesNotGrowWhenCoordinatorIsBottleneck(self):
+        self.controller.target = 2
+        for _ in range(10):
+            for _ in range(self.controller.window):
+                self.controller.add_coordinator_time(1.0)
+                self.now += 1.0
+                self.controller.trial_completed(0.01, self.now)
+        self.assertEqual(1, self.controller.target)
+        self.assertLess(self.controller.utilization, 0.5)
+        self.assertAlmostEqual(1.0, self.controller.overhead)
+
+    def test_IncorrectBounds(self):
+        with self.assertRaises(Exception):
+            ConcurrencyController(min_points=3, max_points=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,330 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+from sqlalchemy import create_engine, text
+
+from iOpt.method.db_manager import DBManager
+from iOpt.method.db_process import AsyncDBProcess, DBMultiTaskWorker, SchedulingPolicy
+from iOpt.method.pruner import MedianPruner
+from iOpt.method.pruning_method_evaluate import PruningMethodEvaluate
+from iOpt.method.search_data import SearchDataItem
+from iOpt.method.solverFactory import SolverFactory
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from iOpt.trial import Point, FunctionValue
+from problems.mco_test1 import mco_test1
+from problems.rastrigin import Rastrigin
+
+
+def run_worker(problem, url_db, task_name):
+    params = SolverParameters(url_db=url_db, task_name=task_name, main_process=False)
+    solver = Solver(problem, parameters=params)
+    while not solver.calculator.is_task_solving():
+        pass
+    solver.solve()
+
+
+class TestDBProcess(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.url_db = 'sqlite:///' + os.path.join(self.tmp_dir.name, 'iopt.db')
+        self.problem = Rastrigin(1)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def solve(self, iters_limit: int, async_scheme: bool = False, db_task_progress: bool = False) -> Solver:
+        params = SolverParameters(r=3.5, eps=0.001, iters_limit=iters_limit, number_of_parallel_points=2,
+                                  async_scheme=async_scheme, url_db=self.url_db, task_name='resume',
+                                  main_process=True, db_task_progress=db_task_progress)
+        solver = Solver(self.problem, parameters=params)
+        worker = threading.Thread(target=run_worker, args=(self.problem, self.url_db, 'resume'))
+        worker.start()
+        solver.solve()
+        worker.join()
+        return solver
+
+    def test_ResumeFromStoredPoints(self):
+        self.solve(iters_limit=10)
+        solver = self.solve(iters_limit=20)
+
+        db = DBManager(self.url_db)
+        db.set_task('resume')
+        calculated_points, _ = db.load_points()
+
+        self.assertGreaterEqual(solver.method.iterations_count, 20)
+        self.assertEqual(solver.method.iterations_count + 2, solver.search_data.get_count())
+        # the second run continues the first one instead of starting over
+        self.assertLessEqual(len(calculated_points),
+                             solver.method.iterations_count + solver.parameters.number_of_parallel_points)
+
+    def test_ResumeFromWaitingPoints(self):
+        # the previous run was stopped in the first iteration, its points were not calculated
+        db = DBManager(self.url_db)
+        db.set_task('resume')
+        lower, upper = self.problem.lower_bound_of_float_variables[0], self.problem.upper_bound_of_float_variables[0]
+        db.set_points_to_calculate([SearchDataItem(Point([lower + x * (upper - lower)], []), x,
+                                                   [FunctionValue()]) for x in [0.25, 0.75]])
+        db.engine.dispose()
+
+        solver = self.solve(iters_limit=10)
+
+        x = [item.get_x() for item in solver.search_data if item.get_index() >= 0]
+        self.assertIn(0.25, x)
+        self.assertIn(0.75, x)
+        self.assertEqual(solver.method.iterations_count + 2, solver.search_data.get_count())
+
+    def test_PoolParameters(self):
+        params = SolverParameters(url_db=self.url_db, task_name='pool', main_process=True, db_pool_size=2,
+                                  db_max_overflow=3)
+        solver = Solver(self.problem, parameters=params)
+        pool = solver.calculator.engine.pool
+        self.assertEqual(2, pool.size())
+        self.assertEqual(3, pool._max_overflow)
+        solver.calculator.engine.dispose()
+
+    def test_AsyncSolve(self):
+        solver = self.solve(iters_limit=20, async_scheme=True)
+
+        self.assertIsInstance(solver.process, AsyncDBProcess)
+        self.assertGreaterEqual(solver.method.iterations_count, 20)
+        self.assertEqual(solver.method.iterations_count + 2, solver.search_data.get_count())
+
+    def test_AsyncResumeFromStoredPoints(self):
+        self.solve(iters_limit=10)
+        solver = self.solve(iters_limit=20, async_scheme=True)
+
+        self.assertGreaterEqual(solver.method.iterations_count, 20)
+        self.assertEqual(solver.method.iterations_count + 2, solver.search_data.get_count())
+
+    def test_TaskProgress(self):
+        for async_scheme in [False, True]:
+            with self.subTest(async_scheme=async_scheme):
+                solver = self.solve(iters_limit=10 if not async_scheme else 20, async_scheme=async_scheme,
+                                    db_task_progress=True)
+                db = DBManager(self.url_db)
+                db.set_task('resume')
+
+                progress = db.get_task_progress()
+                # points received while the async coordinator stops are not written as progress
+                self.assertLessEqual(progress[-1]['iteration'], solver.method.iterations_count)
+                self.assertGreaterEqual(progress[-1]['iteration'], solver.parameters.iters_limit)
+                self.assertIsNotNone(progress[-1]['best_z'])
+                self.assertEqual([row['iteration'] for row in progress],
+                                 sorted(row['iteration'] for row in progress))
+                self.assertEqual(progress[1:], db.get_task_progress(since_id=progress[0]['id']))
+
+                points = db.get_points_since()
+                last_id = points[1][1]
+                self.assertEqual([point_id for _, point_id in points[2:]],
+                                 [point_id for _, point_id in db.get_points_since(last_id)])
+                db.engine.dispose()
+
+
+class TestDBManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = DBManager('sqlite:///' + os.path.join(self.tmp_dir.name, 'iopt.db'),
+                            pool_size=2, pool_pre_ping=True, pool_recycle=60)
+        self.db.set_task('task')
+
+    def tearDown(self):
+        self.db.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def test_PointRoundTrip(self):
+        ids = self.db.set_points_to_calculate([SearchDataItem(Point([0.1, 0.2], ['a']), 0.3, [FunctionValue()]),
+                                               SearchDataItem(Point([0.4, 0.5], ['b']), 0.6, [FunctionValue()])])
+        self.assertEqual(2, self.db.count_not_calculated_points())
+
+        point, point_id = self.db.get_point_to_calculate(1)
+        self.assertEqual(ids[0], point_id)
+        self.assertEqual([0.1, 0.2], point.point.float_variables)
+        self.assertEqual(['a'], point.point.discrete_variables)
+        self.assertEqual(0.3, point.get_x())
+
+        point.function_values = [FunctionValue(value=1.5)]
+        point.set_z(1.5)
+        point.set_index(0)
+        self.db.set_calculated_point(point, point_id)
+        self.assertEqual(1, self.db.count_not_calculated_points())
+
+        calculated = self.db.get_all_calculated_points()
+        self.assertEqual(1, len(calculated))
+        point, point_id = calculated[0]
+        self.assertEqual(ids[0], point_id)
+        self.assertEqual(1.5, point.get_z())
+        self.assertEqual(1.5, point.function_values[0].value)
+        self.assertEqual([], self.db.get_all_calculated_points())
+
+    def test_OnlyOwnPointsAreTaken(self):
+        ids = self.db.set_points_to_calculate([SearchDataItem(Point([0.1], []), 0.1, [FunctionValue()]),
+                                               SearchDataItem(Point([0.2], []), 0.2, [FunctionValue()])])
+        for _ in ids:
+            point, point_id = self.db.get_point_to_calculate(1)
+            point.function_values = [FunctionValue(value=point.get_x())]
+            point.set_z(point.get_x())
+            point.set_index(0)
+            self.db.set_calculated_point(point, point_id)
+
+        calculated = self.db.wait_calculated_points([ids[1]])
+        self.assertEqual([ids[1]], [point_id for _, point_id in calculated])
+        # the point of another owner stays calculated
+        self.assertEqual([ids[0]], [point_id for _, point_id in self.db.get_all_calculated_points()])
+
+
+    def test_WaitCalculatedPointsPolls(self):
+        point_id = self.db.set_point_to_calculate(SearchDataItem(Point([0.1], []), 0.1, [FunctionValue()]))
+        requests = []
+        get_all_calculated_points = self.db.get_all_calculated_points
+
+        def count_requests(point_ids=None):
+            requests.append(point_ids)
+            return get_all_calculated_points(point_ids)
+
+        def calculate():
+            point, db_point_id = self.db.get_point_to_calculate(1)
+            point.set_z(0.0)
+            point.set_index(0)
+            self.db.set_calculated_point(point, db_point_id)
+
+        self.db.get_all_calculated_points = count_requests
+        timer = threading.Timer(0.2, calculate)
+        timer.start()
+        calculated = self.db.wait_calculated_points([point_id], poll_interval=0.05)
+        timer.join()
+
+        self.assertEqual([point_id], [db_point_id for _, db_point_id in calculated])
+        # между пустыми запросами делается пауза, база данных не опрашивается непрерывно
+        self.assertLess(len(requests), 50)
+
+
+class TestDBSchemaUpgrade(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.url_db = 'sqlite:///' + os.path.join(self.tmp_dir.name, 'iopt.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_OldDatabase(self):
+        # таблица задач в базе данных прежней версии: без приоритета и параметров
+        engine = create_engine(self.url_db)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE tasks (id INTEGER NOT NULL PRIMARY KEY, name VARCHAR UNIQUE, "
+                                    "state VARCHAR(7))"))
+            connection.execute(text("INSERT INTO tasks (name, state) VALUES ('old', 'SOLVING')"))
+        engine.dispose()
+
+        db = DBManager(self.url_db)
+        self.assertFalse(db.set_task('old'))
+        self.assertEqual([(db.task_id, 'old', 0)], db.get_solving_tasks())
+        self.assertIsNone(db.get_task_parameters('old'))
+        self.assertTrue(db.set_task('new', 5, {'r': 3.0}))
+        self.assertEqual({'r': 3.0}, db.get_task_parameters('new'))
+        db.add_task_progress(iteration=1, trials=1, best_z=None, min_delta=1.0, iteration_time=0.1)
+        self.assertEqual(1, len(db.get_task_progress()))
+        db.engine.dispose()
+
+        # повторное подключение не изменяет схему
+        db = DBManager(self.url_db)
+        self.assertEqual(2, len(db.get_solving_tasks()))
+        db.engine.dispose()
+
+
+class TestDBMultiTaskWorker(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = DBManager('sqlite:///' + os.path.join(self.tmp_dir.name, 'iopt.db'))
+        self.task_ids = []
+        for name, priority in [('a', 0), ('b', 5)]:
+            self.db.set_task(name, priority)
+            self.task_ids.append(self.db.task_id)
+        for x in [0.25, 0.75]:
+            for task_id in self.task_ids:
+                self.db.task_id = task_id
+                self.db.set_point_to_calculate(SearchDataItem(Point([x], []), x, [FunctionValue()]))
+        problems = {'a': Rastrigin(1), 'b': Rastrigin(1)}
+        self.worker = DBMultiTaskWorker(self.db, problems, poll_interval=0.0)
+
+    def tearDown(self):
+        self.db.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def served_tasks(self, policy: SchedulingPolicy) -> list:
+        self.worker.policy = policy
+        served = []
+        for _ in range(4):
+            self.worker.do_global_iteration()
+            served.append(self.worker.last_task_id)
+        return served
+
+    def test_RoundRobin(self):
+        a, b = self.task_ids
+        self.assertEqual([a, b, a, b], self.served_tasks(SchedulingPolicy.ROUND_ROBIN))
+
+    def test_Priority(self):
+        a, b = self.task_ids
+        self.assertEqual([b, b, a, a], self.served_tasks(SchedulingPolicy.PRIORITY))
+
+    def test_OldestWaiting(self):
+        a, b = self.task_ids
+        self.assertEqual([a, b, a, b], self.served_tasks(SchedulingPolicy.OLDEST_WAITING))
+
+    def test_TaskIsCreatedByStoredParameters(self):
+        params = SolverParameters(start_lambdas=[[0.3, 0.7]], is_scaling=True)
+        self.db.set_task('mco', 0, SolverFactory.get_task_parameters(params))
+        self.db.set_task('pruning', 0, SolverFactory.get_task_parameters(SolverParameters(pruner='median')))
+        self.worker.problems['mco'] = mco_test1()
+        self.worker.problems['pruning'] = Rastrigin(1)
+
+        task = self.worker.get_evaluate_method('mco').task
+        self.assertEqual([0.3, 0.7], task.convolution.lambda_param)
+        self.assertTrue(task.convolution.is_scaling)
+        self.assertIsInstance(self.worker.get_evaluate_method('pruning'), PruningMethodEvaluate)
+        self.assertIsInstance(self.worker.get_evaluate_method('pruning').task.pruner, MedianPruner)
+        # задача без сохраненных параметров создается по параметрам по умолчанию
+        self.assertIsNone(self.worker.get_evaluate_method('a').task.pruner)
+
+    def test_PrunerDoesNotLeakBetweenTasks(self):
+        # один и тот же problem обслуживает задачу с остановкой испытаний и задачу без нее
+        problem = Rastrigin(1)
+        self.worker.problems = {'a': problem, 'pruning': problem}
+        self.db.set_task('pruning', 0, SolverFactory.get_task_parameters(SolverParameters(pruner='median')))
+        pruning = self.worker.get_evaluate_method('pruning')
+        self.assertIsInstance(pruning, PruningMethodEvaluate)
+        self.assertNotIsInstance(self.worker.get_evaluate_method('a'), PruningMethodEvaluate)
+        self.assertIsNone(self.worker.get_evaluate_method('a').task.pruner)
+        self.assertIsNone(problem.pruner)
+
+        point = SearchDataItem(Point([0.5], []), 0.5, [FunctionValue()])
+        pruning.calculate_functionals(point)
+        self.assertEqual(1, len(pruning.task.pruner.trials))
+        self.assertIsNone(problem.pruner)
+
+    def test_TaskIsCreatedByStoredPoints(self):
+        params = SolverParameters(start_point=Point([0.5], []), initial_points=[Point([-1.0], []), Point([1.0], [])],
+                                  start_lambdas=[np.array([0.3, 0.7])])
+        self.db.set_task('points', 0, SolverFactory.get_task_parameters(params))
+        self.worker.problems['points'] = Rastrigin(1)
+
+        parameters = SolverFactory.get_solver_parameters(self.db.get_task_parameters('points'))
+        self.assertIsInstance(parameters.start_point, Point)
+        self.assertEqual([0.5], parameters.start_point.float_variables)
+        self.assertEqual([[-1.0], [1.0]], [point.float_variables for point in parameters.initial_points])
+        self.assertEqual([[0.3, 0.7]], parameters.start_lambdas)
+        self.worker.get_evaluate_method('points')
+
+    def test_SolveStopsWithoutSolvingTasks(self):
+        for task_id in self.task_ids:
+            self.db.task_id = task_id
+            self.db.set_task_solved()
+        self.worker.solve()
+        self.assertEqual(2, self.db.count_not_calculated_points())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from iOpt.trial import Point
+from problems.rastriginInt import RastriginInt
+from problems.stronginc2 import Stronginc2
+from problems.stronginc3 import Stronginc3
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestExportTrials(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_Parquet(self):
+        import pyarrow.parquet as pq
+
+        solver = Solver(Stronginc2(), parameters=SolverParameters(r=2.5, eps=0.01, iters_limit=200))
+        solution = solver.solve()
+        path = os.path.join(self.tmp_dir.name, 'trials.parquet')
+        solver.export_trials(path)
+
+        table = pq.read_table(path)
+        self.assertEqual(['x', 'float_variable_0', 'float_variable_1', 'constraint_0', 'constraint_1',
+                          'objective_0', 'index', 'z', 'iteration', 'creation_time'], table.column_names)
+        self.assertEqual(200, table.num_rows)
+        self.assertEqual(pyarrow.int64(), table.schema.field('index').type)
+
+        index = table['index'].to_numpy()
+        objective = table['objective_0'].to_numpy()
+        # критерий вычислен только в точках, где выполнены все ограничения
+        self.assertTrue(np.all(np.isnan(objective[index < 2])))
+        self.assertFalse(np.any(np.isnan(objective[index == 2])))
+        self.assertEqual(2, solution.best_trials[0].get_index())
+        self.assertEqual(solution.best_trials[0].get_z(), np.nanmin(objective))
+
+    def test_FirstTrialViolatesConstraint(self):
+        import pyarrow.parquet as pq
+
+        problem = Stronginc3()
+        # в начальной точке нарушено первое ограничение, остальные функционалы не вычисляются
+        parameters = SolverParameters(r=2.5, eps=0.01, iters_limit=100, start_point=Point([0.0, -1.0], []))
+        solver = Solver(problem, parameters=parameters)
+        solver.solve()
+        path = os.path.join(self.tmp_dir.name, 'trials.parquet')
+        solver.export_trials(path)
+
+        table = pq.read_table(path)
+        self.assertEqual(0, table['index'][0].as_py())
+        self.assertEqual(['constraint_0', 'constraint_1', 'constraint_2', 'objective_0'], table.column_names[3:7])
+        index = table['index'].to_numpy()
+        for j in range(problem.number_of_constraints):
+            constraint = table[f'constraint_{j}'].to_numpy()
+            self.assertTrue(np.all(np.isnan(constraint[index < j])))
+            self.assertFalse(np.any(np.isnan(constraint[index >= j])))
+        objective = table['objective_0'].to_numpy()
+        self.assertTrue(np.all(np.isnan(objective[index < 3])))
+        self.assertFalse(np.any(np.isnan(objective[index == 3])))
+
+    def test_Arrow(self):
+        import pyarrow.feather as feather
+
+        solver = Solver(RastriginInt(3, 2), parameters=SolverParameters(r=2.5, eps=0.01, iters_limit=30))
+        solver.solve()
+        path = os.path.join(self.tmp_dir.name, 'trials.arrow')
+        solver.export_trials(path, format='arrow')
+
+        table = feather.read_table(path, memory_map=True)
+        self.assertEqual(30, table.num_rows)
+        # имена дискретных переменных совпадают с именем вещественной, поэтому заменяются
+        self.assertEqual(['x', '0', 'discrete_variable_0', 'discrete_variable_1'], table.column_names[:4])
+        self.assertEqual(pyarrow.string(), table.schema.field('discrete_variable_0').type)
+        self.assertEqual(set(RastriginInt(3, 2).discrete_variable_values[0]),
+                         set(table['discrete_variable_0'].to_pylist()))
+
+    def test_UnknownFormat(self):
+        solver = Solver(RastriginInt(3, 2), parameters=SolverParameters(iters_limit=10))
+        solver.solve()
+        with self.assertRaises(Exception):
+            solver.export_trials(os.path.join(self.tmp_dir.name, 'trials.csv'), format='csv')
+
+
+if __name__ == '__main__':
+    unittest.main()
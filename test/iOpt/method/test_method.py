@@ -5,9 +5,12 @@ from unittest.mock import Mock
 import numpy as np
 
 from iOpt.method.search_data import SearchDataItem
-from iOpt.solver import SolverParameters
+from iOpt.solver import Solver, SolverParameters
 from iOpt.method.method import Method
 from iOpt.trial import Point
+from problems.rastrigin import Rastrigin
+from problems.hill import Hill
+from problems.rastriginInt import RastriginInt
 
 
 class TestMethod(unittest.TestCase):
@@ -141,6 +144,63 @@ class TestMethod(unittest.TestCase):
         self.method.calculate_global_r(curr, left)
         self.assertEqual(curr.globalR, 1.25)
 
+    def test_CalculateLocalM(self):
+        items = [SearchDataItem(x=x, y=Point(float_variables=[x], discrete_variables=[]))
+                 for x in [0.0, 0.25, 0.5, 1.0]]
+        for item, z in zip(items, [0.0, 1.0, 1.5, 1.0]):
+            item.set_z(z)
+            item.set_index(0)
+        for left, curr in zip(items[:-1], items[1:]):
+            curr.set_left(left)
+            left.set_right(curr)
+            curr.delta = curr.get_x() - left.get_x()
+        self.method.M[0] = 4.0
+        self.method.max_delta = 1.0
+
+        # без локальной настройки используется глобальная оценка
+        self.assertEqual(self.method.calculate_local_m(items[3], items[2]), 4.0)
+        self.method.parameters.local_tuning = True
+        # наклоны интервалов 2 и 1, глобальная часть 4 * 0.5 / 1
+        self.assertEqual(self.method.calculate_local_m(items[3], items[2]), 2.0)
+        # наклоны интервалов 4, 2 и 1
+        self.assertEqual(self.method.calculate_local_m(items[2], items[1]), 4.0)
+        # наклон не определен для точек с разными индексами
+        items[0].set_index(-1)
+        self.assertEqual(self.method.calculate_local_m(items[2], items[1]), 2.0)
+        # глобальная часть 4 * 0.5 / 0.5
+        self.method.max_delta = 0.5
+        self.assertEqual(self.method.calculate_local_m(items[3], items[2]), 4.0)
+
+    def test_EstimatesChangedWithThreshold(self):
+        self.method.M = [2.0]
+        self.method.Z = [0.0]
+        self.method.M_used = [2.0]
+        self.method.Z_used = [0.0]
+        self.method.min_delta = 0.1
+        self.method.parameters.r = 2.0
+
+        self.method.recalcR = False
+        self.method.estimates_changed()
+        self.assertTrue(self.method.recalcR)
+
+        self.method.parameters.recalc_threshold = 0.1
+        self.method.recalcR = False
+        self.method.M[0] = 2.2
+        self.method.Z[0] = -0.005
+        self.method.estimates_changed()
+        self.assertFalse(self.method.recalcR)
+        self.assertEqual(self.method.get_characteristic_estimates(), ([2.0], [0.0]))
+        # сдвиг характеристик 4 * 0.02 / (2 * 2) больше 0.1 * 0.1
+        self.method.Z[0] = -0.02
+        self.method.estimates_changed()
+        self.assertTrue(self.method.recalcR)
+
+        self.method.recalcR = False
+        self.method.Z[0] = 0.0
+        self.method.M[0] = 1.8
+        self.method.estimates_changed()
+        self.assertTrue(self.method.recalcR)
+
     def test_calculate_global_r_throws(self):
         left = SearchDataItem(x=0.5, y=Point(float_variables=[10.0], discrete_variables=[]))
 
@@ -184,10 +244,121 @@ class TestMethod(unittest.TestCase):
         with self.assertRaises(Exception):
             self.method.calculate_next_point_coordinate(curr)
 
+    def test_UpdateOptimumByItems(self):
+        rng = np.random.default_rng(7)
+        items = []
+        for x, index, z in zip(rng.random(40), rng.integers(-1, 3, 40), rng.integers(0, 10, 40)):
+            item = SearchDataItem(x=x, y=Point(float_variables=[x], discrete_variables=[]))
+            item.set_index(int(index))
+            item.set_z(float(z))
+            items.append(item)
+
+        self.method.Z = [np.inf] * 3
+        for item in items:
+            if item.get_index() >= 0:
+                self.method.update_optimum(item)
+        best, Z = self.method.best, list(self.method.Z)
+
+        self.method.best = None
+        self.method.Z = [np.inf] * 3
+        self.method.update_optimum_by_items(items)
+        self.assertIs(best, self.method.best)
+        self.assertEqual(Z, list(self.method.Z))
+
 
 # def test_RecalcAll_mock(self):
 
 
+class TestSolveMixedLocalGlobal(unittest.TestCase):
+    def test_solve(self):
+        problem = Rastrigin(2)
+        params = SolverParameters(r=3.5, eps=0.01, mixed_local_period=3)
+        solver = Solver(problem, parameters=params)
+        sol = solver.solve()
+        self.assertTrue(solver.method.local_period >= 1)
+        np.testing.assert_allclose(sol.best_trials[0].point.float_variables,
+                                   problem.known_optimum[0].point.float_variables, atol=0.05)
+
+    def test_NegativePeriodThrows(self):
+        with self.assertRaises(Exception):
+            Solver(Rastrigin(1), parameters=SolverParameters(mixed_local_period=-1))
+
+
+class TestSolveLocalTuning(unittest.TestCase):
+    def test_solve(self):
+        problem = Hill(1)
+        params = SolverParameters(r=3.0, eps=1e-4, local_tuning=True)
+        sol = Solver(problem, parameters=params).solve()
+        sol_global = Solver(problem, parameters=SolverParameters(r=3.0, eps=1e-4)).solve()
+        self.assertAlmostEqual(sol.best_trials[0].point.float_variables[0],
+                               problem.known_optimum[0].point.float_variables[0], delta=0.01)
+        self.assertLess(sol.number_of_global_trials, sol_global.number_of_global_trials)
+
+
+class TestSolveRecalcThreshold(unittest.TestCase):
+    def test_solve(self):
+        problem = Rastrigin(2)
+        solver = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01, recalc_threshold=0.25))
+        sol = solver.solve()
+        solver_exact = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01))
+        solver_exact.solve()
+        self.assertLess(solver.method.full_recalc_count, solver_exact.method.full_recalc_count)
+        np.testing.assert_allclose(sol.best_trials[0].point.float_variables,
+                                   problem.known_optimum[0].point.float_variables, atol=0.05)
+
+    def test_NegativeThresholdThrows(self):
+        with self.assertRaises(Exception):
+            Solver(Rastrigin(1), parameters=SolverParameters(recalc_threshold=-0.1))
+
+
+class TestSolveInitialDesign(unittest.TestCase):
+    @staticmethod
+    def get_trials(solver):
+        return [trial for trial in solver.search_data if trial.get_index() >= 0]
+
+    def test_Sobol(self):
+        problem = Rastrigin(2)
+        params = SolverParameters(r=3.5, eps=0.01, iters_limit=16, initial_design='sobol', initial_design_size=16)
+        solver = Solver(problem, parameters=params)
+        solver.solve()
+        trials = self.get_trials(solver)
+        self.assertEqual(16, len(trials))
+        # точки плана покрывают все четверти области поиска
+        quadrants = {tuple(np.sign(trial.point.float_variables)) for trial in trials}
+        self.assertEqual(4, len(quadrants))
+
+    def test_InitialPoints(self):
+        problem = Rastrigin(2)
+        points = [Point([0.1, 0.2], []), Point([-0.3, 0.4], [])]
+        params = SolverParameters(r=3.5, eps=0.01, initial_design='lhs', initial_design_size=8,
+                                  start_point=Point([1.0, -1.0], []), initial_points=points)
+        solver = Solver(problem, parameters=params)
+        sol = solver.solve()
+        first_trials = [list(trial.point.float_variables) for trial in self.get_trials(solver)
+                        if trial.iterationNumber < 0]
+        self.assertEqual(8, len(first_trials))
+        for point in points + [params.start_point]:
+            self.assertIn(point.float_variables, first_trials)
+        np.testing.assert_allclose(sol.best_trials[0].point.float_variables,
+                                   problem.known_optimum[0].point.float_variables, atol=0.05)
+
+    def test_MixedInteger(self):
+        problem = RastriginInt(3, 2)
+        point = Point([0.5], ['B', 'A'])
+        params = SolverParameters(r=3.5, eps=0.01, initial_design='halton', initial_design_size=8,
+                                  initial_points=[point])
+        solver = Solver(problem, parameters=params)
+        sol = solver.solve()
+        self.assertTrue(any(list(trial.point.float_variables) == [0.5] and
+                            list(trial.point.discrete_variables) == ['B', 'A'] for trial in self.get_trials(solver)))
+        self.assertAlmostEqual(sol.best_trials[0].point.float_variables[0],
+                               problem.known_optimum[0].point.float_variables[0], delta=0.05)
+
+    def test_UnknownDesignThrows(self):
+        with self.assertRaises(Exception):
+            Solver(Rastrigin(1), parameters=SolverParameters(initial_design='grid'))
+
+
 # Executing the tests in the above test case class
 if __name__ == "__main__":
     unittest.main()
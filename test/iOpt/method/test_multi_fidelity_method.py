@@ -0,0 +1,89 @@
+import unittest
+
+import numpy as np
+
+from iOpt.method.multi_fidelity_method import MultiFidelityMethod, MultiFidelityMixedIntegerMethod
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from iOpt.trial import Point, FunctionValue
+from problems.rastrigin import Rastrigin
+from problems.rastriginInt import RastriginInt
+
+
+class MultiFidelityRastrigin(Rastrigin):
+    def __init__(self, dimension: int):
+        super().__init__(dimension)
+        self.number_of_fidelities = 2
+        self.number_of_full_calculations = 0
+
+    def calculate(self, point: Point, function_value: FunctionValue) -> FunctionValue:
+        self.number_of_full_calculations += 1
+        return super().calculate(point, function_value)
+
+    def calculate_fidelity(self, point: Point, function_value: FunctionValue, fidelity: int) -> FunctionValue:
+        # пониженная точность - критерий с гладким искажением
+        function_value = super().calculate(point, function_value)
+        function_value.value += 0.1 * np.sin(3 * np.sum(point.float_variables))
+        return function_value
+
+
+class MultiFidelityRastriginInt(RastriginInt):
+    def __init__(self, dimension: int, number_of_discrete_variables: int):
+        super().__init__(dimension, number_of_discrete_variables)
+        self.number_of_fidelities = 2
+
+    def calculate_fidelity(self, point: Point, function_value: FunctionValue, fidelity: int) -> FunctionValue:
+        function_value = self.calculate(point, function_value)
+        function_value.value += 0.1
+        return function_value
+
+
+class TestMultiFidelityMethod(unittest.TestCase):
+    def test_solve(self):
+        problem = MultiFidelityRastrigin(2)
+        solver = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01))
+        sol = solver.solve()
+        method = solver.method
+        self.assertIsInstance(method, MultiFidelityMethod)
+        self.assertEqual(2, len(method.M))
+
+        trials = [item for item in solver.search_data if item.get_index() >= 0]
+        full = [item for item in trials if item.get_index() == 1]
+        # в точках пониженной точности значение хранится после полного
+        for item in trials:
+            self.assertEqual(2, len(item.function_values))
+            self.assertEqual(item.get_z(), item.function_values[1 - item.get_index()].value)
+        self.assertEqual(len(full), problem.number_of_full_calculations)
+        self.assertEqual([len(trials) - len(full), len(full)], method.fidelity_trials_count)
+        self.assertLess(len(full), len(trials) / 2)
+
+        self.assertEqual(1, sol.best_trials[0].get_index())
+        self.assertEqual(sol.best_trials[0].get_z(), sol.best_trials[0].function_values[0].value)
+        np.testing.assert_allclose(sol.best_trials[0].point.float_variables,
+                                   problem.known_optimum[0].point.float_variables, atol=0.05)
+
+    def test_ZeroMarginCalculatesOnlyImprovements(self):
+        problem = MultiFidelityRastrigin(1)
+        solver = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01, fidelity_margin=0))
+        solver.solve()
+        threshold = solver.task.fidelity_thresholds[0]
+        self.assertEqual(solver.method.fidelity_min[0], threshold)
+        for item in solver.search_data:
+            if item.get_index() == 0:
+                self.assertGreater(item.get_z(), threshold)
+
+    def test_MixedInteger(self):
+        problem = MultiFidelityRastriginInt(3, 2)
+        solver = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01))
+        sol = solver.solve()
+        self.assertIsInstance(solver.method, MultiFidelityMixedIntegerMethod)
+        self.assertEqual(1, sol.best_trials[0].get_index())
+        self.assertGreater(solver.method.fidelity_trials_count[0], 0)
+
+    def test_ParallelThrows(self):
+        with self.assertRaises(Exception):
+            Solver(MultiFidelityRastrigin(1), parameters=SolverParameters(number_of_parallel_points=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import time
+import unittest
+
+from iOpt.method.listener import Listener
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from iOpt.trial import Point
+from problems.rastrigin import Rastrigin
+from problems.xsquared import XSquared
+from test.iOpt.method.slow_problem import SlowProblem
+
+
+def straggler_delay(point: Point) -> float:
+    # испытания в области (-0.4, -0.3) выполняются в тысячи раз дольше остальных
+    return 60.0 if -0.4 < point.float_variables[0] < -0.3 else 0.01
+
+
+class TestParallelProcessQuorum(unittest.TestCase):
+    def test_Solve(self):
+        problem = Rastrigin(1)
+        params = SolverParameters(r=3.5, eps=0.01, iters_limit=100, number_of_parallel_points=4, parallel_quorum=2)
+        solver = Solver(problem, parameters=params)
+        sol = solver.solve()
+        # перенесенные испытания завершаются при остановке поиска
+        self.assertEqual([], solver.process.pending)
+        self.assertFalse(any(item.blocked for item in solver.search_data._allTrials))
+        self.assertEqual(solver.method.iterations_count + 2, solver.search_data.get_count())
+        self.assertAlmostEqual(sol.best_trials[0].point.float_variables[0],
+                               problem.known_optimum[0].point.float_variables[0], delta=0.05)
+
+    def test_CommitsQuorum(self):
+        class BatchListener(Listener):
+            def __init__(self):
+                self.batches = []
+
+            def on_end_iteration(self, curr_points, solution):
+                self.batches.append(len(curr_points))
+
+        params = SolverParameters(r=3.5, eps=1e-12, iters_limit=100, number_of_parallel_points=4, parallel_quorum=2)
+        solver = Solver(Rastrigin(1), parameters=params)
+        listener = BatchListener()
+        solver.add_listener(listener)
+        solver.do_global_iteration(1)
+        solver.do_global_iteration(3)
+        # каждая итерация добавляет ровно quorum испытаний, слушатель получает испытания всех итераций
+        self.assertEqual(6, listener.batches[-1])
+        self.assertEqual(listener.batches[0] + 6, solver.search_data.get_count() - 2)
+
+    def test_StragglerDoesNotHoldBatch(self):
+        problem = SlowProblem(XSquared(1), straggler_delay)
+        params = SolverParameters(r=3.5, eps=1e-6, iters_limit=40, number_of_parallel_points=3, parallel_quorum=2,
+                                  timeout=0.05)
+        solver = Solver(problem, parameters=params)
+        start = time.monotonic()
+        solver.solve()
+        # поиск не ждет завершения долгого испытания
+        self.assertLess(time.monotonic() - start, 30.0)
+        self.assertGreaterEqual(solver.method.iterations_count, 40)
+        # долгое испытание прервано по сроку и не учитывается
+        self.assertEqual(solver.method.iterations_count, solver.search_data.solution.number_of_global_trials)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import time
 import unittest
 from unittest import mock
 from unittest.mock import Mock, call
@@ -14,6 +15,10 @@ from iOpt.method.search_data import SearchData
 from iOpt.method.search_data import SearchDataItem
 from iOpt.solver_parametrs import SolverParameters
 from iOpt.output_system.listeners.static_painters import StaticPainterListener
+from iOpt.solver import Solver
+from problems.rastrigin import Rastrigin
+from problems.xsquared import XSquared
+from test.iOpt.method.slow_problem import SlowProblem
 
 
 class TestProcess(unittest.TestCase):
@@ -141,5 +146,76 @@ class TestProcess(unittest.TestCase):
         mock_FirstIteration.assert_called_once()
 
 
+class TestProcessTimeout(unittest.TestCase):
+    def solve(self, delay: float, **kwargs):
+        # ограничение по времени 0.6 секунды
+        params = SolverParameters(r=3.5, eps=1e-12, iters_limit=1000, timeout=0.01, **kwargs)
+        solver = Solver(SlowProblem(XSquared(1), delay), parameters=params)
+        start = time.monotonic()
+        sol = solver.solve()
+        return solver, sol, time.monotonic() - start
+
+    def test_Sequential(self):
+        solver, sol, elapsed = self.solve(0.05)
+        # без ограничения по времени поиск длился бы не меньше 50 секунд
+        self.assertLess(solver.method.iterations_count, 1000)
+        self.assertGreater(sol.solving_time, 0.5)
+        self.assertTrue(solver.method.check_stop_condition())
+
+    def test_ParallelCancelsTrials(self):
+        solver, sol, elapsed = self.solve(30.0, number_of_parallel_points=2)
+        self.assertLess(elapsed, 20.0)
+        # испытания, прерванные по сроку, не попадают в поисковую информацию
+        self.assertEqual(0, solver.search_data.get_count())
+
+    def test_AsyncCancelsTrials(self):
+        solver, sol, elapsed = self.solve(30.0, number_of_parallel_points=2, async_scheme=True)
+        self.assertLess(elapsed, 20.0)
+        self.assertEqual(0, solver.search_data.get_count())
+
+
+class TestSolveWarmStart(unittest.TestCase):
+    def setUp(self):
+        self.problem = Rastrigin(2)
+        self.previous = Solver(self.problem, parameters=SolverParameters(r=3.5, eps=0.01))
+        self.previous_solution = self.previous.solve()
+
+    def test_OtherBoundsAndR(self):
+        problem = Rastrigin(2)
+        problem.lower_bound_of_float_variables = [-1.0, -1.0]
+        problem.upper_bound_of_float_variables = [2.0, 2.0]
+        params = SolverParameters(r=2.5, eps=0.01)
+        cold = Solver(problem, parameters=params).solve()
+
+        solver = Solver(problem, parameters=params)
+        added = solver.warm_start(list(self.previous.search_data))
+        # испытания вне новой области поиска пропускаются
+        self.assertTrue(0 < added < self.previous_solution.number_of_global_trials)
+        sol = solver.solve()
+        self.assertLess(sol.number_of_global_trials, cold.number_of_global_trials)
+        np.testing.assert_allclose(sol.best_trials[0].point.float_variables,
+                                   problem.known_optimum[0].point.float_variables, atol=0.05)
+
+    def test_FromSolution(self):
+        solver = Solver(self.problem, parameters=SolverParameters(r=3.5, eps=0.01))
+        self.assertEqual(1, solver.warm_start(self.previous_solution))
+        sol = solver.solve()
+        self.assertLessEqual(sol.best_trials[0].get_z(), self.previous_solution.best_trials[0].get_z())
+
+    def test_Trials(self):
+        solver = Solver(self.problem, parameters=SolverParameters(r=3.5, eps=0.01))
+        trials = [Trial(Point([0.5, 0.5], []), [FunctionValue(value=self.problem.calculate(
+                      Point([0.5, 0.5], []), FunctionValue()).value)]),
+                  Trial(Point([10.0, 0.0], []), [FunctionValue(value=100.0)]),
+                  Trial(Point([0.1, 0.1], []), [])]
+        self.assertEqual(1, solver.warm_start(trials))
+        self.assertEqual(0, solver.method.iterations_count)
+        self.assertEqual(3, solver.search_data.get_count())
+
+    def test_AfterSolveThrows(self):
+        with self.assertRaises(Exception):
+            self.previous.warm_start(self.previous_solution)
+
+
 if __name__ == '__main__':
     unittest.main()
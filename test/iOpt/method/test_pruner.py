@@ -0,0 +1,147 @@
+import unittest
+
+import numpy as np
+
+from iOpt.method.pruner import MedianPruner, BoundPruner, TrialPruned
+from iOpt.method.pruning_method_evaluate import PruningMethodEvaluate
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from iOpt.trial import Point, FunctionValue, FunctionType
+from problems.rastrigin import Rastrigin
+from problems.stronginc2 import Stronginc2
+
+
+class SteppedRastrigin(Rastrigin):
+    """Критерий вычисляется за несколько шагов, как среднее по блокам кросс-валидации"""
+
+    def __init__(self, dimension: int, number_of_steps: int = 5):
+        super().__init__(dimension)
+        self.number_of_steps = number_of_steps
+        self.number_of_steps_calculated = 0
+
+    def calculate(self, point: Point, function_value: FunctionValue) -> FunctionValue:
+        value = super().calculate(point, function_value).value
+        shift = 0.1 * np.sin(np.sum(point.float_variables))
+        scores = []
+        for step in range(self.number_of_steps):
+            self.number_of_steps_calculated += 1
+            scores.append(value + shift * (-1) ** step)
+            self.report(step, float(np.mean(scores)))
+            if self.should_prune():
+                raise TrialPruned()
+        function_value.value = float(np.mean(scores))
+        return function_value
+
+
+class SteppedStronginc2(Stronginc2):
+    """Промежуточное значение критерия много меньше итогового, ограничения вычисляются сразу"""
+
+    def calculate(self, point: Point, function_value: FunctionValue) -> FunctionValue:
+        function_value = super().calculate(point, function_value)
+        if function_value.type == FunctionType.OBJECTIV and self.pruner is not None:
+            self.report(0, function_value.value - 100)
+            if self.should_prune():
+                raise TrialPruned()
+        return function_value
+
+
+class TestPruner(unittest.TestCase):
+    def test_MedianPruner(self):
+        pruner = MedianPruner(min_trials=3, warmup_steps=1)
+        for value in [1.0, 2.0, 3.0]:
+            pruner.start_trial()
+            pruner.report(0, value)
+            pruner.report(1, value)
+            pruner.complete_trial(value)
+        pruner.start_trial()
+        pruner.report(0, 10.0)
+        # до окончания разогрева испытание не останавливается
+        self.assertFalse(pruner.should_prune())
+        pruner.report(1, 2.5)
+        self.assertTrue(pruner.should_prune())
+        self.assertEqual(2.5, pruner.prune_trial())
+        self.assertEqual(1, pruner.pruned_trials_count)
+
+        pruner.start_trial()
+        pruner.report(1, 1.5)
+        self.assertFalse(pruner.should_prune())
+
+    def test_BoundPruner(self):
+        pruner = BoundPruner(min_trials=2, warmup_steps=0)
+        # промежуточные значения превышают итоговые не более чем на 1
+        for intermediate, final in [(2.0, 1.0), (3.5, 3.0)]:
+            pruner.start_trial()
+            pruner.report(0, intermediate)
+            pruner.complete_trial(final)
+        pruner.start_trial()
+        pruner.report(0, 1.9)
+        self.assertFalse(pruner.should_prune())
+        pruner.report(0, 2.1)
+        self.assertTrue(pruner.should_prune())
+
+    def test_ReportWithoutPruner(self):
+        problem = SteppedRastrigin(2)
+        problem.report(0, 1.0)
+        self.assertFalse(problem.should_prune())
+
+    def test_Solve(self):
+        problem = SteppedRastrigin(2)
+        parameters = SolverParameters(r=3.5, eps=0.01, pruner='median')
+        solver = Solver(problem, parameters=parameters)
+        sol = solver.solve()
+        self.assertIsInstance(solver.calculator.evaluate_method, PruningMethodEvaluate)
+
+        trials = [item for item in solver.search_data if item.get_index() >= 0]
+        pruned = [item for item in trials if item.approximate]
+        self.assertEqual(len(pruned), solver.task.pruner.pruned_trials_count)
+        self.assertGreater(len(pruned), len(trials) / 2)
+        self.assertLess(problem.number_of_steps_calculated, problem.number_of_steps * len(trials))
+        # испытание хранит последнее промежуточное значение
+        for item in pruned:
+            self.assertEqual(0, item.get_index())
+            self.assertEqual(item.get_z(), item.function_values[0].value)
+
+        self.assertFalse(sol.best_trials[0].approximate)
+        self.assertAlmostEqual(0.0, sol.best_trials[0].function_values[0].value, delta=0.1)
+
+    def test_Bound(self):
+        problem = SteppedRastrigin(2)
+        solver = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01, pruner='bound'))
+        sol = solver.solve()
+        self.assertGreater(solver.task.pruner.pruned_trials_count, 0)
+        self.assertLess(problem.number_of_steps_calculated, problem.number_of_steps * sol.number_of_global_trials)
+        self.assertAlmostEqual(0.0, sol.best_trials[0].function_values[0].value, delta=0.1)
+
+    def test_SolveConstrained(self):
+        problem = SteppedStronginc2()
+        parameters = SolverParameters(r=3.5, eps=0.01, iters_limit=300, pruner='median', pruning_min_trials=3,
+                                      pruning_warmup_steps=0)
+        solver = Solver(problem, parameters=parameters)
+        sol = solver.solve()
+        self.assertGreater(solver.task.pruner.pruned_trials_count, 0)
+        # промежуточное значение остановленного испытания не становится оценкой оптимума
+        best = solver.method.best
+        self.assertFalse(best.approximate)
+        self.assertEqual(problem.number_of_constraints, best.get_index())
+        self.assertGreaterEqual(best.get_z(), problem.known_optimum[0].function_values[0].value - 1e-6)
+        self.assertFalse(sol.best_trials[0].approximate)
+
+    def test_WrongPruner(self):
+        with self.assertRaises(Exception):
+            Solver(SteppedRastrigin(2), parameters=SolverParameters(pruner='mean'))
+        with self.assertRaises(Exception):
+            Solver(SteppedRastrigin(2), parameters=SolverParameters(pruner='median', number_of_parallel_points=2))
+
+    def test_PrunerIsNotSharedByProblem(self):
+        problem = SteppedRastrigin(2)
+        solver = Solver(problem, parameters=SolverParameters(pruner='median', iters_limit=30))
+        self.assertIsInstance(solver.task.pruner, MedianPruner)
+        self.assertIsNone(Solver(problem, parameters=SolverParameters()).task.pruner)
+        solver.solve()
+        # pruner задается задаче только на время вычисления критерия
+        self.assertIsNone(problem.pruner)
+        self.assertGreater(len(solver.task.pruner.trials), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -103,6 +103,30 @@ class TestCharacteristicsQueue(unittest.TestCase):
         self.assertEqual(getDataItem.globalR, 5.0)
         self.assertEqual(getDataItem.get_y(), ([-0.6, 0.7], ["e", "f"]))
 
+    def test_InsertItemsKeepsSequentialOrder(self):
+        data_items = [SearchDataItem(([0.1 * i], []), 0.1 * i, None, 0) for i in range(8)]
+        priorities = [3.0, 1.0, 3.0, 5.0, 1.0, 3.0, 0.5, 5.0]
+        queue = CharacteristicsQueue(maxlen=None)
+        bulk_queue = CharacteristicsQueue(maxlen=None)
+        for priority, data_item in zip(priorities[:3], data_items[:3]):
+            queue.insert(priority, data_item)
+            bulk_queue.insert(priority, data_item)
+        for priority, data_item in zip(priorities[3:], data_items[3:]):
+            queue.insert(priority, data_item)
+        bulk_queue.insert_items(list(zip(priorities[3:], data_items[3:])))
+
+        self.assertEqual(queue.get_len(), bulk_queue.get_len())
+        while not queue.is_empty():
+            self.assertIs(queue.get_best_item()[0], bulk_queue.get_best_item()[0])
+
+    def test_InsertItemsWithMaxLen(self):
+        data_items = [SearchDataItem(([0.1 * i], []), 0.1 * i, None, 0) for i in range(5)]
+        self.characteristicsQueueGlobalR.insert_items(list(zip([1.0, 4.0, 2.0, 4.0, 3.0], data_items)))
+
+        self.assertEqual(3, self.characteristicsQueueGlobalR.get_len())
+        self.assertEqual([data_items[1], data_items[3], data_items[4]],
+                         [self.characteristicsQueueGlobalR.get_best_item()[0] for _ in range(3)])
+
     def test_CanGetBestItmeWithEqualGlobalR(self):
         data_item1 = SearchDataItem(([-0.6, 0.7], ["a", "f"]), 0.05, None, 2)
         data_item1.globalR = 5.0
@@ -642,6 +666,25 @@ class TestSearchDataDualQueue(unittest.TestCase):
         self.assertEqual(get_data_item_local.localR, 0.5)
 
 
+    def test_RefillQueueSkipsBlocked(self):
+        data_item1 = SearchDataItem(([-0.6, 0.7], ["a", "f"]), 0.0, None, 2)
+
+        data_item2 = SearchDataItem(([-0.3, 0.78], ["e", "f"]), 1.0, None, 1)
+        data_item2.globalR = 1.0
+        data_item2.localR = 1.0
+
+        data_item3 = SearchDataItem(([1.4, 3.7], ["a", "f"]), 0.5, None, 1)
+        data_item3.globalR = 2.6
+        data_item3.localR = 2.6
+        data_item3.blocked = True
+
+        self.search_dataDual.insert_first_data_item(data_item1, data_item2)
+        self.search_dataDual.insert_data_item(data_item3, data_item2)
+        self.search_dataDual.refill_queue()
+
+        self.assertEqual(self.search_dataDual.get_data_item_with_max_global_r().get_x(), 1.0)
+        self.assertEqual(self.search_dataDual.get_data_item_with_max_local_r().get_x(), 1.0)
+
 # Executing the tests in the above test case class
 
 
@@ -0,0 +1,84 @@
+import unittest
+
+from iOpt.method.stop_criteria import StopCriterion
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from problems.mco_test1 import mco_test1
+from problems.rastrigin import Rastrigin
+from problems.stronginc2 import Stronginc2
+from problems.xsquared import XSquared
+from test.iOpt.method.slow_problem import SlowProblem
+
+
+class TestStopCriteria(unittest.TestCase):
+    def test_DefaultReasons(self):
+        sol = Solver(Rastrigin(1), parameters=SolverParameters(r=3.5, eps=0.01)).solve()
+        self.assertEqual('accuracy', sol.stop_reason)
+        sol = Solver(Rastrigin(1), parameters=SolverParameters(r=3.5, eps=1e-12, iters_limit=50)).solve()
+        self.assertEqual('iterations', sol.stop_reason)
+
+    def test_Stagnation(self):
+        params = SolverParameters(r=3.5, eps=1e-12, iters_limit=5000, stagnation_iterations=100)
+        solver = Solver(Rastrigin(2), parameters=params)
+        sol = solver.solve()
+        self.assertEqual('stagnation', sol.stop_reason)
+        self.assertLess(solver.method.iterations_count, 5000)
+        # лучшая точка найдена ровно за stagnation_iterations итераций до остановки
+        self.assertEqual(solver.method.iterations_count - 100, sol.best_trials[0].iterationNumber + 1)
+
+    def test_TargetValue(self):
+        params = SolverParameters(r=3.5, eps=1e-12, iters_limit=5000, target_value=0.1)
+        sol = Solver(Rastrigin(2), parameters=params).solve()
+        self.assertEqual('target_value', sol.stop_reason)
+        self.assertLessEqual(sol.best_trials[0].function_values[0].value, 0.1)
+
+    def test_RelativeAccuracy(self):
+        params = SolverParameters(r=3.5, eps=1e-12, iters_limit=5000, relative_accuracy=0.05)
+        sol = Solver(Rastrigin(2), parameters=params).solve()
+        self.assertEqual('relative_accuracy', sol.stop_reason)
+        self.assertLessEqual(sol.best_trials[0].function_values[0].value, 0.05)
+
+        with self.assertRaises(Exception):
+            problem = Rastrigin(2)
+            problem.known_optimum = []
+            Solver(problem, parameters=params)
+
+    def test_EvaluationTime(self):
+        params = SolverParameters(r=3.5, eps=1e-12, iters_limit=1000, evaluation_time_limit=0.2)
+        sol = Solver(SlowProblem(XSquared(1), 0.01, busy=True), parameters=params).solve()
+        self.assertEqual('evaluation_time', sol.stop_reason)
+        self.assertGreaterEqual(sol.evaluation_time, 0.2)
+        self.assertLess(sol.number_of_global_trials, 40)
+
+    def test_EvaluationTimeConstrained(self):
+        params = SolverParameters(r=3.5, eps=1e-12, iters_limit=300, evaluation_time_limit=0.05)
+        sol = Solver(SlowProblem(Stronginc2(), 0.002, busy=True), parameters=params).solve()
+        self.assertEqual('evaluation_time', sol.stop_reason)
+        self.assertGreaterEqual(sol.evaluation_time, 0.05)
+        self.assertLess(sol.number_of_global_trials, 100)
+
+    def test_EvaluationTimeMCO(self):
+        params = SolverParameters(r=3.5, eps=1e-12, iters_limit=300, number_of_lambdas=3, evaluation_time_limit=0.05)
+        solver = Solver(SlowProblem(mco_test1(), 0.002, busy=True), parameters=params)
+        sol = solver.solve()
+        self.assertEqual('evaluation_time', sol.stop_reason)
+        self.assertGreaterEqual(sol.evaluation_time, 0.05)
+        # общий бюджет времени не переключает свертки
+        self.assertEqual(0, solver.method.current_num_lambda)
+
+    def test_AddStopCriterion(self):
+        class IterationsCriterion(StopCriterion):
+            name = 'custom'
+
+            def is_met(self, method) -> bool:
+                return method.iterations_count >= 30
+
+        solver = Solver(Rastrigin(2), parameters=SolverParameters(r=3.5, eps=1e-12, stagnation_iterations=1000))
+        solver.add_stop_criterion(IterationsCriterion())
+        sol = solver.solve()
+        self.assertEqual('custom', sol.stop_reason)
+        self.assertEqual(30, solver.method.iterations_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from iOpt.method.surrogate import SurrogateScreening
+from iOpt.solver import Solver
+from iOpt.solver_parametrs import SolverParameters
+from problems.rastrigin import Rastrigin
+from problems.stronginc2 import Stronginc2
+
+
+class TestSurrogateScreening(unittest.TestCase):
+    def setUp(self):
+        self.surrogate = SurrogateScreening(dimension=2, kappa=3.0)
+        self.rng = np.random.default_rng(0)
+
+    @staticmethod
+    def paraboloid(y) -> float:
+        return float(np.sum(np.square(y)))
+
+    def add_trials(self, number: int) -> None:
+        for y in self.rng.uniform(-1, 1, size=(number, 2)):
+            self.surrogate.add_trial(y, self.paraboloid(y), self.surrogate.predict(y))
+
+    def test_NoPredictionWithFewTrials(self):
+        self.add_trials(self.surrogate.min_trials - 1)
+        self.assertIsNone(self.surrogate.predict([0.0, 0.0]))
+        self.assertFalse(self.surrogate.is_unpromising(None, 0.0))
+
+    def test_PredictsSmoothFunction(self):
+        self.add_trials(60)
+        self.assertAlmostEqual(self.paraboloid([0.5, -0.5]), self.surrogate.predict([0.5, -0.5]), delta=0.05)
+        self.assertIsNotNone(self.surrogate.get_error())
+
+    def test_IsUnpromising(self):
+        self.add_trials(60)
+        error = self.surrogate.get_error()
+        self.assertTrue(self.surrogate.is_unpromising(0.5 + 3.0 * error + 1e-6, 0.5))
+        self.assertFalse(self.surrogate.is_unpromising(0.5 + 3.0 * error - 1e-6, 0.5))
+
+    def test_ErrorWindow(self):
+        self.add_trials(self.surrogate.min_trials)
+        for _ in range(50):
+            self.surrogate.add_trial([0.0, 0.0], 0.0, 1.0)
+        self.assertEqual(self.surrogate.window, len(self.surrogate.residuals))
+        self.assertAlmostEqual(1.0, self.surrogate.get_error())
+
+
+class TestSolveSurrogateScreening(unittest.TestCase):
+    def test_solve(self):
+        problem = Rastrigin(2)
+        solver = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01, surrogate_screening=True))
+        sol = solver.solve()
+        cold = Solver(problem, parameters=SolverParameters(r=3.5, eps=0.01)).solve()
+
+        method = solver.method
+        self.assertGreater(method.screened_trials_count, 0)
+        number_of_trials = sol.number_of_global_trials - method.screened_trials_count + method.reevaluated_trials_count
+        self.assertLess(number_of_trials, cold.number_of_global_trials)
+        self.assertFalse(sol.best_trials[0].approximate)
+        # приближенные значения не ниже лучшего найденного
+        approximate = [item.get_z() for item in solver.search_data if item.approximate]
+        self.assertEqual(method.screened_trials_count - method.reevaluated_trials_count, len(approximate))
+        self.assertTrue(all(z > sol.best_trials[0].get_z() for z in approximate))
+        np.testing.assert_allclose(sol.best_trials[0].point.float_variables,
+                                   problem.known_optimum[0].point.float_variables, atol=0.05)
+
+    def test_ConstraintsThrow(self):
+        with self.assertRaises(Exception):
+            Solver(Stronginc2(), parameters=SolverParameters(surrogate_screening=True))
+
+
+if __name__ == '__main__':
+    unittest.main()